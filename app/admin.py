@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.utils.html import format_html
+from django.utils.html import format_html, format_html_join
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django.db.models import Count, Q
@@ -9,9 +9,11 @@ from unfold.admin import ModelAdmin, TabularInline
 from unfold.contrib.filters.admin import RangeDateFilter, RangeNumericFilter, ChoicesDropdownFilter
 from unfold.decorators import display, action
 from django_summernote.admin import SummernoteModelAdmin
+from . import archive, rollups
 from .models import (
     ProductCategory, Product, ProductStatus, 
-    BlogPost, BlogCategory, PriceList, ContactFormSubmission, PageSEO, Enquiry
+    BlogPost, BlogCategory, PriceList, ContactFormSubmission, PageSEO, Enquiry,
+    ArchivedRecord
 )
 
 # Custom admin filters
@@ -75,7 +77,7 @@ class ProductAdmin(ModelAdmin):
         ('status', ChoicesDropdownFilter),
         ('created_at', RangeDateFilter)
     ]
-    search_fields = ['name', 'description']
+    search_fields = ['name', 'sku', 'description']
     prepopulated_fields = {'slug': ('name',)}
     
     @display(description="Status")
@@ -329,12 +331,12 @@ class ContactFormSubmissionAdmin(ModelAdmin):
     
     @action(description="Mark as responded")
     def mark_responded(self, request, queryset):
-        updated = queryset.update(is_responded=True)
+        updated = rollups.update_queryset(queryset, is_responded=True)
         self.message_user(request, f'{updated} contact submissions marked as responded.')
     
     @action(description="Mark as pending")
     def mark_pending(self, request, queryset):
-        updated = queryset.update(is_responded=False)
+        updated = rollups.update_queryset(queryset, is_responded=False)
         self.message_user(request, f'{updated} contact submissions marked as pending.')
     
     actions = ['mark_responded', 'mark_pending']
@@ -365,20 +367,21 @@ class ContactFormSubmissionAdmin(ModelAdmin):
 
 @admin.register(Enquiry)
 class EnquiryAdmin(ModelAdmin):
-    list_display = ['sku_display', 'name', 'email', 'phone', 'subject', 'submitted_date', 'response_status', 'priority_badge']
+    list_display = ['sku_display', 'product', 'name', 'email', 'phone', 'subject', 'submitted_date', 'response_status', 'priority_badge']
+    list_select_related = ['product']
     list_filter = [
         ResponseStatusFilter,
         SKUFilter,
         ('submitted_date', RangeDateFilter),
     ]
     search_fields = ['sku', 'name', 'email', 'phone', 'subject', 'message']
-    readonly_fields = ['sku', 'name', 'email', 'phone', 'subject', 'message', 'ip_address', 'submitted_date']
+    readonly_fields = ['sku', 'product', 'name', 'email', 'phone', 'subject', 'message', 'ip_address', 'submitted_date']
     list_per_page = 20
     date_hierarchy = 'submitted_date'
     
     fieldsets = (
         ('Enquiry Information', {
-            'fields': ('sku', 'name', 'email', 'phone', 'subject', 'message'),
+            'fields': ('sku', 'product', 'name', 'email', 'phone', 'subject', 'message'),
             'classes': ('unfold-fieldset',)
         }),
         ('Response Status', {
@@ -434,12 +437,12 @@ class EnquiryAdmin(ModelAdmin):
     
     @action(description="Mark as responded")
     def mark_responded(self, request, queryset):
-        updated = queryset.update(is_responded=True)
+        updated = rollups.update_queryset(queryset, is_responded=True)
         self.message_user(request, f'{updated} enquiries marked as responded.')
     
     @action(description="Mark as pending")
     def mark_pending(self, request, queryset):
-        updated = queryset.update(is_responded=False)
+        updated = rollups.update_queryset(queryset, is_responded=False)
         self.message_user(request, f'{updated} enquiries marked as pending.')
     
     @action(description="Export selected enquiries")
@@ -494,10 +497,54 @@ class EnquiryAdmin(ModelAdmin):
         return super().changelist_view(request, extra_context=extra_context)
 
 
+@admin.register(ArchivedRecord)
+class ArchivedRecordAdmin(ModelAdmin):
+    """Search page over archived enquiries and contact submissions (see app/archive.py)."""
+    list_display = ['name', 'email', 'subject', 'source_badge', 'sku', 'submitted_date', 'archived_at']
+    list_filter = [
+        'source',
+        ('submitted_date', RangeDateFilter),
+    ]
+    search_fields = ['email', 'name', 'subject', 'sku']
+    list_per_page = 50
+    show_full_result_count = False
+    fields = ['source', 'original_id', 'submitted_date', 'partition', 'archived_data']
+    readonly_fields = fields
+    
+    @display(description="Inbox")
+    def source_badge(self, obj):
+        return format_html(
+            '<span class="inline-flex items-center px-2.5 py-0.5 rounded-full text-xs font-medium bg-gray-100 text-gray-800">{}</span>',
+            obj.source.title()
+        )
+    
+    @display(description="Archived data")
+    def archived_data(self, obj):
+        try:
+            record = archive.load(obj)
+        except (OSError, ValueError, IndexError):
+            return format_html('<span class="text-red-600">Partition {} is missing or unreadable.</span>', obj.partition)
+        rows = format_html_join(
+            '', '<tr><th class="pr-4 py-1 text-left align-top">{}</th><td class="py-1 whitespace-pre-wrap">{}</td></tr>',
+            ((key, '' if value is None else value) for key, value in record.items())
+        )
+        return format_html('<table>{}</table>', rows)
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 # Customize Admin Site
 admin.site.site_header = "starbliss Pharmaceuticals Admin"
 admin.site.site_title = "starbliss Admin"
 admin.site.index_title = "Welcome to starbliss Pharmaceuticals Administration"
+admin.site.index_template = "admin/dashboard.html"  # analytics from app/dashboard.py
 
 # Custom admin site configuration for better organization
 from django.contrib.admin import AdminSite
@@ -0,0 +1,130 @@
+"""
+Archival of old inbox rows into compressed monthly partitions.
+
+Responded enquiries and contact submissions older than
+``INBOX_ARCHIVE_AFTER_DAYS`` (and already counted by the daily rollups) are
+written to ``ARCHIVE_ROOT/<source>/<YYYY-MM>.jsonl.gz`` and removed from
+their table, so the admin changelists, filters and searches only ever scan
+recent rows. Each archival batch appends one gzip member to the month's file
+(a concatenation of gzip members is itself a valid gzip file, so ``zcat``
+reads a partition whole); ``ArchivedRecord`` keeps the searchable columns
+plus the member offset, so loading one record decompresses one member rather
+than the whole month.
+
+The partition is written and fsynced before the rows are deleted, in the
+same order for every batch: a crash can leave an unreferenced member in a
+partition, never a row that exists nowhere.
+"""
+import gzip
+import json
+import os
+import zlib
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from . import rollups
+from .models import ArchivedRecord, JobCheckpoint
+
+BATCH_SIZE = 2000
+
+
+def get_root():
+    return Path(settings.ARCHIVE_ROOT)
+
+
+def _row_to_dict(instance):
+    return {field.attname: field.value_from_object(instance) for field in instance._meta.concrete_fields}
+
+
+def _month(value):
+    local = timezone.localtime(value) if settings.USE_TZ else value
+    return local.strftime('%Y-%m')
+
+
+def eligible(source, older_than_days=None):
+    """Rows of ``source`` that may be archived now."""
+    if older_than_days is None:
+        older_than_days = settings.INBOX_ARCHIVE_AFTER_DAYS
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    # Rows the rollups haven't counted yet stay until they have, so the
+    # dashboard figures don't change when history is archived.
+    rolled_up_to = JobCheckpoint.objects.filter(name=source.checkpoint).values_list('last_id', flat=True).first() or 0
+    return source.model.objects.filter(is_responded=True, submitted_date__lt=cutoff, id__lte=rolled_up_to)
+
+
+def _append_member(path, records):
+    """Append ``records`` as one gzip member to ``path``. Returns the member's start offset."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = ''.join(json.dumps(record, cls=DjangoJSONEncoder, separators=(',', ':')) + '\n' for record in records)
+    with open(path, 'ab') as handle:
+        offset = handle.tell()
+        handle.write(gzip.compress(payload.encode('utf-8')))
+        handle.flush()
+        os.fsync(handle.fileno())
+    return offset
+
+
+def archive_batch(source, instances, root=None):
+    """Write ``instances`` to their monthly partitions, index them and delete them."""
+    root = Path(root or get_root())
+    by_month = {}
+    for instance in instances:
+        by_month.setdefault(_month(instance.submitted_date), []).append(instance)
+
+    index = []
+    for month, rows in sorted(by_month.items()):
+        partition = f'{source.name}/{month}.jsonl.gz'
+        offset = _append_member(root / partition, [_row_to_dict(row) for row in rows])
+        for line, row in enumerate(rows):
+            index.append(ArchivedRecord(
+                source=source.name,
+                original_id=row.pk,
+                submitted_date=row.submitted_date,
+                is_responded=row.is_responded,
+                name=row.name,
+                email=row.email,
+                subject=row.subject,
+                sku=getattr(row, 'sku', None) or '',
+                product_id=getattr(row, 'product_id', None),
+                partition=partition,
+                offset=offset,
+                line=line,
+            ))
+
+    with transaction.atomic(), rollups.archiving():
+        ArchivedRecord.objects.bulk_create(index, batch_size=1000)
+        source.model.objects.filter(pk__in=[row.pk for row in instances]).delete()
+    return len(index)
+
+
+def archive(source, older_than_days=None, batch_size=BATCH_SIZE, limit=None, root=None):
+    """Archive every eligible row of ``source``. Returns the number of rows archived."""
+    archived = 0
+    while limit is None or archived < limit:
+        size = batch_size if limit is None else min(batch_size, limit - archived)
+        batch = list(eligible(source, older_than_days).order_by('submitted_date', 'id')[:size])
+        if not batch:
+            break
+        archived += archive_batch(source, batch, root)
+    return archived
+
+
+def load(record, root=None):
+    """The full archived row of an ``ArchivedRecord`` as a dict."""
+    path = Path(root or get_root()) / record.partition
+    with open(path, 'rb') as handle:
+        handle.seek(record.offset)
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)  # one gzip member
+        data = b''
+        while not decompressor.eof:
+            chunk = handle.read(64 * 1024)
+            if not chunk:
+                break
+            data += decompressor.decompress(chunk)
+    lines = data.decode('utf-8').splitlines()
+    return json.loads(lines[record.line])
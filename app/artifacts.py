@@ -0,0 +1,188 @@
+"""
+Pre-serialized API payloads.
+
+The unfiltered list APIs return the same bytes until something is saved, so
+their bodies are written once per content version to
+``ARTIFACTS_ROOT/<name>/<version>.json`` (plus ``.gz`` and ``.br``), where
+the version is made of the generation counters the payload depends on.
+Serving one is a couple of cache reads for the generations, a ``stat`` and a
+``FileResponse``: no ORM, no serialization. Saves bump the generations, and
+the signal handlers queue a republish of the affected artifacts; a request
+that finds its version missing publishes it inline.
+"""
+import functools
+import gzip
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+
+from . import compression, generations, serializers
+from .catalog import get_snapshot
+from .debounce import Debouncer
+from .models import BlogCategory, BlogPost
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Versions kept per artifact, so responses already streaming an older file
+# (and clients revalidating it) aren't cut off by a publish.
+KEEP_VERSIONS = 3
+CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+
+
+def _categories():
+    return serializers.CATEGORIES.from_objects(get_snapshot().categories, tuple(serializers.CATEGORIES.fields))
+
+
+def _products():
+    return serializers.PRODUCTS.from_objects(get_snapshot().products, tuple(serializers.PRODUCTS.fields))
+
+
+def _blog_posts():
+    posts = BlogPost.objects.filter(status='published').order_by('-published_date')
+    return serializers.BLOG_POSTS.from_queryset(posts, tuple(serializers.BLOG_POSTS.fields))
+
+
+def _blog_categories():
+    categories = BlogCategory.objects.all()
+    return serializers.CATEGORIES.from_queryset(categories, tuple(serializers.CATEGORIES.fields))
+
+
+class Artifact:
+    def __init__(self, name, versions, items):
+        self.name = name
+        self.versions = versions
+        self.items = items
+
+    def version(self):
+        return '-'.join(str(number) for number in generations.get_generations(*self.versions))
+
+    def path(self, version, root=None):
+        return Path(root or get_root()) / self.name / f'{version}.json'
+
+
+ARTIFACTS = {
+    artifact.name: artifact for artifact in (
+        Artifact('categories', (generations.CATALOG,), _categories),
+        Artifact('products', (generations.CATALOG,), _products),
+        Artifact('blog-posts', (generations.BLOG,), _blog_posts),
+        Artifact('blog-categories', (generations.BLOG,), _blog_categories),
+    )
+}
+
+
+def get_root():
+    return Path(settings.ARTIFACTS_ROOT)
+
+
+def _write_atomic(path, content):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            handle.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _prune(directory, keep):
+    versions = sorted(directory.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in versions[keep:]:
+        for suffix in ('', '.gz', '.br'):
+            Path(str(old) + suffix).unlink(missing_ok=True)
+
+
+def publish(artifact, root=None, keep=KEEP_VERSIONS):
+    """Write the current version of ``artifact`` (if missing). Returns its path."""
+    # Read the version before the data: a save in between makes the file
+    # newer than its name says, never older.
+    version = artifact.version()
+    target = artifact.path(version, root)
+    if target.exists():
+        return target
+    target.parent.mkdir(parents=True, exist_ok=True)
+    content = b''.join(serializers.encode_chunks(artifact.items()))
+    # Variants first: a visible .json promises its siblings are complete.
+    _write_atomic(target.with_name(target.name + '.gz'), gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_atomic(target.with_name(target.name + '.br'), brotli.compress(content, mode=brotli.MODE_TEXT))
+    _write_atomic(target, content)
+    _prune(target.parent, keep)
+    return target
+
+
+def publish_all(names=None, root=None):
+    return [publish(ARTIFACTS[name], root) for name in (names or ARTIFACTS)]
+
+
+publish_queue = Debouncer(lambda names: publish_all(sorted(names)), delay=2.0, name='artifacts')
+
+
+def schedule_for_generations(names):
+    """Queue a republish of the artifacts derived from the generation counters ``names``."""
+    affected = [artifact.name for artifact in ARTIFACTS.values() if set(artifact.versions) & set(names)]
+    if affected:
+        publish_queue.add(*affected)
+
+
+def serve(request, name):
+    """Serve the current version of artifact ``name`` in the best encoding ``request`` accepts."""
+    artifact = ARTIFACTS[name]
+    version = artifact.version()
+    path = artifact.path(version)
+    if not path.exists():
+        path = publish(artifact)
+        version = path.stem
+
+    coding = None
+    accepted = compression.accepted_encodings(request)
+    for candidate, suffix in (('br', '.br'), ('gzip', '.gz')):
+        variant = path.with_name(path.name + suffix)
+        if candidate in accepted and variant.exists():
+            path, coding = variant, candidate
+            break
+
+    # Strong: the bytes of a given version and encoding never change.
+    etag = f'"{name}-{version}{"-" + coding if coding else ""}"'
+    conditional = get_conditional_response(request, etag=etag)
+    if conditional is not None:
+        conditional['ETag'] = etag
+        patch_vary_headers(conditional, ('Accept-Encoding',))
+        return conditional
+
+    response = FileResponse(open(path, 'rb'), content_type='application/json')
+    if coding:
+        response['Content-Encoding'] = coding
+    response['ETag'] = etag
+    response['Cache-Control'] = CACHE_CONTROL
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def serve_artifact(name):
+    """
+    View decorator: requests without a query string get artifact ``name``;
+    the others (``?fields=`` ...) run the view. The view is also the
+    fallback when the artifact can't be read or written.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method in ('GET', 'HEAD') and not request.META.get('QUERY_STRING'):
+                try:
+                    return serve(request, name)
+                except OSError:
+                    logger.exception('Serving artifact %s failed', name)
+            return view(request, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,81 @@
+"""
+Optimization of Summernote editor uploads.
+
+Editors paste phone photos of several megabytes into posts and product
+content. Every new attachment is capped at ``imaging.MAX_WIDTH`` and
+re-encoded in place (same name, so the URL already inserted in the editor
+keeps working), and its ``srcset`` derivatives are made up front. Small
+uploads are processed right after the upload commits; bigger ones are
+queued for a background thread so the editor isn't kept waiting.
+``manage.py optimize_attachments`` backfills the uploads made before.
+"""
+import logging
+
+from django_summernote.utils import get_attachment_model
+
+from . import imaging
+from .debounce import Debouncer
+from .models import ImageDerivative
+
+logger = logging.getLogger(__name__)
+
+# Uploads larger than this are processed in the background
+BACKGROUND_BYTES = 512 * 1024
+
+
+class Result:
+    __slots__ = ('name', 'before', 'after', 'derivative_bytes')
+
+    def __init__(self, name, before, after, derivative_bytes):
+        self.name = name
+        self.before = before
+        self.after = after
+        self.derivative_bytes = derivative_bytes
+
+    @property
+    def saved(self):
+        return self.before - self.after
+
+
+def is_processed(name):
+    return ImageDerivative.objects.filter(source=name, name=name).exists()
+
+
+def process(file, force=False):
+    """
+    Optimize an uploaded file (a ``FieldFile``) and make its derivatives.
+    Returns a ``Result``, or ``None`` for files that aren't images (or were
+    processed before, unless ``force``: re-encoding again loses quality).
+    """
+    if not force and is_processed(file.name):
+        return None
+    sizes = imaging.optimize(file.name, file.storage)
+    if sizes is None:
+        return None
+    variants = imaging.derivatives(file.name, file.storage)
+    derivative_bytes = sum(
+        ImageDerivative.objects.filter(name__in=[name for name, _ in variants]).values_list('size', flat=True)
+    )
+    return Result(file.name, *sizes, derivative_bytes)
+
+
+def process_attachments(pks):
+    for attachment in get_attachment_model().objects.filter(pk__in=pks):
+        result = process(attachment.file)
+        if result is not None:
+            logger.info('Optimized %s: %d -> %d bytes', result.name, result.before, result.after)
+
+
+process_queue = Debouncer(process_attachments, delay=1.0, name='attachments')
+
+
+def schedule(attachment):
+    """Process a new upload: inline when small, in the background otherwise."""
+    try:
+        size = attachment.file.size
+    except OSError:
+        return
+    if size > BACKGROUND_BYTES:
+        process_queue.add(attachment.pk)
+    else:
+        process_attachments([attachment.pk])
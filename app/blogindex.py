@@ -0,0 +1,111 @@
+"""
+Listing queries of the blog index and blog category pages.
+
+Pages are keyset-paginated over ``(published_date, id)``: a page link
+carries the position of the last (or first) post shown and the next page is
+one indexed range query for ``PAGE_SIZE + 1`` rows, however deep it is. The
+featured posts and the category chips with their post counts (one GROUP BY)
+only change when a post is saved, so they are cached under the ``blog``
+generation. A listing page therefore costs one query on top of the cached
+parts, whatever the number of posts.
+"""
+from datetime import datetime, timedelta, timezone
+
+from django.db.models import Count, Q
+
+from . import generations
+from .caching import get_or_recompute
+from .models import BlogCategory, BlogPost
+
+PAGE_SIZE = 12
+FEATURED_COUNT = 2
+LISTING_FIELDS = (
+    'id', 'title', 'slug', 'excerpt', 'author', 'published_date',
+    'is_featured', 'featured_image', 'category__name', 'category__slug',
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(post):
+    """``<microseconds since the epoch>.<id>`` of ``post``: exact and URL-safe."""
+    delta = post.published_date - _EPOCH
+    return f'{(delta.days * 86400 + delta.seconds) * 10 ** 6 + delta.microseconds}.{post.id}'
+
+
+def decode_cursor(value):
+    try:
+        micros, id = value.split('.')
+        return _EPOCH + timedelta(microseconds=int(micros)), int(id)
+    except (ValueError, OverflowError) as e:
+        raise InvalidCursor(f'Invalid page cursor: {value!r}') from e
+
+
+def published_posts():
+    return BlogPost.objects.filter(status='published').select_related('category').only(*LISTING_FIELDS)
+
+
+class Page:
+    """One page of posts, newest first, with cursors of the pages around it."""
+
+    def __init__(self, posts, newer=None, older=None):
+        self.posts = posts
+        self.newer = newer
+        self.older = older
+
+
+def get_page(queryset, before=None, after=None, size=PAGE_SIZE):
+    """
+    The ``size`` posts of ``queryset`` older than cursor ``before`` (newer
+    than ``after``; the newest without either). Raises ``InvalidCursor``.
+    """
+    if after:
+        published_date, id = decode_cursor(after)
+        rows = list(
+            queryset.filter(Q(published_date__gt=published_date) | Q(published_date=published_date, id__gt=id))
+            .order_by('published_date', 'id')[:size + 1]
+        )
+        # Walked oldest first from the cursor: flip back to newest first.
+        posts = rows[:size][::-1]
+        has_newer, has_older = len(rows) > size, True
+    else:
+        if before:
+            published_date, id = decode_cursor(before)
+            queryset = queryset.filter(
+                Q(published_date__lt=published_date) | Q(published_date=published_date, id__lt=id)
+            )
+        rows = list(queryset.order_by('-published_date', '-id')[:size + 1])
+        posts = rows[:size]
+        has_newer, has_older = bool(before), len(rows) > size
+
+    return Page(
+        posts,
+        newer=encode_cursor(posts[0]) if posts and has_newer else None,
+        older=encode_cursor(posts[-1]) if posts and has_older else None,
+    )
+
+
+def featured_posts():
+    """The newest featured posts (cached until a post is saved)."""
+    return get_or_recompute(
+        'blog:featured',
+        lambda: list(published_posts().filter(is_featured=True).order_by('-published_date', '-id')[:FEATURED_COUNT]),
+        versions=(generations.BLOG,),
+    )
+
+
+def categories_with_counts():
+    """Blog categories annotated with ``post_count``, their published posts (cached)."""
+    return get_or_recompute(
+        'blog:categories',
+        lambda: list(
+            BlogCategory.objects.only('id', 'name', 'slug')
+            .annotate(post_count=Count('posts', filter=Q(posts__status='published')))
+            .order_by('name')
+        ),
+        versions=(generations.BLOG,),
+    )
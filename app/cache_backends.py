@@ -0,0 +1,410 @@
+"""
+Two-tier cache backend: a bounded per-process LRU (L1) in front of a shared
+SQLite store (L2) that every worker on the host reads and writes.
+
+Every write to L2 takes the next value of a shared stamp counter and records
+it on the row it touched (deletes leave a tombstone row). Workers remember
+the last stamp they have seen and, at most every ``SYNC_INTERVAL_MS``, read
+the current one; if it moved they evict exactly the keys written since from
+their L1. A worker therefore sees another worker's writes after at most one
+sync interval, while most reads are answered from process memory.
+
+Configure it as::
+
+    CACHES = {
+        'default': {
+            'BACKEND': 'app.cache_backends.TwoTierCache',
+            'LOCATION': BASE_DIR / 'cache' / 'cache.sqlite3',
+            'OPTIONS': {
+                'MAX_ENTRIES': 50000,         # L2 rows before culling
+                'L1_MAX_ENTRIES': 2000,
+                'L1_MAX_BYTES': 32 * 1024 * 1024,
+                'SYNC_INTERVAL_MS': 100,
+            },
+        },
+    }
+"""
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        value BLOB,
+        expires REAL,
+        stamp INTEGER NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS cache_entries_stamp ON cache_entries (stamp)",
+    "CREATE INDEX IF NOT EXISTS cache_entries_expires ON cache_entries (expires)",
+    """CREATE TABLE IF NOT EXISTS cache_stamp (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        value INTEGER NOT NULL,
+        purged INTEGER NOT NULL
+    )""",
+    "INSERT OR IGNORE INTO cache_stamp (id, value, purged) VALUES (1, 0, 0)",
+)
+
+# Syncing more keys than this just drops the whole L1.
+MAX_SYNC_KEYS = 500
+
+
+class SQLiteStore:
+    """The shared L2: a small key/value table in a SQLite file (WAL mode)."""
+
+    def __init__(self, path, max_entries, cull_frequency):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.cull_frequency = cull_frequency
+        self._local = threading.local()
+        self._writes = 0
+
+    def connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            for statement in SCHEMA:
+                conn.execute(statement)
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _write(self, fn):
+        """Run ``fn(conn, stamp)`` in one write transaction with a fresh stamp."""
+        conn = self.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('UPDATE cache_stamp SET value = value + 1 WHERE id = 1')
+            stamp = conn.execute('SELECT value FROM cache_stamp WHERE id = 1').fetchone()[0]
+            result = fn(conn, stamp)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        self._writes += 1
+        if self.cull_frequency and self._writes % 100 == 0:
+            self.cull()
+        return stamp, result
+
+    def get(self, key, now):
+        row = self.connection().execute(
+            'SELECT value, expires FROM cache_entries WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None or row[0] is None or (row[1] is not None and row[1] <= now):
+            return None
+        return row
+
+    def set(self, key, pickled, expires):
+        def write(conn, stamp):
+            conn.execute(
+                'INSERT OR REPLACE INTO cache_entries (key, value, expires, stamp) VALUES (?, ?, ?, ?)',
+                (key, pickled, expires, stamp),
+            )
+        return self._write(write)[0]
+
+    def add(self, key, pickled, expires, now):
+        def write(conn, stamp):
+            row = conn.execute(
+                'SELECT value, expires FROM cache_entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is not None and row[0] is not None and (row[1] is None or row[1] > now):
+                return False
+            conn.execute(
+                'INSERT OR REPLACE INTO cache_entries (key, value, expires, stamp) VALUES (?, ?, ?, ?)',
+                (key, pickled, expires, stamp),
+            )
+            return True
+        return self._write(write)
+
+    def touch(self, key, expires, now):
+        def write(conn, stamp):
+            cursor = conn.execute(
+                'UPDATE cache_entries SET expires = ?, stamp = ? '
+                'WHERE key = ? AND value IS NOT NULL AND (expires IS NULL OR expires > ?)',
+                (expires, stamp, key, now),
+            )
+            return cursor.rowcount > 0
+        return self._write(write)
+
+    def incr(self, key, delta, now):
+        def write(conn, stamp):
+            row = conn.execute(
+                'SELECT value, expires FROM cache_entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None or row[0] is None or (row[1] is not None and row[1] <= now):
+                raise ValueError("Key '%s' not found" % key)
+            new_value = pickle.loads(row[0]) + delta
+            conn.execute(
+                'UPDATE cache_entries SET value = ?, stamp = ? WHERE key = ?',
+                (pickle.dumps(new_value, pickle.HIGHEST_PROTOCOL), stamp, key),
+            )
+            return new_value
+        return self._write(write)
+
+    def delete(self, key):
+        # Leave a tombstone so other workers learn about the delete.
+        def write(conn, stamp):
+            cursor = conn.execute(
+                'UPDATE cache_entries SET value = NULL, expires = NULL, stamp = ? '
+                'WHERE key = ? AND value IS NOT NULL',
+                (stamp, key),
+            )
+            return cursor.rowcount > 0
+        return self._write(write)
+
+    def clear(self):
+        def write(conn, stamp):
+            conn.execute('DELETE FROM cache_entries')
+            # Everything older than this stamp is gone: workers must drop their L1.
+            conn.execute('UPDATE cache_stamp SET purged = ? WHERE id = 1', (stamp,))
+        return self._write(write)[0]
+
+    def stamp(self):
+        return self.connection().execute(
+            'SELECT value, purged FROM cache_stamp WHERE id = 1'
+        ).fetchone()
+
+    def keys_changed_since(self, stamp, limit):
+        rows = self.connection().execute(
+            'SELECT key FROM cache_entries WHERE stamp > ? LIMIT ?', (stamp, limit + 1)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def cull(self):
+        """
+        Drop expired rows and tombstones, then trim the table to ``max_entries``.
+
+        Only rows older than the last ``MAX_SYNC_KEYS`` writes are removed, so
+        a worker that is in sync can still see every recent change; workers
+        further behind notice ``purged`` moving and drop their whole L1.
+        """
+        conn = self.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            current = conn.execute('SELECT value FROM cache_stamp WHERE id = 1').fetchone()[0]
+            horizon = current - MAX_SYNC_KEYS
+            if horizon > 0:
+                deleted = conn.execute(
+                    'DELETE FROM cache_entries WHERE stamp <= ? '
+                    'AND (value IS NULL OR (expires IS NOT NULL AND expires <= ?))',
+                    (horizon, time.time()),
+                ).rowcount
+                count = conn.execute('SELECT COUNT(*) FROM cache_entries').fetchone()[0]
+                if count > self.max_entries:
+                    deleted += conn.execute(
+                        'DELETE FROM cache_entries WHERE key IN ('
+                        'SELECT key FROM cache_entries WHERE stamp <= ? '
+                        'ORDER BY expires IS NULL, expires LIMIT ?)',
+                        (horizon, count // self.cull_frequency),
+                    ).rowcount
+                if deleted:
+                    conn.execute('UPDATE cache_stamp SET purged = MAX(purged, ?) WHERE id = 1', (horizon,))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+
+class LRUStore:
+    """The per-process L1: an LRU of pickled values bounded by count and bytes."""
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Values bigger than this would push out too much of the working set.
+        self.max_item_bytes = max(1, max_bytes // 8)
+        self.size = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, now):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        if item[0] is not None and item[0] <= now:
+            self.pop(key)
+            return None
+        self._data.move_to_end(key)
+        return item
+
+    def set(self, key, pickled, expires):
+        self.pop(key)
+        if len(pickled) > self.max_item_bytes:
+            return
+        self._data[key] = (expires, pickled)
+        self.size += len(pickled)
+        while len(self._data) > self.max_entries or self.size > self.max_bytes:
+            _, (_, evicted) = self._data.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def pop(self, key):
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.size -= len(item[1])
+
+    def clear(self):
+        self._data.clear()
+        self.size = 0
+
+
+class TwoTierCache(BaseCache):
+    pickle_protocol = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._l2 = SQLiteStore(location, self._max_entries, self._cull_frequency)
+        self._l1 = LRUStore(
+            options.get('L1_MAX_ENTRIES', 2000),
+            options.get('L1_MAX_BYTES', 32 * 1024 * 1024),
+        )
+        self._sync_interval = options.get('SYNC_INTERVAL_MS', 100) / 1000
+        self._lock = threading.RLock()
+        self._seen_stamp = None
+        self._next_sync = 0.0
+        self._stats = dict.fromkeys(
+            ('l1_hits', 'l1_misses', 'l2_hits', 'l2_misses', 'writes', 'syncs', 'invalidations', 'flushes'), 0
+        )
+
+    # -- coherence ---------------------------------------------------------
+
+    def _sync(self, now):
+        """Evict L1 keys other workers changed; checks L2 at most once per interval."""
+        if now < self._next_sync:
+            return
+        self._next_sync = now + self._sync_interval
+        stamp, purged = self._l2.stamp()
+        self._stats['syncs'] += 1
+        if stamp == self._seen_stamp:
+            return
+        if self._seen_stamp is None or purged > self._seen_stamp:
+            self._flush_l1()
+        else:
+            keys = self._l2.keys_changed_since(self._seen_stamp, MAX_SYNC_KEYS)
+            if len(keys) > MAX_SYNC_KEYS:
+                self._flush_l1()
+            else:
+                for key in keys:
+                    self._l1.pop(key)
+                self._stats['invalidations'] += len(keys)
+        self._seen_stamp = stamp
+
+    def _flush_l1(self):
+        if len(self._l1):
+            self._stats['flushes'] += 1
+        self._l1.clear()
+
+    def _wrote(self, key, stamp, pickled=None, expires=None):
+        """Mirror our own write into L1 and skip re-syncing it when nobody else wrote."""
+        if pickled is None:
+            self._l1.pop(key)
+        else:
+            self._l1.set(key, pickled, expires)
+        self._stats['writes'] += 1
+        if self._seen_stamp is not None and stamp == self._seen_stamp + 1:
+            self._seen_stamp = stamp
+
+    # -- cache API -----------------------------------------------------------
+
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        with self._lock:
+            self._sync(now)
+            item = self._l1.get(key, now)
+            if item is not None:
+                self._stats['l1_hits'] += 1
+                return pickle.loads(item[1])
+            self._stats['l1_misses'] += 1
+            row = self._l2.get(key, now)
+            if row is None:
+                self._stats['l2_misses'] += 1
+                return default
+            self._stats['l2_hits'] += 1
+            pickled, expires = row
+            self._l1.set(key, pickled, expires)
+        return pickle.loads(pickled)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        expires = self.get_backend_timeout(timeout)
+        with self._lock:
+            stamp = self._l2.set(key, pickled, expires)
+            self._wrote(key, stamp, pickled, expires)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        expires = self.get_backend_timeout(timeout)
+        with self._lock:
+            stamp, added = self._l2.add(key, pickled, expires, time.time())
+            self._wrote(key, stamp, pickled if added else None, expires)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._lock:
+            stamp, touched = self._l2.touch(key, self.get_backend_timeout(timeout), time.time())
+            self._wrote(key, stamp)
+        return touched
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._lock:
+            stamp, new_value = self._l2.incr(key, delta, time.time())
+            self._wrote(key, stamp)
+        return new_value
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._lock:
+            stamp, deleted = self._l2.delete(key)
+            self._wrote(key, stamp)
+        return deleted
+
+    def has_key(self, key, version=None):
+        return self.get(key, self._missing_key, version=version) is not self._missing_key
+
+    def clear(self):
+        with self._lock:
+            stamp = self._l2.clear()
+            self._l1.clear()
+            self._seen_stamp = stamp
+
+    def close(self, **kwargs):
+        # Connections are per thread and reused across requests on purpose.
+        pass
+
+    # -- introspection -------------------------------------------------------
+
+    def stats(self):
+        """Hit counts and ratios per tier for this process."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(l1_entries=len(self._l1), l1_bytes=self._l1.size, l1_evictions=self._l1.evictions)
+        l1_total = stats['l1_hits'] + stats['l1_misses']
+        l2_total = stats['l2_hits'] + stats['l2_misses']
+        stats['l1_hit_ratio'] = stats['l1_hits'] / l1_total if l1_total else None
+        stats['l2_hit_ratio'] = stats['l2_hits'] / l2_total if l2_total else None
+        stats['hit_ratio'] = (stats['l1_hits'] + stats['l2_hits']) / l1_total if l1_total else None
+        return stats
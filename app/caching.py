@@ -0,0 +1,179 @@
+"""
+Stampede-safe caching helpers.
+
+``get_or_recompute`` wraps a cache lookup so that when a value expires (or
+the generation counters it depends on move) only one worker recomputes it:
+the first caller takes a short lock key with ``cache.add`` and recomputes,
+while everyone else keeps getting the previous value (stale-while-revalidate)
+or, when there is no previous value, waits briefly for the leader's result.
+Values are also refreshed slightly before they expire with a probability
+that grows as expiry approaches ("XFetch"), so hot keys are usually rebuilt
+before anyone sees them expire at all.
+
+``cache_view`` applies the same logic to whole responses of a view.
+"""
+import functools
+import hashlib
+import math
+import random
+import threading
+import time
+import uuid
+
+from django.core.cache import cache
+
+from . import compression, generations
+
+DEFAULT_TIMEOUT = 60 * 15
+# How long a value stays around after it expired, to be served while stale.
+DEFAULT_STALE_TIMEOUT = 60 * 60
+LOCK_TIMEOUT = 30
+WAIT_TIMEOUT = 5.0
+WAIT_INTERVAL = 0.05
+
+_stats_lock = threading.Lock()
+_stats = dict.fromkeys(('hits', 'recomputes', 'early_recomputes', 'coalesced', 'stale_served', 'fallbacks'), 0)
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def stats():
+    """Counts of hits, recomputes, coalesced waits and stale responses in this process."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+class Entry:
+    """What is stored under a key: the value plus what is needed to judge its freshness."""
+
+    __slots__ = ('value', 'version', 'expires', 'delta')
+
+    def __init__(self, value, version, expires, delta):
+        self.value = value
+        self.version = version
+        self.expires = expires
+        self.delta = delta
+
+    def __getstate__(self):
+        return (self.value, self.version, self.expires, self.delta)
+
+    def __setstate__(self, state):
+        self.value, self.version, self.expires, self.delta = state
+
+    def is_fresh(self, version, now, beta):
+        if self.version != version:
+            return False
+        # XFetch: -log(U) is exponentially distributed, so the chance of an
+        # early refresh rises smoothly as expiry approaches and scales with
+        # how long the value took to compute.
+        return now - self.delta * beta * math.log(random.random() or 1e-12) < self.expires
+
+
+def _acquire(lock_key, timeout):
+    token = uuid.uuid4().hex
+    return token if cache.add(lock_key, token, timeout) else None
+
+
+def _release(lock_key, token):
+    if cache.get(lock_key) == token:
+        cache.delete(lock_key)
+
+
+def get_or_recompute(key, compute, timeout=DEFAULT_TIMEOUT, versions=(),
+                     stale_timeout=DEFAULT_STALE_TIMEOUT, beta=1.0,
+                     cacheable=None):
+    """
+    Return the cached value for ``key``, calling ``compute()`` to (re)build it.
+
+    ``versions`` names generation counters (see ``app.generations``) the value
+    is derived from; when any of them moves the cached value is treated as
+    stale. ``cacheable(value)`` may veto storing a computed value (e.g. error
+    responses). For querysets pass ``lambda: list(queryset)``.
+    """
+    version = generations.get_generations(*versions)
+    now = time.time()
+    entry = cache.get(key)
+    if entry is not None and entry.is_fresh(version, now, beta):
+        _count('hits')
+        return entry.value
+
+    lock_key = key + ':lock'
+    token = _acquire(lock_key, LOCK_TIMEOUT)
+    if token is not None:
+        try:
+            started = time.time()
+            value = compute()
+            delta = time.time() - started
+            if cacheable is None or cacheable(value):
+                cache.set(key, Entry(value, version, started + timeout, delta), timeout + stale_timeout)
+        finally:
+            _release(lock_key, token)
+        _count('early_recomputes' if entry is not None and entry.version == version and now < entry.expires else 'recomputes')
+        return value
+
+    # Another worker is recomputing.
+    if entry is not None:
+        _count('stale_served')
+        return entry.value
+
+    deadline = now + WAIT_TIMEOUT
+    while time.time() < deadline:
+        time.sleep(WAIT_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None and entry.version == version:
+            _count('coalesced')
+            return entry.value
+        if cache.get(lock_key) is None:
+            break
+
+    # The leader gave up, failed or produced something uncacheable.
+    _count('fallbacks')
+    return compute()
+
+
+def _response_is_cacheable(response):
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not response.has_header('Set-Cookie')
+    )
+
+
+def cache_view(timeout=DEFAULT_TIMEOUT, versions=(), stale_timeout=DEFAULT_STALE_TIMEOUT, key_prefix=None):
+    """
+    Cache a view's GET/HEAD responses with ``get_or_recompute``, keyed by
+    host and full path. Only plain 200 responses without cookies are stored,
+    along with their compressed variants (``compression.precompress``).
+    Requests with ``bypass_cache`` set (pre-rendering) always get a fresh
+    response: a stale one served while another worker holds the lock would
+    otherwise be written to disk and outlive the change.
+    """
+    def decorator(view):
+        prefix = key_prefix or f'{view.__module__}.{view.__qualname__}'
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or getattr(request, 'bypass_cache', False):
+                return view(request, *args, **kwargs)
+
+            def compute():
+                response = view(request, *args, **kwargs)
+                if hasattr(response, 'render') and callable(response.render):
+                    response = response.render()
+                # Cached together with the response, so compression is paid once per version.
+                if _response_is_cacheable(response):
+                    compression.precompress(response)
+                return response
+
+            url = f'{request.scheme}://{request.get_host()}{request.get_full_path()}'
+            key = f'view:{prefix}:{hashlib.md5(url.encode()).hexdigest()}'
+            return get_or_recompute(
+                key, compute, timeout=timeout, versions=versions,
+                stale_timeout=stale_timeout, cacheable=_response_is_cacheable,
+            )
+        return wrapper
+    return decorator
@@ -0,0 +1,283 @@
+"""
+Immutable, per-process snapshot of the product catalog.
+
+The catalog (categories, statuses, products) is small, changes only when an
+admin saves something and is read on almost every request. ``get_snapshot``
+loads it once into compact tuple-backed records with lookup indexes and
+swaps in a fresh snapshot when the ``catalog`` generation counter moves, so
+catalog views resolve everything from memory without touching the database.
+"""
+import sys
+import threading
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+from django.db.models import Count
+from django.utils.html import strip_tags
+
+from . import generations
+from .caching import get_or_recompute
+from .models import Product, ProductCategory, ProductStatus, normalize_sku
+
+SUMMARY_LENGTH = 200
+
+
+def _keywords(value):
+    if value:
+        return [kw.strip() for kw in value.split(',') if kw.strip()]
+    return []
+
+
+class MediaFile:
+    """Stand-in for a FieldFile: just the stored name and its public URL."""
+
+    __slots__ = ('name', 'url')
+
+    def __init__(self, name, url):
+        self.name = name
+        self.url = url
+
+    def __bool__(self):
+        return bool(self.name)
+
+    def __str__(self):
+        return self.name or ''
+
+
+class StatusRecord(NamedTuple):
+    id: int
+    name: str
+    slug: str
+
+    def __str__(self):
+        return self.name
+
+
+class CategoryRecord(NamedTuple):
+    id: int
+    name: str
+    slug: str
+    description: str
+    description_html: str
+    icon: Optional[str]
+    seo_meta_title: Optional[str]
+    seo_meta_description: Optional[str]
+    seo_meta_keywords: Optional[str]
+
+    def get_seo_keywords_list(self):
+        return _keywords(self.seo_meta_keywords)
+
+    def __str__(self):
+        return self.name
+
+
+class ProductRecord(NamedTuple):
+    id: int
+    name: str
+    slug: str
+    sku: str
+    description: str
+    description_html: str
+    summary: str
+    content_html: str
+    image: MediaFile
+    category: CategoryRecord
+    status: Optional[StatusRecord]
+    seo_meta_title: Optional[str]
+    seo_meta_description: Optional[str]
+    seo_meta_keywords: Optional[str]
+    created_at: object
+    updated_at: object
+
+    def get_seo_tags_list(self):
+        return _keywords(self.seo_meta_keywords)
+
+    def __str__(self):
+        return self.name
+
+
+def summarize(description):
+    """Plain-text summary of an HTML description, as shown in listings."""
+    text = strip_tags(description or '')
+    return text[:SUMMARY_LENGTH] + '...' if len(text) > SUMMARY_LENGTH else text
+
+
+def status_facets(category_id):
+    """
+    ``[{'slug', 'name', 'count'}]`` of the products of one category per
+    status (``slug`` and ``name`` are ``None`` for products without one):
+    one GROUP BY, cached until the catalog changes.
+    """
+    def compute():
+        rows = (
+            Product.objects.filter(category_id=category_id)
+            .values_list('status__slug', 'status__name')
+            .annotate(count=Count('id'))
+            .order_by('status__name')
+        )
+        return [{'slug': slug, 'name': name, 'count': count} for slug, name, count in rows]
+
+    return get_or_recompute(f'catalog:facets:{category_id}', compute, versions=(generations.CATALOG,))
+
+
+def _newest_first(products):
+    return tuple(sorted(products, key=lambda p: (p.created_at, p.id), reverse=True))
+
+
+INDEX_ATTRS = (
+    'categories_by_id', 'categories_by_slug', 'statuses_by_id', 'statuses_by_slug',
+    'products_by_id', 'products_by_slug', 'products_by_path', 'products_by_sku',
+    'products_by_status', 'products_by_category', 'products_by_category_status',
+)
+
+
+class CatalogSnapshot:
+    """All catalog records of one generation plus the indexes views look them up by."""
+
+    __slots__ = ('version', 'categories', 'statuses', 'products', 'newest_products') + INDEX_ATTRS
+
+    def __init__(self, version, categories, statuses, products):
+        self.version = version
+        self.categories = tuple(categories)
+        self.statuses = tuple(statuses)
+        self.products = tuple(products)
+        self.newest_products = _newest_first(self.products)
+
+        self.categories_by_id = MappingProxyType({c.id: c for c in self.categories})
+        self.categories_by_slug = MappingProxyType({c.slug: c for c in self.categories})
+        self.statuses_by_id = MappingProxyType({s.id: s for s in self.statuses})
+        self.statuses_by_slug = MappingProxyType({s.slug: s for s in self.statuses})
+        self.products_by_id = MappingProxyType({p.id: p for p in self.products})
+        self.products_by_slug = MappingProxyType({p.slug: p for p in self.products})
+        self.products_by_path = MappingProxyType({(p.category.slug, p.slug): p for p in self.products})
+
+        by_sku, by_status, by_category, by_category_status = {}, {}, {}, {}
+        for product in self.newest_products:
+            by_sku.setdefault(normalize_sku(product.sku), []).append(product)
+            if product.status is not None:
+                by_status.setdefault(product.status.slug, []).append(product)
+                by_category_status.setdefault((product.category.id, product.status.slug), []).append(product)
+            by_category.setdefault(product.category.id, []).append(product)
+        self.products_by_sku = MappingProxyType({k: tuple(v) for k, v in by_sku.items() if k})
+        self.products_by_status = MappingProxyType({k: tuple(v) for k, v in by_status.items()})
+        self.products_by_category = MappingProxyType({k: tuple(v) for k, v in by_category.items()})
+        self.products_by_category_status = MappingProxyType({k: tuple(v) for k, v in by_category_status.items()})
+
+    def products_in_category(self, category_id, status_slug=None):
+        """Products of one category (with one status, when given), newest first."""
+        if status_slug:
+            return self.products_by_category_status.get((category_id, status_slug), ())
+        return self.products_by_category.get(category_id, ())
+
+    def products_with_status(self, status_slug):
+        """Products carrying a status (e.g. ``best-selling``), newest first."""
+        return self.products_by_status.get(status_slug, ())
+
+    def product_by_sku(self, sku):
+        """The newest product with this SKU, or ``None``."""
+        matches = self.products_by_sku.get(normalize_sku(sku))
+        return matches[0] if matches else None
+
+    def memory_report(self):
+        """Approximate bytes held by the records and by the indexes."""
+        seen = set()
+        records = _deep_size((self.categories, self.statuses, self.products), seen)
+        indexes = _deep_size([self.newest_products] + [getattr(self, name) for name in INDEX_ATTRS], seen)
+        return {
+            'version': self.version,
+            'categories': len(self.categories),
+            'statuses': len(self.statuses),
+            'products': len(self.products),
+            'records_bytes': records,
+            'indexes_bytes': indexes,
+            'total_bytes': records + indexes,
+        }
+
+
+def _deep_size(obj, seen):
+    """sys.getsizeof over everything reachable from ``obj``, counting shared objects once."""
+    stack, total = [obj], 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, MappingProxyType):
+            # Measure the mapping the proxy wraps (a copy of the same size).
+            item = dict(item)
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (tuple, list, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, '__slots__') and not isinstance(item, type):
+            stack.extend(getattr(item, slot) for slot in item.__slots__ if hasattr(item, slot))
+    return total
+
+
+def load_snapshot(version=None):
+    """Read the catalog from the database into a new ``CatalogSnapshot``."""
+    statuses = [
+        StatusRecord(*row)
+        for row in ProductStatus.objects.order_by('name').values_list('id', 'name', 'slug')
+    ]
+    categories = [
+        CategoryRecord(pk, name, slug, description, description_html, *rest)
+        for pk, name, slug, description, description_html, *rest in
+        ProductCategory.objects.order_by('name').values_list(
+            'id', 'name', 'slug', 'description', 'description_html', 'icon',
+            'seo_meta_title', 'seo_meta_description', 'seo_meta_keywords',
+        )
+    ]
+    statuses_by_id = {s.id: s for s in statuses}
+    categories_by_id = {c.id: c for c in categories}
+    storage = Product._meta.get_field('image').storage
+
+    products = []
+    rows = Product.objects.order_by('name').values_list(
+        'id', 'name', 'slug', 'sku', 'description', 'description_html', 'content_html',
+        'image', 'category_id', 'status_id', 'seo_meta_title', 'seo_meta_description',
+        'seo_meta_keywords', 'created_at', 'updated_at',
+    )
+    for (pk, name, slug, sku, description, description_html, content_html, image,
+         category_id, status_id, seo_title, seo_description, seo_keywords, created_at, updated_at) in rows:
+        products.append(ProductRecord(
+            id=pk,
+            name=name,
+            slug=slug,
+            sku=sku,
+            description=description,
+            description_html=description_html,
+            summary=summarize(description),
+            content_html=content_html,
+            image=MediaFile(image, storage.url(image) if image else ''),
+            category=categories_by_id[category_id],
+            status=statuses_by_id.get(status_id),
+            seo_meta_title=seo_title,
+            seo_meta_description=seo_description,
+            seo_meta_keywords=seo_keywords,
+            created_at=created_at,
+            updated_at=updated_at,
+        ))
+    return CatalogSnapshot(version, categories, statuses, products)
+
+
+_snapshot = None
+_lock = threading.Lock()
+
+
+def get_snapshot():
+    """Return the current snapshot, reloading it if the catalog generation moved."""
+    global _snapshot
+    version = generations.get_generation(generations.CATALOG)
+    snapshot = _snapshot
+    if snapshot is None or snapshot.version != version:
+        with _lock:
+            snapshot = _snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = load_snapshot(version)
+                # A single reference assignment: readers see the old or the
+                # new snapshot, never a half-built one.
+                _snapshot = snapshot
+    return snapshot
@@ -0,0 +1,151 @@
+"""
+Delta sync: rows changed since a cursor, plus tombstones.
+
+A feed walks one model in ``(updated_at, id)`` order (indexed) and the
+``DeletionLog`` in id order. The cursor handed back to clients is an opaque
+token holding the last ``(updated_at, id)`` and deletion id they have seen,
+so the next poll returns only what changed after it. Rows that stop being
+public (an unpublished blog post) are reported as tombstones too.
+
+Rows newer than ``SETTLE_SECONDS`` are held back until the next poll: a
+transaction that is still open when a cursor is issued may commit a row
+stamped before it, and the delay leaves room for it to land.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+
+from django.db.models import BooleanField, Case, Max, Q, Value, When
+from django.utils import timezone
+
+from . import serializers
+from .models import BlogPost, DeletionLog, Product
+
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 2000
+SETTLE_SECONDS = 2
+# Tokens older than this may have missed pruned tombstones (see
+# ``manage.py prune_deletion_log``); their clients must resync.
+TOKEN_MAX_AGE_DAYS = 30
+
+
+class InvalidToken(ValueError):
+    pass
+
+
+class ExpiredToken(ValueError):
+    pass
+
+
+class Cursor:
+    __slots__ = ('updated_at', 'id', 'deletion_id', 'issued_at')
+
+    def __init__(self, updated_at=None, id=0, deletion_id=0, issued_at=None):
+        self.updated_at = updated_at
+        self.id = id
+        self.deletion_id = deletion_id
+        self.issued_at = issued_at
+
+    def encode(self):
+        data = [
+            self.updated_at.isoformat() if self.updated_at else None,
+            self.id, self.deletion_id, self.issued_at.isoformat(),
+        ]
+        return base64.urlsafe_b64encode(json.dumps(data, separators=(',', ':')).encode()).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token):
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+            updated_at, id, deletion_id, issued_at = json.loads(raw)
+            cursor = cls(
+                datetime.fromisoformat(updated_at) if updated_at else None,
+                int(id), int(deletion_id), datetime.fromisoformat(issued_at),
+            )
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+            raise InvalidToken('Invalid sync token') from e
+        # Tokens are always issued with aware times; naive ones can't be compared
+        if timezone.is_naive(cursor.issued_at) or (cursor.updated_at and timezone.is_naive(cursor.updated_at)):
+            raise InvalidToken('Invalid sync token')
+        return cursor
+
+
+class Feed:
+    """Changes of ``model``; rows outside ``visible`` are sent as tombstones."""
+
+    def __init__(self, model, serializer, visible=None):
+        self.model = model
+        self.label = model._meta.label_lower
+        self.serializer = serializer
+        self.visible = visible
+
+    def changes(self, token=None, limit=DEFAULT_LIMIT):
+        """
+        ``{'changes', 'deleted', 'next', 'has_more'}`` after ``token`` (from
+        the start when empty). Raises ``InvalidToken``/``ExpiredToken``.
+        """
+        now = timezone.now()
+        horizon = now - timedelta(seconds=SETTLE_SECONDS)
+        if token:
+            cursor = Cursor.decode(token)
+            if cursor.issued_at < now - timedelta(days=TOKEN_MAX_AGE_DAYS):
+                raise ExpiredToken('Sync token expired; start over without one')
+        else:
+            # A fresh mirror has nothing to delete: skip the log written so far.
+            start = DeletionLog.objects.filter(model=self.label, deleted_at__lte=horizon).aggregate(m=Max('id'))['m']
+            cursor = Cursor(deletion_id=start or 0)
+
+        rows = self.model.objects.filter(updated_at__lte=horizon)
+        if cursor.updated_at is not None:
+            rows = rows.filter(
+                Q(updated_at__gt=cursor.updated_at) | Q(updated_at=cursor.updated_at, id__gt=cursor.id)
+            )
+        visible = Value(True) if self.visible is None else Case(
+            When(self.visible, then=Value(True)), default=Value(False), output_field=BooleanField()
+        )
+        page = list(
+            rows.order_by('updated_at', 'id').annotate(is_visible=visible)
+            .values_list('id', 'updated_at', 'is_visible')[:limit + 1]
+        )
+        has_more = len(page) > limit
+        page = page[:limit]
+
+        deletions = list(
+            DeletionLog.objects.filter(model=self.label, id__gt=cursor.deletion_id, deleted_at__lte=horizon)
+            .order_by('id').values_list('id', 'object_id', 'deleted_at')[:limit + 1]
+        )
+        has_more = has_more or len(deletions) > limit
+        deletions = deletions[:limit]
+
+        names = tuple(self.serializer.fields)
+        shown = [pk for pk, _, is_visible in page if is_visible]
+        records = {}
+        if shown:
+            queryset = self.model.objects.filter(pk__in=shown).order_by()
+            records = {item['id']: item for item in self.serializer.from_queryset(queryset, names)}
+        deleted = [
+            {'id': object_id, 'deleted_at': deleted_at.isoformat()}
+            for _, object_id, deleted_at in deletions
+        ] + [
+            {'id': pk, 'deleted_at': updated_at.isoformat()}
+            for pk, updated_at, is_visible in page if not is_visible
+        ]
+
+        if page:
+            cursor.id, cursor.updated_at, _ = page[-1]
+        if deletions:
+            cursor.deletion_id = deletions[-1][0]
+        cursor.issued_at = now
+        return {
+            'changes': [records[pk] for pk in shown if pk in records],
+            'deleted': deleted,
+            'next': cursor.encode(),
+            'has_more': has_more,
+        }
+
+
+FEEDS = {
+    'products': Feed(Product, serializers.PRODUCT_CHANGES),
+    'blog-posts': Feed(BlogPost, serializers.BLOG_POST_CHANGES, visible=Q(status='published')),
+}
@@ -0,0 +1,110 @@
+"""
+Content negotiation and compression of responses.
+
+``CompressionMiddleware`` (app/middleware.py) encodes text responses with
+brotli or gzip, whichever the client prefers and is available. Responses
+stored by ``cache_view`` (app/caching.py) carry their compressed variants
+with them (``precompress``), so a cached page or API body is compressed once
+per content version instead of once per request; everything else is
+compressed on the fly at a cheaper level.
+"""
+import gzip
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+# Below this the encoding overhead outweighs the savings.
+MIN_LENGTH = 200
+
+# Variants stored with cached responses are built once, so they can afford
+# a better (slower) level than per-request compression.
+STORED_LEVELS = {'br': 9, 'gzip': 9}
+DYNAMIC_LEVELS = {'br': 4, 'gzip': 6}
+
+COMPRESSIBLE_TYPES = (
+    'text/',
+    'application/json',
+    'application/javascript',
+    'application/xml',
+    'application/rss+xml',
+    'application/atom+xml',
+    'application/x-ndjson',
+    'image/svg+xml',
+)
+
+VARIANTS_ATTR = 'compressed_variants'
+
+
+def available_encodings():
+    """Content codings this process can produce, in order of preference."""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def accepted_encodings(request):
+    """Return the content codings listed in Accept-Encoding (q=0 excluded)."""
+    encodings = set()
+    for part in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        coding, _, params = part.strip().partition(';')
+        params = params.replace(' ', '')
+        if coding and params not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            encodings.add(coding.lower())
+    return encodings
+
+
+def negotiate(request):
+    """The coding to send ``request``, or ``None`` for identity."""
+    accepted = accepted_encodings(request)
+    for coding in available_encodings():
+        if coding in accepted:
+            return coding
+    return None
+
+
+def compress(data, coding, level):
+    if coding == 'br':
+        return brotli.compress(data, quality=level)
+    # mtime=0 keeps the output a pure function of the input.
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def is_compressible(response):
+    if response.streaming or response.has_header('Content-Encoding'):
+        return False
+    if 'no-transform' in response.get('Cache-Control', ''):
+        return False
+    content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+    if not content_type.startswith(COMPRESSIBLE_TYPES):
+        return False
+    return len(response.content) >= MIN_LENGTH
+
+
+def _fingerprint(content):
+    return len(content), zlib.crc32(content)
+
+
+def precompress(response):
+    """Attach every available compressed variant of ``response`` to it (before caching)."""
+    if not is_compressible(response):
+        return response
+    variants = {'source': _fingerprint(response.content)}
+    for coding in available_encodings():
+        body = compress(response.content, coding, STORED_LEVELS[coding])
+        if len(body) < len(response.content):
+            variants[coding] = body
+    setattr(response, VARIANTS_ATTR, variants)
+    return response
+
+
+def encoded_body(response, coding):
+    """``response``'s body in ``coding``: the stored variant if there is one, else compressed now."""
+    variants = getattr(response, VARIANTS_ATTR, None)
+    # Middleware between the view and here may have rewritten the body
+    # (e.g. django-browser-reload's script injection in DEBUG).
+    if variants is not None and variants.get('source') == _fingerprint(response.content):
+        # A cached response without the variant didn't shrink when compressed.
+        return variants.get(coding)
+    body = compress(response.content, coding, DYNAMIC_LEVELS[coding])
+    return body if len(body) < len(response.content) else None
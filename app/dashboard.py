@@ -0,0 +1,119 @@
+"""
+Admin dashboard (Unfold ``DASHBOARD_CALLBACK``).
+
+Everything shown here comes from the daily rollup tables maintained by
+``manage.py rollup_inbox`` (app/rollups.py), never from the raw inbox
+tables, so the page costs a handful of small indexed queries no matter how
+many enquiries have been received.
+"""
+import json
+from datetime import timedelta
+
+from django.db.models import Max, Q, Sum
+from django.utils import timezone
+
+from .catalog import get_snapshot
+from .models import ContactDailyRollup, EnquiryDailyRollup, JobCheckpoint
+from .rollups import SOURCES
+
+DAYS = 30
+WEEKS = 12
+TOP_PRODUCTS = 8
+TREND_PRODUCTS = 5
+
+PRIMARY = 'var(--color-primary-500)'
+SECONDARY = 'var(--color-primary-200)'
+TREND_COLORS = ('#ef4444', '#3b82f6', '#10b981', '#f59e0b', '#8b5cf6')
+
+
+def _daily(model, start):
+    """``{day: (total, pending)}`` from a rollup table since ``start``."""
+    rows = (
+        model.objects.filter(day__gte=start).values('day')
+        .annotate(total=Sum('count'), pending=Sum('count', filter=Q(is_responded=False)))
+    )
+    return {row['day']: (row['total'], row['pending'] or 0) for row in rows}
+
+
+def _totals(model):
+    totals = model.objects.aggregate(total=Sum('count'), pending=Sum('count', filter=Q(is_responded=False)))
+    return totals['total'] or 0, totals['pending'] or 0
+
+
+def _bar_chart(days, daily):
+    return json.dumps({
+        'labels': [day.strftime('%d %b') for day in days],
+        'datasets': [
+            {'label': 'Total', 'data': [daily.get(day, (0, 0))[0] for day in days], 'backgroundColor': SECONDARY},
+            {'label': 'Pending', 'data': [daily.get(day, (0, 0))[1] for day in days], 'backgroundColor': PRIMARY},
+        ],
+    })
+
+
+def _product_label(sku, products):
+    product = products.product_by_sku(sku)
+    return f'{product.name} ({sku})' if product else sku
+
+
+def _top_products(start, products):
+    rows = (
+        EnquiryDailyRollup.objects.filter(day__gte=start).exclude(sku='')
+        .values('sku').annotate(total=Sum('count')).order_by('-total', 'sku')[:TOP_PRODUCTS]
+    )
+    return [{'sku': row['sku'], 'label': _product_label(row['sku'], products), 'total': row['total']} for row in rows]
+
+
+def _weekly_trend(today, skus, products):
+    """Enquiries per week for the given SKUs over the last ``WEEKS`` weeks, as line chart data."""
+    first_week = today - timedelta(days=today.weekday(), weeks=WEEKS - 1)
+    weeks = [first_week + timedelta(weeks=i) for i in range(WEEKS)]
+    counts = {sku: [0] * WEEKS for sku in skus}
+    rows = (
+        EnquiryDailyRollup.objects.filter(day__gte=first_week, sku__in=skus)
+        .values('sku', 'day').annotate(total=Sum('count'))
+    )
+    for row in rows:
+        counts[row['sku']][(row['day'] - first_week).days // 7] += row['total']
+    return json.dumps({
+        'labels': [week.strftime('%d %b') for week in weeks],
+        'datasets': [
+            {'label': _product_label(sku, products), 'data': counts[sku],
+             'borderColor': TREND_COLORS[i % len(TREND_COLORS)]}
+            for i, sku in enumerate(skus)
+        ],
+    })
+
+
+def dashboard_callback(request, context):
+    today = timezone.localdate()
+    start = today - timedelta(days=DAYS - 1)
+    days = [start + timedelta(days=i) for i in range(DAYS)]
+    products = get_snapshot()
+
+    enquiries_daily = _daily(EnquiryDailyRollup, start)
+    contacts_daily = _daily(ContactDailyRollup, start)
+    enquiries_total, enquiries_pending = _totals(EnquiryDailyRollup)
+    contacts_total, contacts_pending = _totals(ContactDailyRollup)
+    last_week = [today - timedelta(days=i) for i in range(7)]
+    top_products = _top_products(start, products)
+
+    context.update({
+        'dashboard': {
+            'kpis': [
+                {'title': 'Enquiries', 'value': enquiries_total, 'footer': f'{enquiries_pending} pending', 'href': '/admin/app/enquiry/'},
+                {'title': 'Enquiries (7 days)', 'value': sum(enquiries_daily.get(day, (0, 0))[0] for day in last_week),
+                 'footer': f'{enquiries_daily.get(today, (0, 0))[0]} today', 'href': '/admin/app/enquiry/'},
+                {'title': 'Contact Forms', 'value': contacts_total, 'footer': f'{contacts_pending} pending', 'href': '/admin/app/contactformsubmission/'},
+                {'title': 'Contact Forms (7 days)', 'value': sum(contacts_daily.get(day, (0, 0))[0] for day in last_week),
+                 'footer': f'{contacts_daily.get(today, (0, 0))[0]} today', 'href': '/admin/app/contactformsubmission/'},
+            ],
+            'enquiries_chart': _bar_chart(days, enquiries_daily),
+            'contacts_chart': _bar_chart(days, contacts_daily),
+            'top_products': top_products,
+            'trend_chart': _weekly_trend(today, [row['sku'] for row in top_products[:TREND_PRODUCTS]], products),
+            'updated_at': JobCheckpoint.objects.filter(
+                name__in=[source.checkpoint for source in SOURCES.values()]
+            ).aggregate(last=Max('updated_at'))['last'],
+        },
+    })
+    return context
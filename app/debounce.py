@@ -0,0 +1,56 @@
+import logging
+import threading
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class Debouncer:
+    """
+    Collects keys from bursts of calls and hands them to ``callback`` as one
+    set once no new key has arrived for ``delay`` seconds.
+
+    An admin save usually fires several signals (the object, its inlines,
+    related counters), so work such as re-rendering pages is queued here
+    instead of being done once per signal.
+    """
+
+    def __init__(self, callback, delay=2.0, name='debouncer'):
+        self.callback = callback
+        self.delay = delay
+        self.name = name
+        self._pending = set()
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def add(self, *keys):
+        with self._lock:
+            self._pending.update(keys)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self._run)
+            self._timer.name = self.name
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run(self):
+        try:
+            self.flush()
+        finally:
+            # The timer thread opened its own connections; don't leak them.
+            connections.close_all()
+
+    def flush(self):
+        """Run the callback now with everything queued so far."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            keys, self._pending = self._pending, set()
+        if not keys:
+            return
+        try:
+            self.callback(keys)
+        except Exception:
+            logger.exception('%s failed for %d keys', self.name, len(keys))
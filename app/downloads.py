@@ -0,0 +1,154 @@
+"""
+File responses with conditional requests, byte ranges and proxy offload.
+
+``file_response`` answers a GET/HEAD for a file on disk the way a static
+file server would: ``ETag``/``Last-Modified`` with 304s, single byte ranges
+(``Range``/``If-Range``, 206/416) so PDF viewers and video players can fetch
+pieces, and, when ``MEDIA_ACCEL`` is set, an empty response carrying
+``X-Accel-Redirect`` (nginx) or ``X-Sendfile`` (Apache, lighttpd) so the
+front proxy does the transfer instead of a Django worker. Otherwise the body
+is a ``FileResponse`` whose file object keeps its ``fileno()``, so Gunicorn
+can still ``sendfile()`` the requested range.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def file_etag(stat):
+    return '"%x-%x"' % (stat.st_mtime_ns, stat.st_size)
+
+
+def parse_range(header, size):
+    """
+    ``(start, end)`` (inclusive) of a single-range ``Range`` header.
+
+    Returns ``None`` when the header should be ignored (absent, malformed or
+    several ranges, which are answered with the whole file) and raises
+    ``ValueError`` when the range can't be satisfied.
+    """
+    match = _RANGE_RE.match(header.replace(' ', ''))
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # "bytes=-500": the last 500 bytes.
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError('empty suffix range')
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        raise ValueError('range not satisfiable')
+    return start, end
+
+
+def _if_range_matches(request, etag, mtime):
+    """True when an ``If-Range`` precondition (if any) still holds."""
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        return if_range == etag
+    since = parse_http_date_safe(if_range)
+    return since is not None and int(mtime) <= since
+
+
+class RangeFile:
+    """File-like view of ``length`` bytes of ``handle``, starting at its current position."""
+
+    def __init__(self, handle, length):
+        self.handle = handle
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.handle.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        # Lets the WSGI file wrapper sendfile() from the current offset; it
+        # stops at Content-Length.
+        return self.handle.fileno()
+
+    def close(self):
+        self.handle.close()
+
+
+def _offload(path, content_type):
+    """An empty response telling the front proxy to send ``path``, or ``None``."""
+    accel = getattr(settings, 'MEDIA_ACCEL', '')
+    if accel == 'nginx':
+        relative = os.path.relpath(path, settings.MEDIA_ROOT).replace(os.sep, '/')
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_PREFIX + quote(relative)
+        return response
+    if accel == 'sendfile':
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = str(path)
+        return response
+    return None
+
+
+def file_response(request, path, cache_control='public, max-age=3600', as_attachment=False):
+    """Serve the file at ``path`` (which must exist) to ``request``."""
+    stat = os.stat(path)
+    etag = file_etag(stat)
+    last_modified = http_date(stat.st_mtime)
+    conditional = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+    if conditional is not None:
+        conditional['ETag'] = etag
+        conditional['Last-Modified'] = last_modified
+        return conditional
+
+    content_type, encoding = mimetypes.guess_type(str(path))
+    content_type = content_type or 'application/octet-stream'
+    if encoding:
+        # Sending e.g. a .gz as-is; don't let clients decode it.
+        content_type = 'application/octet-stream'
+
+    # The proxy handles Range itself.
+    response = _offload(path, content_type)
+    if response is None:
+        size = stat.st_size
+        byte_range = None
+        if request.META.get('HTTP_RANGE') and _if_range_matches(request, etag, stat.st_mtime):
+            try:
+                byte_range = parse_range(request.META['HTTP_RANGE'], size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+
+        handle = open(path, 'rb')
+        if byte_range is None:
+            response = FileResponse(handle, content_type=content_type)
+        else:
+            start, end = byte_range
+            handle.seek(start)
+            response = FileResponse(RangeFile(handle, end - start + 1), content_type=content_type, status=206)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Length'] = str(end - start + 1)
+        response['Accept-Ranges'] = 'bytes'
+
+    disposition = 'attachment' if as_attachment else 'inline'
+    response['Content-Disposition'] = f"{disposition}; filename*=UTF-8''{quote(os.path.basename(path))}"
+    response['ETag'] = etag
+    response['Last-Modified'] = last_modified
+    response['Cache-Control'] = cache_control
+    return response
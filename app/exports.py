@@ -0,0 +1,68 @@
+"""
+Full NDJSON exports of the catalog and the blog.
+
+One JSON object per line, in id order, read with ``values_list(...).iterator()``
+so memory stays flat whatever the table size. ``after_id`` resumes an export
+after the last id a client (or a previous ``manage.py export_catalog`` run)
+received. With gzip, every batch of lines is flushed as it is produced, so
+the stream never waits for the whole export.
+"""
+import zlib
+
+from django.db.models import Q
+
+from . import serializers
+from .models import BlogPost, Product
+
+CHUNK_SIZE = 2000
+# Lines per piece of the stream (and per gzip flush).
+BATCH_LINES = 500
+
+CONTENT_TYPE = 'application/x-ndjson'
+
+
+class Export:
+    def __init__(self, name, model, serializer, filter=None):
+        self.name = name
+        self.model = model
+        self.serializer = serializer
+        self.filter = filter
+
+    def queryset(self, after_id=0):
+        queryset = self.model.objects.filter(id__gt=after_id).order_by('id')
+        if self.filter is not None:
+            queryset = queryset.filter(self.filter)
+        return queryset
+
+    def items(self, after_id=0):
+        return self.serializer.from_queryset(self.queryset(after_id), tuple(self.serializer.fields))
+
+
+EXPORTS = {
+    export.name: export for export in (
+        Export('products', Product, serializers.PRODUCT_EXPORT),
+        Export('blog-posts', BlogPost, serializers.BLOG_POST_EXPORT, filter=Q(status='published')),
+    )
+}
+
+
+def lines(export, after_id=0):
+    """The export as byte strings of ``BATCH_LINES`` newline-terminated JSON objects."""
+    batch = []
+    for item in export.items(after_id):
+        batch.append(serializers.encode(item))
+        if len(batch) >= BATCH_LINES:
+            yield ('\n'.join(batch) + '\n').encode('utf-8')
+            batch = []
+    if batch:
+        yield ('\n'.join(batch) + '\n').encode('utf-8')
+
+
+def gzipped(chunks, level=6):
+    """``chunks`` as one gzip stream, flushed after every chunk."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
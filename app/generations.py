@@ -0,0 +1,47 @@
+"""
+Generation counters for cached, derived data.
+
+Each counter names a slice of content ("catalog", "blog", ...). Cached
+artifacts include the current generation in their key or ETag, and model
+signals bump the counter when the underlying rows change, which invalidates
+every artifact derived from them at once without having to find and delete
+individual cache keys.
+"""
+import time
+
+from django.core.cache import cache
+
+CATALOG = 'catalog'
+BLOG = 'blog'
+PAGES = 'pages'
+PRICE_LIST = 'price_list'
+
+KEY_PREFIX = 'generation:'
+
+
+def _key(name):
+    return KEY_PREFIX + name
+
+
+def get_generation(name):
+    """Return the current generation number for ``name``."""
+    value = cache.get(_key(name))
+    if value is None:
+        # Seed from the clock so a counter that was evicted or lost with a
+        # cache restart never repeats a generation that is still cached.
+        cache.add(_key(name), int(time.time() * 1000), timeout=None)
+        value = cache.get(_key(name))
+    return value
+
+
+def get_generations(*names):
+    """Return a tuple of generations, handy for composite cache keys."""
+    return tuple(get_generation(name) for name in names)
+
+
+def bump_generation(*names):
+    for name in names:
+        try:
+            cache.incr(_key(name))
+        except ValueError:
+            get_generation(name)
@@ -0,0 +1,151 @@
+"""
+Resized copies ("derivatives") of stored images, for ``srcset``.
+
+A derivative of ``django-summernote/2024-01-05/photo.jpg`` at 480 px wide
+is stored as ``derivatives/django-summernote/2024-01-05/photo-480w.jpg``:
+the name is derived from the source, so it is generated once and found
+again by name; each one is also recorded as an ``ImageDerivative``. Only
+widths below the source width are made. ``optimize`` caps and re-encodes an original in place.
+"""
+import logging
+import os
+import posixpath
+import tempfile
+from io import BytesIO
+
+from django.apps import apps
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVES_DIR = 'derivatives'
+WIDTHS = (480, 960, 1600)
+# Originals wider than this are scaled down by ``optimize``...
+MAX_WIDTH = 2400
+# ...and ones heavier than this re-encoded even when narrow enough
+REENCODE_BYTES = 256 * 1024
+# Formats derivatives are made for (the source format is kept)
+FORMATS = {'JPEG', 'PNG', 'WEBP'}
+SAVE_OPTIONS = {
+    'JPEG': {'quality': 82, 'optimize': True, 'progressive': True},
+    'PNG': {'optimize': True},
+    'WEBP': {'quality': 80, 'method': 6},
+}
+# EXIF orientations that swap width and height when displayed
+_TRANSPOSED = {5, 6, 7, 8}
+
+UNREADABLE = (OSError, SuspiciousFileOperation, UnidentifiedImageError, Image.DecompressionBombError)
+
+
+def derivative_name(name, width):
+    stem, ext = posixpath.splitext(name)
+    return f'{DERIVATIVES_DIR}/{stem}-{width}w{ext}'
+
+
+def image_size(name, storage=None):
+    """Displayed ``(width, height)`` of stored image ``name`` (EXIF rotation applied), or ``None``."""
+    storage = storage or default_storage
+    try:
+        with storage.open(name) as handle, Image.open(handle) as image:
+            width, height = image.size
+            if image.getexif().get(0x0112) in _TRANSPOSED:
+                width, height = height, width
+            return width, height
+    except UNREADABLE:
+        return None
+
+
+def _resized(image, width):
+    """``image`` (EXIF rotation applied, metadata dropped) ``width`` px wide, encoded."""
+    format = image.format
+    image = ImageOps.exif_transpose(image)
+    height = round(image.height * width / image.width)
+    resized = image.resize((width, height), Image.LANCZOS) if width != image.width else image
+    if format == 'JPEG' and resized.mode not in ('RGB', 'L'):
+        resized = resized.convert('RGB')
+    buffer = BytesIO()
+    resized.save(buffer, format=format, **SAVE_OPTIONS[format])
+    return buffer.getvalue()
+
+
+def _record(source, name, size, length):
+    width, height = size
+    apps.get_model('app', 'ImageDerivative').objects.update_or_create(
+        name=name, defaults={'source': source, 'width': width, 'height': height, 'size': length},
+    )
+
+
+def optimize(name, storage=None, max_width=MAX_WIDTH):
+    """
+    Scale stored image ``name`` down to ``max_width`` and re-encode it in
+    place (EXIF rotation applied, metadata such as GPS position dropped)
+    when that makes it smaller. Returns its ``(bytes before, bytes after)``,
+    or ``None`` when it isn't an image this module handles.
+    """
+    storage = storage or default_storage
+    try:
+        before = storage.size(name)
+        with storage.open(name) as handle, Image.open(handle) as image:
+            if image.format not in FORMATS:
+                return None
+            size = image_size(name, storage)
+            width = min(size[0], max_width)
+            if size[0] <= max_width and before <= REENCODE_BYTES:
+                content = None
+            else:
+                content = _resized(image, width)
+        if content is None or (len(content) >= before and width == size[0]):
+            _record(name, name, size, before)
+            return before, before
+        # Same name, so the URL the editor inserted keeps working
+        path = storage.path(name)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        _record(name, name, (width, round(size[1] * width / size[0])), len(content))
+        return before, len(content)
+    except UnidentifiedImageError:
+        return None
+    except UNREADABLE + (NotImplementedError,):
+        logger.exception('Could not optimize %s', name)
+        return None
+
+
+def derivatives(name, storage=None, widths=WIDTHS):
+    """
+    ``[(derivative name, width)]`` of stored image ``name``, narrowest first,
+    generating the missing ones. Empty when the image can't be read or its
+    format isn't resized (GIFs keep their animation).
+    """
+    storage = storage or default_storage
+    size = image_size(name, storage)
+    if size is None:
+        return []
+    result, handle, image = [], None, None
+    try:
+        for width in sorted(w for w in widths if w < size[0]):
+            target = derivative_name(name, width)
+            if not storage.exists(target):
+                if image is None:
+                    handle = storage.open(name)
+                    image = Image.open(handle)
+                    if image.format not in FORMATS:
+                        return []
+                content = _resized(image, width)
+                target = storage.save(target, ContentFile(content))
+                _record(name, target, (width, round(size[1] * width / size[0])), len(content))
+            result.append((target, width))
+    except UNREADABLE:
+        logger.exception('Could not make derivatives of %s', name)
+    finally:
+        if handle is not None:
+            handle.close()
+    return result
@@ -0,0 +1,47 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app import archive, rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Move responded enquiries/contact submissions older than INBOX_ARCHIVE_AFTER_DAYS into "
+        "gzip JSONL monthly partitions under ARCHIVE_ROOT, keeping a searchable index "
+        "(Admin > Archive). Only rows already counted by rollup_inbox are archived."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('sources', nargs='*',
+                            help=f"Inboxes to archive: {', '.join(rollups.SOURCES)} (default: all).")
+        parser.add_argument('--older-than-days', type=int, default=None,
+                            help=f"Archive rows older than this (default {settings.INBOX_ARCHIVE_AFTER_DAYS}).")
+        parser.add_argument('--batch-size', type=int, default=archive.BATCH_SIZE,
+                            help=f"Rows per partition write and delete (default {archive.BATCH_SIZE}).")
+        parser.add_argument('--limit', type=int, default=None,
+                            help="Stop after archiving this many rows per inbox.")
+        parser.add_argument('--dry-run', action='store_true',
+                            help="Only report how many rows would be archived.")
+
+    def handle(self, *args, **options):
+        unknown = set(options['sources']) - set(rollups.SOURCES)
+        if unknown:
+            raise CommandError(f"Unknown source(s): {', '.join(sorted(unknown))}")
+        for name in options['sources'] or rollups.SOURCES:
+            source = rollups.SOURCES[name]
+            if options['dry_run']:
+                count = archive.eligible(source, options['older_than_days']).count()
+                self.stdout.write(f"{name}: {count} rows would be archived")
+                continue
+            started = time.monotonic()
+            count = archive.archive(
+                source,
+                older_than_days=options['older_than_days'],
+                batch_size=options['batch_size'],
+                limit=options['limit'],
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f"{name}: archived {count} rows in {time.monotonic() - started:.2f}s"
+            ))
@@ -0,0 +1,59 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.models import Enquiry, Product, normalize_sku
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill Product.sku_normalized and link existing enquiries to the product their SKU "
+        "names (Enquiry.product). Safe to re-run; processes enquiries in id batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help="Enquiries read per batch (default 5000).")
+        parser.add_argument('--relink', action='store_true',
+                            help="Re-resolve enquiries that are already linked too.")
+
+    def handle(self, *args, **options):
+        products = list(Product.objects.only('id', 'sku', 'sku_normalized'))
+        stale = [p for p in products if p.sku_normalized != normalize_sku(p.sku)]
+        for p in stale:
+            p.sku_normalized = normalize_sku(p.sku)
+        Product.objects.bulk_update(stale, ['sku_normalized'], batch_size=500)
+        self.stdout.write(f"Normalized SKUs of {len(stale)} products")
+
+        # Duplicated SKUs resolve to the newest product, like the catalog snapshot does.
+        product_ids = {}
+        for pk, sku in Product.objects.order_by('-created_at', '-id').values_list('id', 'sku_normalized'):
+            if sku:
+                product_ids.setdefault(sku, pk)
+
+        queryset = Enquiry.objects.exclude(sku__isnull=True).exclude(sku='')
+        if not options['relink']:
+            queryset = queryset.filter(product__isnull=True)
+
+        last_id = scanned = linked = 0
+        while True:
+            rows = list(
+                queryset.filter(id__gt=last_id).order_by('id')
+                .values_list('id', 'sku', 'product_id')[:options['batch_size']]
+            )
+            if not rows:
+                break
+            changes = defaultdict(list)
+            for pk, sku, current in rows:
+                product_id = product_ids.get(normalize_sku(sku))
+                if product_id != current:
+                    changes[product_id].append(pk)
+            with transaction.atomic():
+                for product_id, pks in changes.items():
+                    Enquiry.objects.filter(pk__in=pks).update(product_id=product_id)
+            linked += sum(len(pks) for product_id, pks in changes.items() if product_id is not None)
+            scanned += len(rows)
+            last_id = rows[-1][0]
+
+        self.stdout.write(self.style.SUCCESS(f"Scanned {scanned} enquiries, linked {linked} to products"))
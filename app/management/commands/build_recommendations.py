@@ -0,0 +1,48 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from app import prerender, recommendations
+from app.catalog import get_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold new enquiries into the product co-occurrence counts and refresh the "
+        "'frequently enquired together' recommendations. Incremental: picks up after the "
+        "last processed enquiry id. Run it periodically (e.g. from cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rebuild', action='store_true',
+                            help="Discard all counts and reprocess every enquiry (needed after changing --window-days).")
+        parser.add_argument('--window-days', type=int, default=recommendations.WINDOW.days,
+                            help=f"Enquiries by one email this many days apart count as together (default {recommendations.WINDOW.days}).")
+        parser.add_argument('--chunk-size', type=int, default=recommendations.CHUNK_SIZE,
+                            help=f"Enquiries read per batch (default {recommendations.CHUNK_SIZE}).")
+        parser.add_argument('--top', type=int, default=recommendations.TOP_N,
+                            help=f"Recommendations stored per product (default {recommendations.TOP_N}).")
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        run = recommendations.rebuild if options['rebuild'] else recommendations.update
+        processed, refreshed = run(
+            window=timedelta(days=options['window_days']),
+            chunk_size=options['chunk_size'],
+            top_n=options['top'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {processed} enquiries, refreshed recommendations of {len(refreshed)} products "
+            f"in {time.monotonic() - started:.2f}s"
+        ))
+
+        if refreshed and prerender.is_enabled():
+            # Product pages show the recommendations; bring the static copies up to date.
+            products = get_snapshot().products_by_id
+            paths = {
+                prerender.product_path(products[pk].category.slug, products[pk].slug)
+                for pk in refreshed if pk in products
+            }
+            written, _ = prerender.build_paths(paths)
+            self.stdout.write(f"Re-rendered {written} product pages")
@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from app import related
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the precomputed related blog posts (TF-IDF similarity) for every published post. "
+        "With --pending, only when posts were saved or deleted since the last build: run it "
+        "periodically (e.g. every few minutes from cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=related.TOP_K,
+                            help=f"Related posts stored per post (default {related.TOP_K}).")
+        parser.add_argument('--pending', action='store_true',
+                            help="Do nothing unless posts changed since the last build.")
+
+    def handle(self, *args, **options):
+        if options['pending'] and not related.is_pending():
+            self.stdout.write("No blog post changed since the last build.")
+            return
+        started = time.monotonic()
+        count = related.build_all(k=options['top'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Related posts rebuilt for {count} posts in {time.monotonic() - started:.2f}s"
+        ))
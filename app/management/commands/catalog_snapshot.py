@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from app.catalog import load_snapshot
+
+
+class Command(BaseCommand):
+    help = "Load the catalog snapshot and report how much memory it takes."
+
+    def handle(self, *args, **options):
+        report = load_snapshot().memory_report()
+        self.stdout.write(
+            f"{report['categories']} categories, {report['statuses']} statuses, "
+            f"{report['products']} products"
+        )
+        for label, key in (('Records', 'records_bytes'), ('Indexes', 'indexes_bytes'), ('Total', 'total_bytes')):
+            self.stdout.write(f"{label:8} {report[key] / 1024:10.1f} KiB")
+        if report['products']:
+            self.stdout.write(f"Per product {report['total_bytes'] / report['products']:.0f} bytes")
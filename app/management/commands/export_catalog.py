@@ -0,0 +1,105 @@
+import gzip
+import json
+import sys
+import zlib
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app import exports
+
+
+def _last_id(lines):
+    last = None
+    for line in lines:
+        if line.strip():
+            last = json.loads(line)['id']
+    return last
+
+
+def _resume_plain(path):
+    """Drop a partly written last line; return the id of the last complete one."""
+    with open(path, 'rb+') as handle:
+        data = handle.read()
+        end = data.rfind(b'\n') + 1
+        handle.truncate(end)
+    return _last_id(data[:end].splitlines())
+
+
+def _resume_gzip(path):
+    """
+    Drop a partly written last gzip member (each batch is a member of its
+    own); return the id of the last complete line.
+    """
+    with open(path, 'rb') as handle:
+        data = handle.read()
+    end = 0
+    while end < len(data):
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            decompressor.decompress(data[end:])
+        except zlib.error:
+            break
+        if not decompressor.eof:
+            break
+        end = len(data) - len(decompressor.unused_data)
+    with open(path, 'rb+') as handle:
+        handle.truncate(end)
+    return _last_id(gzip.decompress(data[:end]).splitlines()) if end else None
+
+
+class Command(BaseCommand):
+    help = "Stream products or published blog posts as NDJSON (one JSON object per line, in id order)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('export', choices=sorted(exports.EXPORTS))
+        parser.add_argument(
+            '-o', '--output', default='-',
+            help="File to write (default: stdout). A .gz name implies --gzip.",
+        )
+        parser.add_argument('--gzip', action='store_true', help="Gzip the output.")
+        parser.add_argument(
+            '--after-id', type=int, default=0,
+            help="Only export rows with a larger id (resume after that row).",
+        )
+        parser.add_argument(
+            '--resume', action='store_true',
+            help="Continue an interrupted export into --output after its last complete line.",
+        )
+
+    def handle(self, *args, **options):
+        export = exports.EXPORTS[options['export']]
+        output = options['output']
+        compress = options['gzip'] or output.endswith('.gz')
+        after_id = options['after_id']
+        mode = 'wb'
+
+        if options['resume']:
+            if output == '-':
+                raise CommandError("--resume needs an --output file")
+            try:
+                last = _resume_gzip(output) if compress else _resume_plain(output)
+            except FileNotFoundError:
+                last = None
+            except (ValueError, KeyError) as e:
+                raise CommandError(f"Can't find where {output} stopped: {e}")
+            if last is not None:
+                after_id = max(after_id, last)
+                mode = 'ab'
+
+        handle = sys.stdout.buffer if output == '-' else open(output, mode)
+        written = 0
+        try:
+            for chunk in exports.lines(export, after_id):
+                # Complete members per batch: an interrupted file stays
+                # readable up to its last batch and --resume can append.
+                handle.write(gzip.compress(chunk, mtime=0) if compress else chunk)
+                handle.flush()
+                written += chunk.count(b'\n')
+        finally:
+            if handle is not sys.stdout.buffer:
+                handle.close()
+
+        if output != '-':
+            self.stdout.write(self.style.SUCCESS(
+                f"Wrote {written} {export.name} to {output} (after id {after_id})"
+            ))
@@ -0,0 +1,60 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.template.defaultfilters import filesizeformat
+
+from app import mediagc
+
+
+class Command(BaseCommand):
+    help = (
+        "Find the files in MEDIA_ROOT that no row or rich-text field references any more "
+        "(replaced images and PDFs, uploads of deleted posts, stale derivatives). Reports them "
+        "by default; --quarantine moves them to MEDIA_QUARANTINE_ROOT, --delete deletes them. "
+        "Only files older than the grace period are touched."
+    )
+
+    def add_arguments(self, parser):
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument('--dry-run', action='store_true',
+                          help="Only report what would be reclaimed (the default).")
+        mode.add_argument('--quarantine', action='store_true',
+                          help="Move unreferenced files under MEDIA_QUARANTINE_ROOT/<timestamp>/.")
+        mode.add_argument('--delete', action='store_true',
+                          help="Delete unreferenced files.")
+        parser.add_argument('--grace-days', type=int, default=settings.MEDIA_GC_GRACE_DAYS,
+                            help=f"Leave files modified in the last N days (default {settings.MEDIA_GC_GRACE_DAYS}).")
+        parser.add_argument('--workers', type=int, default=min(8, os.cpu_count() or 1),
+                            help="Directories scanned at once (default: CPUs, at most 8).")
+
+    def handle(self, *args, **options):
+        files = mediagc.scan(workers=options['workers'])
+        referenced = mediagc.references()
+        collectable, recent = mediagc.unreferenced(files, referenced, options['grace_days'])
+        collectable.sort(key=lambda file: file.name)
+
+        self.stdout.write(
+            f"Scanned {len(files)} files ({filesizeformat(sum(file.size for file in files))}); "
+            f"{len(collectable) + len(recent)} unreferenced, {len(recent)} of them within the "
+            f"{options['grace_days']}-day grace period"
+        )
+        if options['verbosity'] > 1:
+            for file in collectable:
+                self.stdout.write(f"  {file.name} ({filesizeformat(file.size)})")
+
+        size = sum(file.size for file in collectable)
+        if not (options['quarantine'] or options['delete']):
+            self.stdout.write(self.style.SUCCESS(
+                f"Would reclaim {filesizeformat(size)} in {len(collectable)} files "
+                f"(dry run: pass --quarantine or --delete)"
+            ))
+            return
+
+        target = mediagc.quarantine_dir() if options['quarantine'] else None
+        removed = mediagc.remove(collectable, quarantine_to=target)
+        size = sum(file.size for file in removed)
+        action = f"Moved to {target}" if target else "Deleted"
+        self.stdout.write(self.style.SUCCESS(
+            f"{action}: {len(removed)} files, reclaimed {filesizeformat(size)}"
+        ))
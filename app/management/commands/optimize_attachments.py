@@ -0,0 +1,50 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.template.defaultfilters import filesizeformat
+from django_summernote.utils import get_attachment_model
+
+from app import attachments
+
+
+def _process(file, force):
+    try:
+        return attachments.process(file, force=force)
+    finally:
+        # Worker threads open their own connections.
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        "Cap and re-encode the existing Summernote uploads and make their srcset derivatives, "
+        "in parallel. Uploads processed before are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=min(8, os.cpu_count() or 1),
+                            help="Images processed at once (default: CPUs, at most 8).")
+        parser.add_argument('--force', action='store_true',
+                            help="Process uploads again even if done before (re-encoding loses quality).")
+
+    def handle(self, *args, **options):
+        files = [attachment.file for attachment in get_attachment_model().objects.order_by('pk') if attachment.file]
+        processed = before = after = derivative_bytes = 0
+        with ThreadPoolExecutor(max_workers=max(options['workers'], 1)) as pool:
+            for result in pool.map(lambda file: _process(file, options['force']), files):
+                if result is None:
+                    continue
+                processed += 1
+                before += result.before
+                after += result.after
+                derivative_bytes += result.derivative_bytes
+                if options['verbosity'] > 1:
+                    self.stdout.write(f"{result.name}: {filesizeformat(result.before)} -> {filesizeformat(result.after)}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Optimized {processed} of {len(files)} uploads: {filesizeformat(before)} -> "
+            f"{filesizeformat(after)} (saved {filesizeformat(before - after)}); "
+            f"derivatives take {filesizeformat(derivative_bytes)}"
+        ))
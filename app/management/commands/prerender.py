@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from app import prerender
+
+
+class Command(BaseCommand):
+    help = "Render every public page to PRERENDER_ROOT as HTML with gzip/brotli siblings."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths', nargs='*',
+            help="Only re-render these URL paths (e.g. /products/ /blog/my-post/).",
+        )
+        parser.add_argument(
+            '--clean', action='store_true',
+            help="Remove rendered pages that no longer correspond to a public URL.",
+        )
+        parser.add_argument(
+            '--clear', action='store_true',
+            help="Delete PRERENDER_ROOT entirely and exit.",
+        )
+
+    def handle(self, *args, **options):
+        root = prerender.get_root()
+        if options['clear']:
+            prerender.clear(root)
+            self.stdout.write(self.style.SUCCESS(f"Removed {root}"))
+            return
+
+        if options['paths']:
+            written, removed = prerender.build_paths(options['paths'], root)
+        else:
+            written, removed = prerender.build_all(root, clean=options['clean'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Pre-rendered {written} pages into {root} ({removed} removed)"
+        ))
@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from app import changes
+from app.models import DeletionLog
+
+
+class Command(BaseCommand):
+    help = "Delete deletion-log tombstones older than any sync token still accepted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=changes.TOKEN_MAX_AGE_DAYS,
+            help=f"Keep tombstones this many days (default: {changes.TOKEN_MAX_AGE_DAYS}, the sync token lifetime).",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        deleted, _ = DeletionLog.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f"Removed {deleted} tombstones older than {options['days']} days"))
@@ -0,0 +1,30 @@
+import shutil
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app import artifacts
+
+
+class Command(BaseCommand):
+    help = "Write the current version of each pre-serialized API payload to ARTIFACTS_ROOT."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'names', nargs='*',
+            help=f"Only publish these artifacts ({', '.join(artifacts.ARTIFACTS)}).",
+        )
+        parser.add_argument(
+            '--clear', action='store_true',
+            help="Delete ARTIFACTS_ROOT first, so every artifact is written from scratch.",
+        )
+
+    def handle(self, *args, **options):
+        unknown = set(options['names']) - set(artifacts.ARTIFACTS)
+        if unknown:
+            raise CommandError(f"Unknown artifact(s): {', '.join(sorted(unknown))}")
+        root = artifacts.get_root()
+        if options['clear']:
+            shutil.rmtree(root, ignore_errors=True)
+        for path in artifacts.publish_all(options['names'] or None):
+            self.stdout.write(f"{path.relative_to(root)} ({path.stat().st_size} bytes)")
+        self.stdout.write(self.style.SUCCESS(f"Published into {root}"))
@@ -0,0 +1,52 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from app import generations, prerender, richtext
+from app.signals import MODEL_GENERATIONS
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the *_html variants of the rich-text fields (sanitized, minified, images with "
+        "lazy loading, intrinsic size and srcset). Saves do this already; run it after upgrading "
+        "or changing app/richtext.py."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--missing', action='store_true',
+                            help="Only rows whose rendered variant is still empty.")
+        parser.add_argument('--batch-size', type=int, default=200,
+                            help="Rows rendered per update batch (default 200).")
+
+    def handle(self, *args, **options):
+        for label, fields in richtext.FIELDS.items():
+            model = apps.get_model(label)
+            queryset = model.objects.order_by('pk').only('pk', *fields, *fields.values())
+            rendered = changed = 0
+            batch = []
+            for instance in queryset.iterator(chunk_size=options['batch_size']):
+                if options['missing'] and all(getattr(instance, target) for target in fields.values()):
+                    continue
+                before = [getattr(instance, target) for target in fields.values()]
+                richtext.render_fields(instance)
+                rendered += 1
+                if before != [getattr(instance, target) for target in fields.values()]:
+                    batch.append(instance)
+                if len(batch) >= options['batch_size']:
+                    changed += self._flush(model, batch, fields)
+            changed += self._flush(model, batch, fields)
+
+            # bulk_update sends no signals: move the cached pages on by hand
+            if changed and model in MODEL_GENERATIONS:
+                generations.bump_generation(*MODEL_GENERATIONS[model])
+            self.stdout.write(f"{model._meta.verbose_name_plural}: rendered {rendered}, updated {changed}")
+
+        if prerender.is_enabled():
+            self.stdout.write("Run `manage.py prerender` to refresh the pre-rendered pages.")
+
+    def _flush(self, model, batch, fields):
+        count = len(batch)
+        if batch:
+            model.objects.bulk_update(batch, list(fields.values()))
+            batch.clear()
+        return count
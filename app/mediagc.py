@@ -0,0 +1,189 @@
+"""
+Garbage collection of unreferenced files in MEDIA_ROOT.
+
+Files outlive the rows that pointed at them: replacing a product image or a
+price list PDF leaves the old file behind, ``Product.save`` writes a new
+cropped copy of the image every time, deleted posts keep their featured
+image, and derivatives stay after their source is gone. ``references``
+collects every name still in use: the values of every ``FileField`` (product
+images, featured images, price list PDFs, Summernote attachments), the
+derivatives of those, and the MEDIA_URL links in the rich-text HTML.
+``scan`` walks MEDIA_ROOT with one thread per top-level directory, and
+``unreferenced`` keeps the files nobody points at that are older than the
+grace period, so an upload whose row isn't committed yet is never touched.
+
+References are collected after the scan: a file uploaded meanwhile is newer
+than the grace period anyway, and one referenced meanwhile is seen.
+"""
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db import models
+from django.utils import timezone
+
+from . import imaging, richtext
+
+# HTML fields that may link MEDIA_URL files, besides the rich-text ones
+HTML_FIELDS = {
+    'app.pageseo': ('content1', 'content2', 'content3', 'content4', 'content5'),
+}
+
+
+class MediaFile:
+    __slots__ = ('name', 'size', 'mtime')
+
+    def __init__(self, name, size, mtime):
+        self.name = name
+        self.size = size
+        self.mtime = mtime
+
+
+def get_root():
+    return Path(settings.MEDIA_ROOT)
+
+
+def _file_fields():
+    """``(model, field)`` of every ``FileField`` stored in MEDIA_ROOT."""
+    root = os.path.realpath(settings.MEDIA_ROOT)
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if not isinstance(field, models.FileField):
+                continue
+            storage = field.storage
+            if isinstance(storage, FileSystemStorage) and os.path.realpath(storage.location) == root:
+                yield model, field
+
+
+def _linked_names(html, pattern):
+    for src in pattern.findall(html or ''):
+        name = richtext.media_name(src)
+        if name:
+            yield name
+
+
+def references():
+    """The names (relative to MEDIA_ROOT) of the files still in use."""
+    names = set()
+    for model, field in _file_fields():
+        names.update(
+            model._default_manager.exclude(**{field.attname: ''}).exclude(**{f'{field.attname}__isnull': True})
+            .values_list(field.attname, flat=True).iterator()
+        )
+
+    # Links in the HTML: sources as the editor wrote them and rendered
+    # variants (whose srcset lists the derivatives, dropped by media_name)
+    pattern = re.compile(re.escape(settings.MEDIA_URL) + r'''[^"'\s<>),]+''')
+    html_fields = {label: (*fields, *fields.values()) for label, fields in richtext.FIELDS.items()}
+    html_fields.update(HTML_FIELDS)
+    for label, fields in html_fields.items():
+        for row in apps.get_model(label)._default_manager.values_list(*fields).iterator():
+            for html in row:
+                names.update(_linked_names(html, pattern))
+
+    # Derivatives of what's in use, recorded or not
+    sources = set(names)
+    names.update(
+        apps.get_model('app', 'ImageDerivative').objects.filter(source__in=sources).values_list('name', flat=True)
+    )
+    names.update(imaging.derivative_name(name, width) for name in sources for width in imaging.WIDTHS)
+    return names
+
+
+def _walk(path, root):
+    found = []
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    name = Path(os.path.relpath(entry.path, root)).as_posix()
+                    found.append(MediaFile(name, stat.st_size, stat.st_mtime))
+    return found
+
+
+def scan(root=None, workers=None):
+    """Every file under ``root`` (MEDIA_ROOT) as ``MediaFile``, one thread per top-level directory."""
+    root = str(root or get_root())
+    if not os.path.isdir(root):
+        return []
+    files, directories = [], []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                directories.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                stat = entry.stat(follow_symlinks=False)
+                files.append(MediaFile(entry.name, stat.st_size, stat.st_mtime))
+    with ThreadPoolExecutor(max_workers=max(workers or min(8, os.cpu_count() or 1), 1)) as pool:
+        for found in pool.map(lambda path: _walk(path, root), directories):
+            files.extend(found)
+    return files
+
+
+def unreferenced(files, referenced, grace_days=None):
+    """``(collectable, recent)``: files not in ``referenced``, older than the grace period or not."""
+    if grace_days is None:
+        grace_days = settings.MEDIA_GC_GRACE_DAYS
+    cutoff = (timezone.now() - timedelta(days=grace_days)).timestamp()
+    collectable, recent = [], []
+    for file in files:
+        if file.name not in referenced:
+            (collectable if file.mtime < cutoff else recent).append(file)
+    return collectable, recent
+
+
+def _prune_directories(path, root):
+    """Remove the directories ``path`` leaves empty, up to ``root``."""
+    directory = os.path.dirname(path)
+    while directory != root and directory.startswith(root + os.sep):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            return
+        directory = os.path.dirname(directory)
+
+
+def remove(files, quarantine_to=None):
+    """
+    Delete ``files``, or move them under ``quarantine_to`` (same relative
+    names) when given. Returns the ``MediaFile``s removed; files gone or
+    changed since the scan are left out.
+    """
+    root = str(get_root())
+    removed = []
+    for file in files:
+        path = os.path.join(root, file.name)
+        try:
+            if os.stat(path).st_mtime != file.mtime:
+                continue
+            if quarantine_to is None:
+                os.unlink(path)
+            else:
+                target = os.path.join(quarantine_to, file.name)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.move(path, target)
+        except FileNotFoundError:
+            continue
+        removed.append(file)
+        _prune_directories(path, root)
+
+    names = [file.name for file in removed]
+    ImageDerivative = apps.get_model('app', 'ImageDerivative')
+    for start in range(0, len(names), 500):
+        ImageDerivative.objects.filter(name__in=names[start:start + 500]).delete()
+    return removed
+
+
+def quarantine_dir():
+    """A fresh directory under MEDIA_QUARANTINE_ROOT for one run."""
+    return os.path.join(settings.MEDIA_QUARANTINE_ROOT, timezone.localtime().strftime('%Y%m%d-%H%M%S'))
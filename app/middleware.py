@@ -0,0 +1,100 @@
+import os
+
+from django.conf import settings
+from django.http import FileResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+from . import compression, prerender
+
+
+class PrerenderMiddleware:
+    """
+    Serve pre-rendered pages (see ``app.prerender``) to anonymous visitors.
+
+    Requests with a query string or a session cookie fall through to the
+    views, so admins always see live pages. When nginx serves
+    ``PRERENDER_ROOT`` through ``try_files`` this middleware is only the
+    fallback for setups without it.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.serve(request) if prerender.is_enabled() else None
+        if response is None:
+            response = self.get_response(request)
+        return response
+
+    def serve(self, request):
+        if request.method not in ('GET', 'HEAD') or request.META.get('QUERY_STRING'):
+            return None
+        if settings.SESSION_COOKIE_NAME in request.COOKIES:
+            return None
+        if not request.path.endswith('/'):
+            return None
+        try:
+            target = prerender.file_for_path(request.path)
+            stat = os.stat(target)
+        except (ValueError, OSError):
+            return None
+
+        encodings = compression.accepted_encodings(request)
+        filename, encoding = str(target), None
+        for coding, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if coding in encodings and os.path.exists(filename + suffix):
+                filename, encoding = filename + suffix, coding
+                break
+
+        # Each encoding is a distinct representation, so it gets its own tag.
+        etag = '"%x-%x%s"' % (stat.st_mtime_ns, stat.st_size, '-' + encoding if encoding else '')
+        last_modified = http_date(stat.st_mtime)
+        conditional = get_conditional_response(request, etag=etag, last_modified=int(stat.st_mtime))
+        if conditional is not None:
+            conditional['ETag'] = etag
+            return conditional
+
+        response = FileResponse(open(filename, 'rb'), content_type='text/html; charset=utf-8')
+        if encoding:
+            response['Content-Encoding'] = encoding
+        response['ETag'] = etag
+        response['Last-Modified'] = last_modified
+        response['Cache-Control'] = 'public, max-age=0, must-revalidate'
+        response['X-Prerendered'] = '1'
+        patch_vary_headers(response, ('Accept-Encoding', 'Cookie'))
+        return response
+
+
+class CompressionMiddleware:
+    """
+    Compress text responses with brotli or gzip (see ``app.compression``).
+
+    Streaming, already encoded and small responses pass through untouched.
+    Responses served from ``cache_view`` bring their compressed bytes along,
+    so only uncached responses are compressed per request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if not compression.is_compressible(response):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        coding = compression.negotiate(request)
+        if coding is None:
+            return response
+        body = compression.encoded_body(response, coding)
+        if body is None:
+            return response
+
+        response.content = body
+        response['Content-Length'] = str(len(body))
+        response['Content-Encoding'] = coding
+        # The encoded body is a different representation of the same resource.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0035_relatedpost'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('last_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Job Checkpoint',
+                'verbose_name_plural': 'Job Checkpoints',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductCooccurrence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Product Co-occurrence',
+                'verbose_name_plural': 'Product Co-occurrences',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('rank', models.PositiveSmallIntegerField()),
+            ],
+            options={
+                'verbose_name': 'Product Recommendation',
+                'verbose_name_plural': 'Product Recommendations',
+                'ordering': ['product', 'rank'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='enquiry',
+            index=models.Index(fields=['email', 'submitted_date'], name='enquiry_email_date_idx'),
+        ),
+        migrations.AddField(
+            model_name='productcooccurrence',
+            name='other',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='app.product'),
+        ),
+        migrations.AddField(
+            model_name='productcooccurrence',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='app.product'),
+        ),
+        migrations.AddField(
+            model_name='productrecommendation',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='app.product'),
+        ),
+        migrations.AddField(
+            model_name='productrecommendation',
+            name='recommended',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='app.product'),
+        ),
+        migrations.AddConstraint(
+            model_name='productcooccurrence',
+            constraint=models.UniqueConstraint(fields=('product', 'other'), name='unique_product_cooccurrence'),
+        ),
+        migrations.AddConstraint(
+            model_name='productrecommendation',
+            constraint=models.UniqueConstraint(fields=('product', 'rank'), name='unique_product_recommendation_rank'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_sku_normalized(apps, schema_editor):
+    # Products are few; enquiries are linked by ``manage.py backfill_skus``.
+    Product = apps.get_model('app', 'Product')
+    products = list(Product.objects.only('id', 'sku'))
+    for product in products:
+        product.sku_normalized = (product.sku or '').strip().upper()
+    Product.objects.bulk_update(products, ['sku_normalized'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0036_product_recommendations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='enquiry',
+            name='product',
+            field=models.ForeignKey(blank=True, help_text='Product the SKU resolved to when the enquiry was received', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='enquiries', to='app.product'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='sku_normalized',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=100),
+        ),
+        migrations.RunPython(fill_sku_normalized, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0037_sku_lookup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContactDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('is_responded', models.BooleanField(default=False)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Contact Daily Rollup',
+                'verbose_name_plural': 'Contact Daily Rollups',
+                'ordering': ['-day'],
+            },
+        ),
+        migrations.CreateModel(
+            name='EnquiryDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('sku', models.CharField(blank=True, help_text='Normalized SKU, blank for general enquiries', max_length=100)),
+                ('is_responded', models.BooleanField(default=False)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Enquiry Daily Rollup',
+                'verbose_name_plural': 'Enquiry Daily Rollups',
+                'ordering': ['-day'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RollupDirtyDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=20)),
+                ('day', models.DateField()),
+            ],
+            options={
+                'verbose_name': 'Rollup Dirty Day',
+                'verbose_name_plural': 'Rollup Dirty Days',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='contactformsubmission',
+            index=models.Index(fields=['submitted_date'], name='contact_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enquiry',
+            index=models.Index(fields=['submitted_date'], name='enquiry_date_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='contactdailyrollup',
+            constraint=models.UniqueConstraint(fields=('day', 'is_responded'), name='unique_contact_rollup'),
+        ),
+        migrations.AddField(
+            model_name='enquirydailyrollup',
+            name='product',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='app.product'),
+        ),
+        migrations.AddConstraint(
+            model_name='rollupdirtyday',
+            constraint=models.UniqueConstraint(fields=('source', 'day'), name='unique_rollup_dirty_day'),
+        ),
+        migrations.AddConstraint(
+            model_name='enquirydailyrollup',
+            constraint=models.UniqueConstraint(fields=('day', 'sku', 'is_responded'), name='unique_enquiry_rollup'),
+        ),
+    ]
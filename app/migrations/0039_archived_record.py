@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0038_inbox_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=20)),
+                ('original_id', models.BigIntegerField()),
+                ('submitted_date', models.DateTimeField()),
+                ('is_responded', models.BooleanField(default=True)),
+                ('name', models.CharField(max_length=100)),
+                ('email', models.EmailField(max_length=254)),
+                ('subject', models.CharField(max_length=200)),
+                ('sku', models.CharField(blank=True, max_length=100)),
+                ('product_id', models.IntegerField(blank=True, null=True)),
+                ('partition', models.CharField(max_length=255)),
+                ('offset', models.BigIntegerField()),
+                ('line', models.PositiveIntegerField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Archived Record',
+                'verbose_name_plural': 'Archive',
+                'ordering': ['-submitted_date'],
+                'indexes': [models.Index(fields=['source', 'submitted_date'], name='archive_source_date_idx'), models.Index(fields=['email'], name='archive_email_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'original_id'), name='unique_archived_record')],
+            },
+        ),
+    ]
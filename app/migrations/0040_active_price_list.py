@@ -0,0 +1,43 @@
+# Generated by Django 5.2.6 on 2026-10-19 01:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_pointer(apps, schema_editor):
+    # The most recently updated active list wins; any other "active" one
+    # (possible under the old, non-atomic save) is switched off.
+    PriceList = apps.get_model('app', 'PriceList')
+    ActivePriceList = apps.get_model('app', 'ActivePriceList')
+    active = PriceList.objects.filter(is_active=True).order_by('-updated_date', '-pk').first()
+    if active is not None:
+        PriceList.objects.filter(is_active=True).exclude(pk=active.pk).update(is_active=False)
+    ActivePriceList.objects.update_or_create(pk=1, defaults={'price_list': active})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0039_archived_record'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pricelist',
+            name='is_active',
+            field=models.BooleanField(default=True, help_text='Saving an active price list makes it the one shown on the site'),
+        ),
+        migrations.CreateModel(
+            name='ActivePriceList',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('price_list', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='app.pricelist')),
+            ],
+            options={
+                'verbose_name': 'Active Price List',
+                'verbose_name_plural': 'Active Price List',
+            },
+        ),
+        migrations.RunPython(create_pointer, migrations.RunPython.noop),
+    ]
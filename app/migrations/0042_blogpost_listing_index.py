@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-19 02:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0041_deletion_log_and_change_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['status', 'published_date', 'id'], name='blogpost_listing_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.6 on 2026-10-19 02:07
+
+import app.richtext
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0042_blogpost_listing_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, help_text='Rendered content (app/richtext.py)'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, help_text='Rendered content (app/richtext.py)'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, help_text='Rendered description (app/richtext.py)'),
+        ),
+        migrations.AddField(
+            model_name='productcategory',
+            name='description_html',
+            field=models.TextField(blank=True, editable=False, help_text='Rendered description (app/richtext.py)'),
+        ),
+        migrations.AlterField(
+            model_name='blogpost',
+            name='content',
+            field=app.richtext.RichTextField(),
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='content',
+            field=app.richtext.RichTextField(),
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='description',
+            field=app.richtext.RichTextField(),
+        ),
+        migrations.AlterField(
+            model_name='productcategory',
+            name='description',
+            field=app.richtext.RichTextField(),
+        ),
+    ]
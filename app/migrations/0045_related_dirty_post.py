@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-19 02:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0044_image_derivative'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedDirtyPost',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('post_id', models.BigIntegerField(unique=True)),
+                ('queued_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Related Dirty Post',
+                'verbose_name_plural': 'Related Dirty Posts',
+            },
+        ),
+    ]
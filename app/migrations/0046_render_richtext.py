@@ -0,0 +1,36 @@
+from django.db import migrations
+from django.db.models import Q
+
+from app import richtext
+
+# Fields as of 0043: model -> {source: rendered}
+FIELDS = {
+    'ProductCategory': {'description': 'description_html'},
+    'Product': {'description': 'description_html', 'content': 'content_html'},
+    'BlogPost': {'content': 'content_html'},
+}
+
+
+def render_missing(apps, schema_editor):
+    # Pages output the rendered fields only (the sources are unsanitized), so
+    # rows saved before they existed get them now.
+    for model_name, fields in FIELDS.items():
+        model = apps.get_model('app', model_name)
+        missing = Q()
+        for source, target in fields.items():
+            missing |= Q(**{target: ''}) & ~Q(**{source: ''}) & Q(**{f'{source}__isnull': False})
+        for row in model.objects.filter(missing).values('pk', *fields).iterator():
+            model.objects.filter(pk=row['pk']).update(
+                **{target: richtext.render(row[source]) for source, target in fields.items()}
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0045_related_dirty_post'),
+    ]
+
+    operations = [
+        migrations.RunPython(render_missing, migrations.RunPython.noop),
+    ]
@@ -1,16 +1,24 @@
-from django.db import models
+from django.db import models, transaction
 from PIL import Image
 from io import BytesIO
 from django.core.files.base import ContentFile
 from django.utils.text import slugify
-from django_summernote.fields import SummernoteTextField
 import os
 
+from . import richtext
+from .richtext import RichTextField
+
+
+def normalize_sku(sku):
+    """Canonical form SKUs are matched on: surrounding whitespace dropped, upper case."""
+    return (sku or '').strip().upper()
+
 # Create your models here.
 class ProductCategory(models.Model):
     """ Product Category model with name, description, slug, icon, and SEO fields """
     name = models.CharField(max_length=100)
-    description = SummernoteTextField()
+    description = RichTextField()
+    description_html = models.TextField(blank=True, editable=False, help_text="Rendered description (app/richtext.py)")
     slug = models.SlugField(unique=True)
     icon = models.CharField(max_length=100, blank=True, null=True)  # Assuming you store icon class names or paths
     
@@ -33,6 +41,7 @@ class ProductCategory(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)
+        richtext.render_fields(self)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -52,7 +61,7 @@ class Product(models.Model):
         sku (CharField): Stock Keeping Unit, unique identifier for the product.
         slug (SlugField): URL-friendly unique identifier, auto-generated from name if blank.
         description (TextField): Short description of the product.
-        content (SummernoteTextField): Rich text content for detailed product information.
+        content (RichTextField): Rich text content for detailed product information.
         category (ForeignKey): Reference to the product's category.
         image (ImageField): Product image, auto-cropped to square on save.
         status (ForeignKey): Current status of the product (e.g., available, out of stock).
@@ -61,9 +70,12 @@ class Product(models.Model):
     """
     name = models.CharField(max_length=200)
     sku = models.CharField(max_length=100,unique=False, help_text="Stock Keeping Unit - unique product identifier")
+    sku_normalized = models.CharField(max_length=100, blank=True, editable=False, db_index=True)
     slug = models.SlugField(unique=True, blank=True)  # Allow blank so it can be auto-filled
-    description =SummernoteTextField()
-    content=SummernoteTextField()  # Rich text with Summernote
+    description =RichTextField()
+    content=RichTextField()  # Rich text with Summernote
+    description_html = models.TextField(blank=True, editable=False, help_text="Rendered description (app/richtext.py)")
+    content_html = models.TextField(blank=True, editable=False, help_text="Rendered content (app/richtext.py)")
     category = models.ForeignKey(ProductCategory, on_delete=models.CASCADE, related_name='products')
     image = models.ImageField(upload_to='products/')
 
@@ -81,6 +93,8 @@ class Product(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.name)
+        self.sku_normalized = normalize_sku(self.sku)
+        richtext.render_fields(self)
 
         if self.image:
             # Open and crop image
@@ -119,6 +133,10 @@ class Product(models.Model):
         verbose_name = "Product"
         verbose_name_plural = "Products"
         ordering = ['name']
+        indexes = [
+            # Delta sync walks (updated_at, id); see app/changes.py
+            models.Index(fields=['updated_at', 'id'], name='product_updated_idx'),
+        ]
 
 class ProductStatus(models.Model):
     name = models.CharField(max_length=100)
@@ -162,7 +180,8 @@ class BlogPost(models.Model):
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True, blank=True)
     excerpt = models.TextField(max_length=300, help_text="Brief description for preview")
-    content = SummernoteTextField()  # Rich text with Summernote
+    content = RichTextField()  # Rich text with Summernote
+    content_html = models.TextField(blank=True, editable=False, help_text="Rendered content (app/richtext.py)")
     category = models.ForeignKey(BlogCategory, on_delete=models.CASCADE, related_name='posts')
     featured_image = models.ImageField(upload_to='blog/', blank=True, null=True)
     author = models.CharField(max_length=100)
@@ -186,6 +205,7 @@ class BlogPost(models.Model):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        richtext.render_fields(self)
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -198,13 +218,56 @@ class BlogPost(models.Model):
         verbose_name = "Blog Post"
         verbose_name_plural = "Blog Posts"
         ordering = ['-published_date']
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='blogpost_updated_idx'),
+            models.Index(fields=['status', 'published_date', 'id'], name='blogpost_listing_idx'),
+        ]
+
+class RelatedPost(models.Model):
+    """
+    Precomputed "related posts" for a blog post, ranked by TF-IDF cosine
+    similarity. Maintained by ``manage.py build_related``; saved posts are
+    queued as ``RelatedDirtyPost`` for its next ``--pending`` run (see
+    app/related.py).
+    """
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='related_entries')
+    related = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='+')
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    def __str__(self):
+        return f"{self.post} -> {self.related} ({self.score:.3f})"
+
+    class Meta:
+        verbose_name = "Related Post"
+        verbose_name_plural = "Related Posts"
+        ordering = ['post', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'rank'], name='unique_related_post_rank'),
+        ]
+
+
+class RelatedDirtyPost(models.Model):
+    """
+    A blog post saved or deleted since the related posts were last built;
+    ``build_related --pending`` rebuilds them while any is queued.
+    """
+    post_id = models.BigIntegerField(unique=True)
+    queued_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"post {self.post_id}"
+
+    class Meta:
+        verbose_name = "Related Dirty Post"
+        verbose_name_plural = "Related Dirty Posts"
 
 class PriceList(models.Model):
     title = models.CharField(max_length=200, default="Price List")
     pdf_file = models.FileField(upload_to='price_lists/', help_text="Upload price list PDF")
     version = models.CharField(max_length=50, help_text="Version number (e.g., v1.0, 2024-Q1)")
     description = models.TextField(blank=True, help_text="Brief description of this price list")
-    is_active = models.BooleanField(default=True, help_text="Only one price list should be active")
+    is_active = models.BooleanField(default=True, help_text="Saving an active price list makes it the one shown on the site")
 
     """SEO Fields"""
     seo_meta_title = models.CharField(max_length=100, blank=True, null=True)
@@ -220,10 +283,15 @@ class PriceList(models.Model):
             return [tag.strip() for tag in self.seo_meta_keywords.split(',') if tag.strip()]
         return []
     def save(self, *args, **kwargs):
-        if self.is_active:
-            # Set all other price lists to inactive
-            PriceList.objects.exclude(pk=self.pk).update(is_active=False)
-        super().save(*args, **kwargs)
+        # Lock the pointer before touching any list, so concurrent saves of
+        # active lists run one after the other and exactly one stays active.
+        with transaction.atomic():
+            pointer = ActivePriceList.lock()
+            super().save(*args, **kwargs)
+            if self.is_active:
+                pointer.switch_to(self)
+            elif pointer.price_list_id == self.pk:
+                pointer.switch_to(None)
 
     def __str__(self):
         return f"{self.title} - {self.version}"
@@ -233,6 +301,40 @@ class PriceList(models.Model):
         verbose_name_plural = "Price Lists"
         ordering = ['-upload_date']
 
+
+class ActivePriceList(models.Model):
+    """
+    Single-row pointer to the price list shown on the site. ``is_active`` on
+    the lists mirrors it for the admin; both are only changed with this row
+    locked (``select_for_update``) inside one transaction.
+    """
+    SINGLETON_PK = 1
+
+    price_list = models.OneToOneField(PriceList, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @classmethod
+    def lock(cls):
+        """Return the pointer row locked for update. Call inside ``transaction.atomic()``."""
+        pointer, _ = cls.objects.select_for_update().get_or_create(pk=cls.SINGLETON_PK)
+        return pointer
+
+    def switch_to(self, price_list):
+        """Make ``price_list`` (or nothing, for ``None``) the active list."""
+        others = PriceList.objects.filter(is_active=True)
+        if price_list is not None:
+            others = others.exclude(pk=price_list.pk)
+        others.update(is_active=False)
+        self.price_list = price_list
+        self.save()
+
+    def __str__(self):
+        return f"Active: {self.price_list or 'none'}"
+
+    class Meta:
+        verbose_name = "Active Price List"
+        verbose_name_plural = "Active Price List"
+
 class ContactFormSubmission(models.Model):
     """Contact form submissions from website visitors"""
     name = models.CharField(max_length=100)
@@ -249,10 +351,14 @@ class ContactFormSubmission(models.Model):
         verbose_name = "Contact Form Submission"
         verbose_name_plural = "Contact Form Submissions"
         ordering = ['-submitted_date']
+        indexes = [
+            models.Index(fields=['submitted_date'], name='contact_date_idx'),
+        ]
 
 
 class Enquiry(models.Model):
     sku=models.CharField(max_length=100, blank=True, null=True)
+    product = models.ForeignKey(Product, on_delete=models.SET_NULL, null=True, blank=True, related_name='enquiries', help_text="Product the SKU resolved to when the enquiry was received")
     name = models.CharField(max_length=100)
     email = models.EmailField()
     phone = models.CharField(max_length=20, blank=True)
@@ -266,11 +372,213 @@ class Enquiry(models.Model):
         verbose_name = "Enquiry"
         verbose_name_plural = "Enquiries"
         ordering = ['-submitted_date']
+        indexes = [
+            models.Index(fields=['email', 'submitted_date'], name='enquiry_email_date_idx'),
+            models.Index(fields=['submitted_date'], name='enquiry_date_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.subject}"
 
 
+class JobCheckpoint(models.Model):
+    """
+    Watermark of an incremental background job: the highest source row id it
+    has fully processed, so the next run picks up from there.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    last_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.last_id}"
+
+    class Meta:
+        verbose_name = "Job Checkpoint"
+        verbose_name_plural = "Job Checkpoints"
+        ordering = ['name']
+
+
+class ProductCooccurrence(models.Model):
+    """
+    How many people enquired about both ``product`` and ``other`` within one
+    enquiry window. Stored in both directions so each product's row set is a
+    single index range. Maintained by ``manage.py build_recommendations``.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    other = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.product} + {self.other}: {self.count}"
+
+    class Meta:
+        verbose_name = "Product Co-occurrence"
+        verbose_name_plural = "Product Co-occurrences"
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'other'], name='unique_product_cooccurrence'),
+        ]
+
+
+class ProductRecommendation(models.Model):
+    """Precomputed "frequently enquired together" products, best first."""
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='recommendations')
+    recommended = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='+')
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    def __str__(self):
+        return f"{self.product} -> {self.recommended} ({self.score:.3f})"
+
+    class Meta:
+        verbose_name = "Product Recommendation"
+        verbose_name_plural = "Product Recommendations"
+        ordering = ['product', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'rank'], name='unique_product_recommendation_rank'),
+        ]
+
+
+class EnquiryDailyRollup(models.Model):
+    """
+    Enquiries per day, SKU and response status. Kept up to date by
+    ``manage.py rollup_inbox``; the admin dashboard reads only these rows.
+    """
+    day = models.DateField()
+    sku = models.CharField(max_length=100, blank=True, help_text="Normalized SKU, blank for general enquiries")
+    product = models.ForeignKey(Product, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    is_responded = models.BooleanField(default=False)
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.day} {self.sku or 'General'}: {self.count}"
+
+    class Meta:
+        verbose_name = "Enquiry Daily Rollup"
+        verbose_name_plural = "Enquiry Daily Rollups"
+        ordering = ['-day']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'sku', 'is_responded'], name='unique_enquiry_rollup'),
+        ]
+
+
+class ContactDailyRollup(models.Model):
+    """Contact form submissions per day and response status (see ``EnquiryDailyRollup``)."""
+    day = models.DateField()
+    is_responded = models.BooleanField(default=False)
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.day}: {self.count}"
+
+    class Meta:
+        verbose_name = "Contact Daily Rollup"
+        verbose_name_plural = "Contact Daily Rollups"
+        ordering = ['-day']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'is_responded'], name='unique_contact_rollup'),
+        ]
+
+
+class RollupDirtyDay(models.Model):
+    """
+    A day whose already rolled-up rows changed (response status toggled,
+    rows deleted); ``rollup_inbox`` recounts it from scratch.
+    """
+    source = models.CharField(max_length=20)
+    day = models.DateField()
+
+    def __str__(self):
+        return f"{self.source} {self.day}"
+
+    class Meta:
+        verbose_name = "Rollup Dirty Day"
+        verbose_name_plural = "Rollup Dirty Days"
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'day'], name='unique_rollup_dirty_day'),
+        ]
+
+
+class DeletionLog(models.Model):
+    """
+    Tombstone of a deleted row, so delta-sync clients (app/changes.py) learn
+    about deletions. Written by a ``post_delete`` handler in the deleting
+    transaction; pruned by ``manage.py prune_deletion_log``.
+    """
+    model = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"{self.model} #{self.object_id}"
+
+    class Meta:
+        verbose_name = "Deletion Log Entry"
+        verbose_name_plural = "Deletion Log"
+        indexes = [
+            models.Index(fields=['model', 'id'], name='deletionlog_model_idx'),
+        ]
+
+
+class ImageDerivative(models.Model):
+    """
+    A stored variant of an uploaded image: a resized copy for ``srcset``
+    (app/imaging.py), or the capped, re-encoded original itself (``name ==
+    source``), whose row marks the source as processed. Written by
+    app/attachments.py and ``manage.py optimize_attachments``.
+    """
+    source = models.CharField(max_length=255, db_index=True)
+    name = models.CharField(max_length=255, unique=True)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    size = models.PositiveIntegerField(help_text="Bytes")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        verbose_name = "Image Derivative"
+        verbose_name_plural = "Image Derivatives"
+
+
+class ArchivedRecord(models.Model):
+    """
+    Index entry of an enquiry or contact submission moved out of its table by
+    ``manage.py archive_inbox``. The full row lives in a gzip JSONL partition
+    under ``ARCHIVE_ROOT``; ``offset`` is the start of the gzip member holding
+    it and ``line`` its position inside that member (see app/archive.py).
+    """
+    source = models.CharField(max_length=20)
+    original_id = models.BigIntegerField()
+    submitted_date = models.DateTimeField()
+    is_responded = models.BooleanField(default=True)
+    name = models.CharField(max_length=100)
+    email = models.EmailField()
+    subject = models.CharField(max_length=200)
+    sku = models.CharField(max_length=100, blank=True)
+    product_id = models.IntegerField(null=True, blank=True)
+    partition = models.CharField(max_length=255)
+    offset = models.BigIntegerField()
+    line = models.PositiveIntegerField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} - {self.subject}"
+
+    class Meta:
+        verbose_name = "Archived Record"
+        verbose_name_plural = "Archive"
+        ordering = ['-submitted_date']
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'original_id'], name='unique_archived_record'),
+        ]
+        indexes = [
+            models.Index(fields=['source', 'submitted_date'], name='archive_source_date_idx'),
+            models.Index(fields=['email'], name='archive_email_idx'),
+        ]
+
+
 class PageSEO(models.Model):
     """Custom pages with SEO optimization"""
     title = models.CharField(max_length=200)
@@ -0,0 +1,294 @@
+"""
+Static pre-rendering of the public pages.
+
+Every public URL is rendered to ``PRERENDER_ROOT/<path>/index.html`` with
+``.gz`` and ``.br`` siblings, so nginx (``try_files``) or
+``PrerenderMiddleware`` can answer anonymous page views without running a
+view. ``paths_for_instance`` maps a changed model instance to the pages that
+show it; the signal handlers feed those paths to a debouncer which re-renders
+only them.
+"""
+import gzip
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404
+from django.test import RequestFactory
+from django.urls import Resolver404, resolve, reverse
+
+from .debounce import Debouncer
+from .models import (
+    BlogCategory, BlogPost, PageSEO, PriceList, Product, ProductCategory,
+    ProductStatus,
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = 'index.html'
+
+# PageSEO slugs that hold the content/SEO fields of a fixed route.
+PAGE_ROUTES = {
+    'home': 'home',
+    'about': 'about',
+    'products': 'products',
+    'blog': 'blog',
+    'price-list': 'price_list',
+}
+
+# Pages whose context includes the product catalog (categories, products).
+CATALOG_ROUTES = ('home', 'about', 'products')
+
+
+def get_root():
+    return Path(settings.PRERENDER_ROOT)
+
+
+def is_enabled():
+    return getattr(settings, 'PRERENDER_ENABLED', False)
+
+
+def file_for_path(path, root=None):
+    """Return the ``index.html`` file a URL path is pre-rendered to."""
+    root = Path(root or get_root())
+    relative = path.strip('/')
+    target = (root / relative / INDEX_FILE).resolve()
+    # Never let a crafted path escape the output directory.
+    if root.resolve() not in target.parents:
+        raise ValueError(f'{path!r} resolves outside {root}')
+    return target
+
+
+# ---------------------------------------------------------------------------
+# URL enumeration
+# ---------------------------------------------------------------------------
+
+def product_path(category_slug, product_slug):
+    return reverse('product_in_category', args=[category_slug, product_slug])
+
+
+def category_path(category_slug):
+    return reverse('category_products', args=[category_slug])
+
+
+def blog_post_path(slug):
+    return reverse('individual_blog', args=[slug])
+
+
+def blog_category_path(slug):
+    return reverse('blog_category', args=[slug])
+
+
+def catalog_paths():
+    """Every page that lists or shows catalog data."""
+    paths = {reverse(name) for name in CATALOG_ROUTES}
+    for slug in ProductCategory.objects.values_list('slug', flat=True):
+        paths.add(category_path(slug))
+    for category_slug, slug in Product.objects.values_list('category__slug', 'slug'):
+        paths.add(product_path(category_slug, slug))
+    return paths
+
+
+def blog_paths():
+    """The blog index, every blog category page and every published post."""
+    paths = {reverse('blog')}
+    for slug in BlogCategory.objects.values_list('slug', flat=True):
+        paths.add(blog_category_path(slug))
+    for slug in BlogPost.objects.filter(status='published').values_list('slug', flat=True):
+        paths.add(blog_post_path(slug))
+    return paths
+
+
+def page_paths():
+    """Fixed routes, plus any PageSEO row that backs one of them."""
+    paths = {reverse(name) for name in PAGE_ROUTES.values()}
+    for slug in PageSEO.objects.values_list('slug', flat=True):
+        if slug in PAGE_ROUTES:
+            paths.add(reverse(PAGE_ROUTES[slug]))
+    return paths
+
+
+def public_paths():
+    return sorted(page_paths() | catalog_paths() | blog_paths())
+
+
+def paths_for_instance(instance):
+    """
+    Return the URL paths whose rendered output depends on ``instance``.
+    Paths recorded before the change (old slugs/categories) are included so
+    their files get removed when they stop resolving.
+    """
+    paths = set(getattr(instance, '_prerender_old_paths', ()))
+
+    if isinstance(instance, Product):
+        paths.update(reverse(name) for name in CATALOG_ROUTES)
+        category = instance.category
+        paths.add(category_path(category.slug))
+        paths.add(product_path(category.slug, instance.slug))
+    elif isinstance(instance, ProductCategory):
+        paths.update(reverse(name) for name in CATALOG_ROUTES)
+        paths.add(category_path(instance.slug))
+        for slug in instance.products.values_list('slug', flat=True):
+            paths.add(product_path(instance.slug, slug))
+    elif isinstance(instance, ProductStatus):
+        paths.update(catalog_paths())
+    elif isinstance(instance, BlogPost):
+        paths.add(reverse('blog'))
+        paths.add(blog_category_path(instance.category.slug))
+        paths.add(blog_post_path(instance.slug))
+        # Posts in the same category list this one as a related post.
+        for slug in instance.category.posts.filter(status='published').values_list('slug', flat=True):
+            paths.add(blog_post_path(slug))
+    elif isinstance(instance, BlogCategory):
+        paths.update(blog_paths())
+    elif isinstance(instance, PriceList):
+        paths.add(reverse('price_list'))
+    elif isinstance(instance, PageSEO):
+        if instance.slug in PAGE_ROUTES:
+            paths.add(reverse(PAGE_ROUTES[instance.slug]))
+    return paths
+
+
+def remember_old_paths(instance):
+    """
+    Called before ``instance`` is saved: record the paths it used to live at
+    so a slug or category change also drops the old files.
+    """
+    if not instance.pk:
+        return
+    try:
+        old = type(instance).objects.get(pk=instance.pk)
+    except type(instance).DoesNotExist:
+        return
+    instance._prerender_old_paths = paths_for_instance(old)
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def render_path(path):
+    """
+    Render ``path`` the way an anonymous visitor would see it. Returns the
+    body bytes, or ``None`` when the path no longer resolves to a page.
+    """
+    factory = RequestFactory(HTTP_HOST=settings.PRERENDER_HOST)
+    request = factory.get(path, secure=True)
+    request.user = AnonymousUser()
+    # Never the stale response cache_view may serve right after a change
+    request.bypass_cache = True
+    try:
+        match = resolve(path)
+        response = match.func(request, *match.args, **match.kwargs)
+    except (Resolver404, Http404):
+        return None
+    if hasattr(response, 'render') and callable(response.render):
+        response.render()
+    if response.status_code != 200 or response.streaming:
+        return None
+    return response.content
+
+
+def _write_atomic(target, data):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, target)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def write_page(path, content, root=None):
+    """Write ``content`` and its precompressed variants for ``path``."""
+    target = file_for_path(path, root)
+    _write_atomic(target.with_name(INDEX_FILE + '.gz'), gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_atomic(target.with_name(INDEX_FILE + '.br'), brotli.compress(content, mode=brotli.MODE_TEXT))
+    # The plain file goes last: nginx and the middleware key off it.
+    _write_atomic(target, content)
+
+
+def remove_page(path, root=None):
+    target = file_for_path(path, root)
+    for name in (INDEX_FILE, INDEX_FILE + '.gz', INDEX_FILE + '.br'):
+        try:
+            (target.parent / name).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def build_paths(paths, root=None):
+    """Render ``paths``; pages that no longer exist are removed. Returns (written, removed)."""
+    written = removed = 0
+    for path in sorted(paths):
+        try:
+            content = render_path(path)
+        except Exception:
+            logger.exception('Pre-rendering %s failed', path)
+            continue
+        if content is None:
+            remove_page(path, root)
+            removed += 1
+        else:
+            write_page(path, content, root)
+            written += 1
+    return written, removed
+
+
+def prune(keep_paths, root=None):
+    """Delete rendered pages whose path is not in ``keep_paths``."""
+    root = Path(root or get_root())
+    keep = {file_for_path(path, root) for path in keep_paths}
+    removed = 0
+    for index in root.rglob(INDEX_FILE):
+        if index.resolve() not in keep:
+            for sibling in (index, index.with_name(INDEX_FILE + '.gz'), index.with_name(INDEX_FILE + '.br')):
+                if sibling.exists():
+                    sibling.unlink()
+            removed += 1
+    # Drop directories left empty by the removals.
+    for directory in sorted((p for p in root.rglob('*') if p.is_dir()), reverse=True):
+        if not any(directory.iterdir()):
+            directory.rmdir()
+    return removed
+
+
+def build_all(root=None, clean=False):
+    paths = public_paths()
+    written, removed = build_paths(paths, root)
+    if clean:
+        removed += prune(paths, root)
+    return written, removed
+
+
+def clear(root=None):
+    root = Path(root or get_root())
+    if root.exists():
+        shutil.rmtree(root)
+
+
+rebuild_queue = Debouncer(
+    build_paths,
+    delay=getattr(settings, 'PRERENDER_DEBOUNCE_SECONDS', 2.0),
+    name='prerender',
+)
+
+
+def schedule(paths):
+    """Queue ``paths`` for re-rendering once the current burst of saves settles."""
+    if paths:
+        rebuild_queue.add(*paths)
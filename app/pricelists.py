@@ -0,0 +1,26 @@
+"""
+The price list shown on the site.
+
+``ActivePriceList`` (a single locked row) says which list is live;
+``get_active_price_list`` caches the resolved list under the price-list
+generation, which every save or delete of a list bumps, so serving the page
+costs no query until the active list is switched or edited.
+"""
+from . import generations
+from .caching import get_or_recompute
+from .models import ActivePriceList
+
+CACHE_KEY = 'price_list:active'
+# The generation does the invalidating; the timeout only bounds staleness
+# if a bump was ever lost.
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _load():
+    pointer = ActivePriceList.objects.select_related('price_list').filter(pk=ActivePriceList.SINGLETON_PK).first()
+    return pointer.price_list if pointer else None
+
+
+def get_active_price_list():
+    """The active ``PriceList``, or ``None`` when no list is active."""
+    return get_or_recompute(CACHE_KEY, _load, timeout=CACHE_TIMEOUT, versions=(generations.PRICE_LIST,))
@@ -0,0 +1,226 @@
+"""
+"Frequently enquired together" product recommendations.
+
+Enquiries are linked to the product they are about (``Enquiry.product``;
+rows not backfilled yet are resolved from their SKU through the catalog
+snapshot). Two products co-occur when the same email address enquired about
+both within ``WINDOW`` of each other; the counts are kept in
+``ProductCooccurrence`` (a sparse, symmetric matrix) and the best ``TOP_N``
+neighbours of every product are stored in ``ProductRecommendation`` so pages
+read them with one indexed query.
+
+``process_new_enquiries`` is incremental: it walks enquiries in id order in
+chunks, starting after the id stored in the ``JobCheckpoint``, and commits
+the counts and the new watermark of each chunk together, so an interrupted
+run resumes where it stopped. Run it periodically with
+``manage.py build_recommendations``.
+"""
+import math
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .catalog import get_snapshot
+from .models import Enquiry, JobCheckpoint, ProductCooccurrence, ProductRecommendation
+
+CHECKPOINT = 'recommendations'
+WINDOW = timedelta(days=30)
+TOP_N = 8
+CHUNK_SIZE = 5000
+# Keeps ``email IN (...)`` well below the database's parameter limit.
+EMAIL_BATCH = 500
+
+
+def _email_key(email):
+    return (email or '').strip().lower()
+
+
+def _resolver():
+    snapshot = get_snapshot()
+    resolved = {}
+
+    def resolve(sku):
+        if sku not in resolved:
+            product = snapshot.product_by_sku(sku) if sku else None
+            resolved[sku] = product.id if product else None
+        return resolved[sku]
+    return resolve
+
+
+def _history(emails, before_id, since, resolve):
+    """Resolved enquiries of ``emails`` with id <= ``before_id`` since ``since``, grouped by email."""
+    history = defaultdict(list)
+    emails = sorted(emails)
+    for start in range(0, len(emails), EMAIL_BATCH):
+        rows = (
+            Enquiry.objects
+            .filter(email__in=emails[start:start + EMAIL_BATCH], id__lte=before_id, submitted_date__gte=since)
+            .order_by()
+            .values_list('id', 'email', 'product_id', 'sku', 'submitted_date')
+        )
+        for pk, email, product_id, sku, submitted in rows:
+            product_id = product_id or resolve(sku)
+            if product_id is not None:
+                history[_email_key(email)].append((pk, product_id, submitted))
+    for entries in history.values():
+        entries.sort()
+    return history
+
+
+def count_pairs(chunk, window, resolve):
+    """
+    Co-occurrence increments contributed by the enquiries in ``chunk``.
+
+    Each enquiry is paired with the earlier enquiries (lower id) of the same
+    email inside the window, so every pair is counted once no matter how the
+    enquiries are split into chunks. Asking about the same product again adds
+    nothing.
+    """
+    pairs = Counter()
+    if not chunk:
+        return pairs
+    history = _history(
+        {email for _, email, _, _, _ in chunk},
+        chunk[-1][0],
+        min(submitted for *_, submitted in chunk) - window,
+        resolve,
+    )
+    for pk, email, product_id, sku, submitted in chunk:
+        product_id = product_id or resolve(sku)
+        if product_id is None:
+            continue
+        earlier = {
+            other for other_pk, other, other_submitted in history.get(_email_key(email), ())
+            if other_pk < pk and other_submitted >= submitted - window
+        }
+        if product_id in earlier:
+            continue
+        for other in earlier:
+            pairs[product_id, other] += 1
+            pairs[other, product_id] += 1
+    return pairs
+
+
+def apply_counts(pairs):
+    """Add ``pairs`` (``{(product_id, other_id): increment}``) to the stored matrix."""
+    if not pairs:
+        return
+    existing = {
+        (product_id, other_id): pk
+        for pk, product_id, other_id in ProductCooccurrence.objects.filter(
+            product_id__in={product_id for product_id, _ in pairs},
+        ).values_list('pk', 'product_id', 'other_id')
+    }
+    updates, creates = [], []
+    for (product_id, other_id), increment in pairs.items():
+        pk = existing.get((product_id, other_id))
+        if pk is None:
+            creates.append(ProductCooccurrence(product_id=product_id, other_id=other_id, count=increment))
+        else:
+            updates.append((pk, increment))
+    ProductCooccurrence.objects.bulk_create(creates, batch_size=1000)
+    # One UPDATE ... SET count = count + n per distinct increment.
+    by_increment = defaultdict(list)
+    for pk, increment in updates:
+        by_increment[increment].append(pk)
+    for increment, pks in by_increment.items():
+        for start in range(0, len(pks), 1000):
+            ProductCooccurrence.objects.filter(pk__in=pks[start:start + 1000]).update(
+                count=F('count') + increment,
+            )
+
+
+def process_new_enquiries(window=WINDOW, chunk_size=CHUNK_SIZE):
+    """
+    Fold enquiries newer than the checkpoint into the co-occurrence counts.
+    Returns ``(enquiries processed, ids of products whose counts changed)``.
+    """
+    resolve = _resolver()
+    checkpoint, _ = JobCheckpoint.objects.get_or_create(name=CHECKPOINT)
+    last_id = checkpoint.last_id
+    processed, touched = 0, set()
+    while True:
+        chunk = list(
+            Enquiry.objects.filter(id__gt=last_id).order_by('id')
+            .values_list('id', 'email', 'product_id', 'sku', 'submitted_date')[:chunk_size]
+        )
+        if not chunk:
+            break
+        pairs = count_pairs(chunk, window, resolve)
+        last_id = chunk[-1][0]
+        with transaction.atomic():
+            apply_counts(pairs)
+            JobCheckpoint.objects.filter(pk=checkpoint.pk).update(last_id=last_id, updated_at=timezone.now())
+        processed += len(chunk)
+        touched.update(product_id for product_id, _ in pairs)
+    return processed, touched
+
+
+def refresh_recommendations(product_ids, top_n=TOP_N, batch_size=500):
+    """
+    Recompute the stored top-N of ``product_ids``.
+
+    Scores are cosine-normalised co-occurrence counts,
+    ``count / sqrt(total(product) * total(other))``, so products people ask
+    about with everything don't crowd out the specific pairings.
+    """
+    product_ids = sorted(product_ids)
+    for start in range(0, len(product_ids), batch_size):
+        batch = product_ids[start:start + batch_size]
+        rows = list(
+            ProductCooccurrence.objects.filter(product_id__in=batch)
+            .values_list('product_id', 'other_id', 'count')
+        )
+        involved = set(batch) | {other_id for _, other_id, _ in rows}
+        totals = dict(
+            ProductCooccurrence.objects.filter(product_id__in=involved)
+            .values('product_id').annotate(total=Sum('count'))
+            .values_list('product_id', 'total')
+        )
+        neighbours = defaultdict(list)
+        for product_id, other_id, count in rows:
+            score = count / math.sqrt(totals[product_id] * totals[other_id])
+            neighbours[product_id].append((score, count, other_id))
+
+        recommendations = []
+        for product_id, items in neighbours.items():
+            items.sort(key=lambda item: (-item[0], -item[1], item[2]))
+            recommendations.extend(
+                ProductRecommendation(product_id=product_id, recommended_id=other_id, score=score, rank=rank)
+                for rank, (score, _, other_id) in enumerate(items[:top_n])
+            )
+        with transaction.atomic():
+            ProductRecommendation.objects.filter(product_id__in=batch).delete()
+            ProductRecommendation.objects.bulk_create(recommendations, batch_size=1000)
+
+
+def update(window=WINDOW, chunk_size=CHUNK_SIZE, top_n=TOP_N):
+    """
+    Process new enquiries and refresh the products they touched.
+    Returns ``(enquiries processed, ids of refreshed products)``.
+    """
+    processed, touched = process_new_enquiries(window, chunk_size)
+    refresh_recommendations(touched, top_n)
+    return processed, touched
+
+
+def rebuild(window=WINDOW, chunk_size=CHUNK_SIZE, top_n=TOP_N):
+    """Drop all counts and recommendations and reprocess every enquiry."""
+    with transaction.atomic():
+        ProductRecommendation.objects.all().delete()
+        ProductCooccurrence.objects.all().delete()
+        JobCheckpoint.objects.update_or_create(name=CHECKPOINT, defaults={'last_id': 0})
+    return update(window, chunk_size, top_n)
+
+
+def recommended_products(product_id, limit=TOP_N):
+    """Recommended catalog records for a product, best first, in one indexed query."""
+    products = get_snapshot().products_by_id
+    recommended_ids = (
+        ProductRecommendation.objects.filter(product_id=product_id)
+        .order_by('rank').values_list('recommended_id', flat=True)[:limit]
+    )
+    return [products[pk] for pk in recommended_ids if pk in products]
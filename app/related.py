@@ -0,0 +1,182 @@
+"""
+Related blog posts by TF-IDF cosine similarity.
+
+Every published post is turned into a TF-IDF vector over its stripped title,
+excerpt, content and SEO keywords; the ``TOP_K`` most similar posts are
+stored in ``RelatedPost`` so ``individual_blog`` can read them with a single
+indexed query. ``build_all`` recomputes every row (``manage.py
+build_related``). The BlogPost signals only queue the saved or deleted post
+(``mark_dirty``); ``build_related --pending``, run periodically, rebuilds
+while anything is queued, off the web workers.
+"""
+import math
+import re
+from collections import Counter
+
+import numpy as np
+from django.db import transaction
+from django.utils.html import strip_tags
+
+from . import prerender
+from .models import BlogPost, RelatedDirtyPost, RelatedPost
+
+TOP_K = 6
+MAX_FEATURES = 20000
+# Title and keywords describe the topic better than body text does.
+TITLE_WEIGHT = 3
+KEYWORD_WEIGHT = 2
+
+TOKEN_RE = re.compile(r'[a-z0-9]{2,}')
+STOP_WORDS = frozenset('''
+    a about above after again against all also am an and any are as at be because been before being
+    below between both but by can could did do does doing down during each few for from further had
+    has have having he her here hers herself him himself his how i if in into is it its itself just
+    me more most my myself no nor not now of off on once only or other our ours ourselves out over
+    own same she should so some such than that the their theirs them themselves then there these
+    they this those through to too under until up very was we were what when where which while who
+    whom why will with would you your yours yourself yourselves nbsp amp quot
+'''.split())
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOP_WORDS]
+
+
+def document_terms(title, excerpt, content, keywords):
+    terms = Counter()
+    for text, weight in ((title, TITLE_WEIGHT), (excerpt, 1), (strip_tags(content or ''), 1),
+                         ((keywords or '').replace(',', ' '), KEYWORD_WEIGHT)):
+        for token in tokenize(text or ''):
+            terms[token] += weight
+    return terms
+
+
+class Corpus:
+    """
+    L2-normalised TF-IDF vectors of a list of documents (term Counters):
+    sublinear tf, smoothed idf, capped at ``MAX_FEATURES`` terms by document
+    frequency. Vectors are kept sparse, one ``(columns, weights)`` pair per
+    document, with an inverted index (postings) by term, so memory grows
+    with the words in the posts rather than posts x vocabulary.
+    """
+
+    def __init__(self, documents):
+        self.size = n = len(documents)
+        df = Counter()
+        for terms in documents:
+            df.update(terms.keys())
+        vocabulary = {term: i for i, (term, _) in enumerate(df.most_common(MAX_FEATURES))}
+        idf = np.log((1.0 + n) / (1.0 + np.array([df[t] for t in vocabulary], dtype=np.float32))) + 1.0
+
+        self.vectors = []
+        for terms in documents:
+            pairs = [(vocabulary[t], 1.0 + math.log(c)) for t, c in terms.items() if t in vocabulary]
+            columns = np.array([col for col, _ in pairs], dtype=np.int64)
+            weights = np.array([tf for _, tf in pairs], dtype=np.float32) * idf[columns]
+            norm = np.linalg.norm(weights)
+            self.vectors.append((columns, weights / norm if norm else weights))
+
+        lengths = np.array([len(columns) for columns, _ in self.vectors], dtype=np.int64)
+        columns = np.concatenate([c for c, _ in self.vectors]) if n else np.zeros(0, dtype=np.int64)
+        weights = np.concatenate([w for _, w in self.vectors]) if n else np.zeros(0, dtype=np.float32)
+        order = np.argsort(columns, kind='stable')
+        self.posting_rows = np.repeat(np.arange(n), lengths)[order]
+        self.posting_weights = weights[order]
+        self.posting_starts = np.searchsorted(columns[order], np.arange(len(vocabulary) + 1))
+
+    def similarities(self, row):
+        """Cosine similarity of document ``row`` with every document."""
+        columns, weights = self.vectors[row]
+        starts = self.posting_starts[columns]
+        lengths = self.posting_starts[columns + 1] - starts
+        # Positions of the postings of all the row's terms, concatenated
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+        return np.bincount(
+            self.posting_rows[positions],
+            weights=self.posting_weights[positions] * np.repeat(weights, lengths),
+            minlength=self.size,
+        )
+
+
+def load_corpus():
+    """Return ``(post ids, Corpus)`` for all published posts."""
+    rows = list(
+        BlogPost.objects.filter(status='published').order_by('pk')
+        .values_list('pk', 'title', 'excerpt', 'content', 'seo_meta_keywords')
+    )
+    ids = np.array([row[0] for row in rows], dtype=np.int64)
+    return ids, Corpus([document_terms(*row[1:]) for row in rows])
+
+
+def top_neighbours(ids, corpus, rows, k=TOP_K):
+    """For each row index in ``rows`` return ``[(post id, score), ...]`` best first."""
+    result = {}
+    for row in rows:
+        column = corpus.similarities(row)
+        column[row] = -1.0  # never related to itself
+        take = min(k, len(column) - 1)
+        if take <= 0:
+            result[int(ids[row])] = []
+            continue
+        best = np.argpartition(-column, take - 1)[:take]
+        best = best[np.argsort(-column[best])]
+        result[int(ids[row])] = [(int(ids[i]), float(column[i])) for i in best if column[i] > 0]
+    return result
+
+
+def build_all(k=TOP_K):
+    """
+    Recompute the related posts of every published post and clear the
+    queue. Returns the number of posts.
+
+    Scores are only comparable within one build (every post shifts the
+    idf), so saves never refresh single rows: they queue the post for the
+    next ``build_related --pending`` run, which rebuilds them all.
+    """
+    queued = list(RelatedDirtyPost.objects.values_list('pk', flat=True))
+    current = {}
+    for post_id, related_id in RelatedPost.objects.order_by('post_id', 'rank').values_list('post_id', 'related_id'):
+        current.setdefault(post_id, []).append(related_id)
+
+    ids, corpus = load_corpus()
+    neighbours = top_neighbours(ids, corpus, range(len(ids)), k)
+    with transaction.atomic():
+        RelatedPost.objects.exclude(post_id__in=neighbours).delete()
+        RelatedPost.objects.filter(post_id__in=list(neighbours)).delete()
+        RelatedPost.objects.bulk_create([
+            RelatedPost(post_id=post_id, related_id=related_id, score=score, rank=rank)
+            for post_id, items in neighbours.items()
+            for rank, (related_id, score) in enumerate(items)
+        ])
+        # Posts queued while this build ran stay queued for the next one
+        RelatedDirtyPost.objects.filter(pk__in=queued).delete()
+
+    # Pre-rendered pages of posts whose list changed are re-rendered too.
+    changed = [pk for pk, items in neighbours.items() if [r for r, _ in items] != current.get(pk, [])]
+    if changed and prerender.is_enabled():
+        slugs = BlogPost.objects.filter(pk__in=changed).values_list('slug', flat=True)
+        prerender.build_paths([prerender.blog_post_path(slug) for slug in slugs])
+    return len(neighbours)
+
+
+def is_pending():
+    return RelatedDirtyPost.objects.exists()
+
+
+def mark_dirty(*post_ids):
+    """Queue posts that were saved or deleted for the next ``build_related --pending``."""
+    RelatedDirtyPost.objects.bulk_create(
+        [RelatedDirtyPost(post_id=post_id) for post_id in set(post_ids)],
+        ignore_conflicts=True,
+    )
+
+
+def related_posts_for(post, limit=3):
+    """The stored related posts of ``post``, best first, in one query."""
+    entries = (
+        RelatedPost.objects.filter(post=post, related__status='published')
+        .select_related('related__category')
+        .order_by('rank')[:limit]
+    )
+    return [entry.related for entry in entries]
@@ -0,0 +1,193 @@
+"""
+Render-once HTML for the Summernote rich-text fields.
+
+Editors write raw HTML (codeview is enabled), and pages used to output it
+as-is on every request. ``render`` turns it into what the pages should
+serve, once, when the object is saved: sanitized with bleach, whitespace
+collapsed, and every ``<img>`` given ``loading="lazy"``, ``decoding="async"``
+and its intrinsic ``width``/``height`` (no layout shift). Images stored in
+MEDIA_ROOT also get a ``srcset`` of resized derivatives (see
+``app/imaging.py``). The result goes in the ``*_html`` field next to the
+source, which stays untouched for the editor.
+"""
+import re
+from urllib.parse import unquote
+
+import bleach
+from bleach import html5lib_shim
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import models
+from django_summernote.fields import SummernoteTextField
+from django_summernote.widgets import SummernoteWidget
+
+from . import imaging
+
+# Fields rendered on save: model label -> {source field: rendered field}
+FIELDS = {
+    'app.productcategory': {'description': 'description_html'},
+    'app.product': {'description': 'description_html', 'content': 'content_html'},
+    'app.blogpost': {'content': 'content_html'},
+}
+
+ALLOWED_TAGS = [
+    'a', 'abbr', 'b', 'blockquote', 'br', 'caption', 'code', 'col', 'colgroup', 'dd', 'del', 'div',
+    'dl', 'dt', 'em', 'figcaption', 'figure', 'font', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'i',
+    'iframe', 'img', 'ins', 'li', 'mark', 'ol', 'p', 'pre', 's', 'small', 'span', 'strike', 'strong',
+    'sub', 'sup', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'u', 'ul',
+]
+# Embeds the Summernote video button produces
+IFRAME_SOURCES = (
+    'https://www.youtube.com/embed/', 'https://www.youtube-nocookie.com/embed/',
+    'https://player.vimeo.com/video/', '//www.youtube.com/embed/', '//player.vimeo.com/video/',
+)
+ALLOWED_STYLES = [
+    'background-color', 'color', 'float', 'font-family', 'font-size', 'font-style', 'font-weight',
+    'height', 'line-height', 'margin', 'margin-left', 'margin-right', 'text-align', 'text-decoration',
+    'vertical-align', 'width',
+]
+# ``sizes`` of content images: full width on phones, the article column beyond
+IMAGE_SIZES = '(min-width: 896px) 896px, 100vw'
+
+
+class RichTextField(SummernoteTextField):
+    """
+    A Summernote field that stores the editor's HTML as written.
+
+    ``SummernoteTextField`` bleaches every value it stores with a whitelist
+    that drops ``<img src>`` and more, so pasted images never survived a
+    save. Sanitizing is done by ``render`` instead, into the ``*_html`` field.
+    The source is unsanitized: pages must output the rendered field only,
+    never fall back to the source when it is empty.
+    """
+
+    def formfield(self, **kwargs):
+        kwargs.setdefault('widget', SummernoteWidget())
+        return models.TextField.formfield(self, **kwargs)
+
+    def to_python(self, value):
+        return models.TextField.to_python(self, value)
+
+
+def _iframe_attribute(tag, name, value):
+    if name == 'src':
+        return value.startswith(IFRAME_SOURCES)
+    return name in ('width', 'height', 'frameborder', 'allowfullscreen', 'title')
+
+
+ALLOWED_ATTRIBUTES = {
+    '*': ['class', 'style', 'title', 'dir'],
+    'a': ['href', 'target', 'rel', 'name'],
+    'font': ['color', 'face', 'size'],
+    'img': ['src', 'alt', 'width', 'height', 'data-filename'],
+    'iframe': _iframe_attribute,
+    'td': ['colspan', 'rowspan'],
+    'th': ['colspan', 'rowspan', 'scope'],
+    'col': ['span'],
+    'colgroup': ['span'],
+    'ol': ['start', 'type'],
+}
+
+_WHITESPACE = re.compile(r'\s+')
+# Elements dropped with their content (bleach would keep it as text)
+_DROPPED = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+# Where whitespace is content
+_PREFORMATTED = {'pre', 'textarea'}
+
+
+def media_name(src):
+    """The stored file name behind a MEDIA_URL ``src``, or ``None``."""
+    prefix = settings.MEDIA_URL
+    if not src or not src.startswith(prefix) or '?' in src:
+        return None
+    name = unquote(src[len(prefix):])
+    return name if name and not name.startswith(imaging.DERIVATIVES_DIR + '/') else None
+
+
+class ImageFilter(html5lib_shim.Filter):
+    """Lazy loading, intrinsic size and derivative ``srcset`` on every ``<img>``."""
+
+    def __iter__(self):
+        for token in super().__iter__():
+            if token['type'] in ('StartTag', 'EmptyTag') and token['name'] == 'img':
+                token['data'] = self.image_attributes(dict(token['data']))
+            yield token
+
+    def image_attributes(self, attrs):
+        attrs[(None, 'loading')] = 'lazy'
+        attrs[(None, 'decoding')] = 'async'
+        name = media_name(attrs.get((None, 'src')))
+        if name is None:
+            return attrs
+        size = imaging.image_size(name)
+        if size is None:
+            return attrs
+        width, height = size
+        # Width/height are the intrinsic size: CSS still scales the image,
+        # the browser just reserves the right aspect ratio up front.
+        attrs[(None, 'width')] = str(width)
+        attrs[(None, 'height')] = str(height)
+        variants = imaging.derivatives(name)
+        if variants:
+            candidates = [f'{default_storage.url(variant)} {w}w' for variant, w in variants]
+            candidates.append(f'{default_storage.url(name)} {width}w')
+            attrs[(None, 'srcset')] = ', '.join(candidates)
+            attrs[(None, 'sizes')] = IMAGE_SIZES
+        return attrs
+
+
+class EmbedFilter(html5lib_shim.Filter):
+    """Drop ``<iframe>``s whose ``src`` was stripped (not one of ``IFRAME_SOURCES``)."""
+
+    def __iter__(self):
+        dropping = False
+        for token in super().__iter__():
+            if token.get('name') == 'iframe':
+                if token['type'] in ('StartTag', 'EmptyTag'):
+                    dropping = (None, 'src') not in token['data']
+                    if dropping and token['type'] == 'EmptyTag':
+                        dropping = False
+                        continue
+                elif token['type'] == 'EndTag' and dropping:
+                    dropping = False
+                    continue
+            if not dropping:
+                yield token
+
+
+class WhitespaceFilter(html5lib_shim.Filter):
+    """Collapse runs of whitespace to one space, outside ``<pre>``/``<textarea>``."""
+
+    def __iter__(self):
+        preformatted = 0
+        for token in super().__iter__():
+            kind = token['type']
+            if kind == 'StartTag' and token['name'] in _PREFORMATTED:
+                preformatted += 1
+            elif kind == 'EndTag' and token['name'] in _PREFORMATTED:
+                preformatted = max(preformatted - 1, 0)
+            elif kind in ('Characters', 'SpaceCharacters') and not preformatted:
+                token['data'] = _WHITESPACE.sub(' ', token['data'])
+            yield token
+
+
+def render(html):
+    """The served HTML of rich-text source ``html``."""
+    if not html:
+        return ''
+    # Cleaners aren't thread-safe: one per call
+    cleaner = bleach.sanitizer.Cleaner(
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        styles=ALLOWED_STYLES,
+        protocols=['http', 'https', 'mailto', 'tel'],
+        strip=True,
+        filters=[EmbedFilter, ImageFilter, WhitespaceFilter],
+    )
+    return cleaner.clean(_DROPPED.sub('', html)).strip()
+
+
+def render_fields(instance):
+    """Fill the ``*_html`` fields of ``instance`` from their sources."""
+    for source, target in FIELDS[instance._meta.label_lower].items():
+        setattr(instance, target, render(getattr(instance, source)))
@@ -0,0 +1,227 @@
+"""
+Daily rollups of the enquiry and contact inboxes.
+
+``roll_up`` folds rows newer than the source's ``JobCheckpoint`` into the
+rollup table in id chunks (one GROUP BY per chunk), then recounts the days
+marked dirty because rows that were already counted changed (response status
+toggled, rows deleted). Nothing here ever scans a whole inbox table, and the
+admin dashboard (app/dashboard.py) reads only the rollups. Rows moved to the
+archive (app/archive.py) keep being counted.
+"""
+import threading
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import (
+    ArchivedRecord, ContactDailyRollup, ContactFormSubmission, Enquiry,
+    EnquiryDailyRollup, JobCheckpoint, RollupDirtyDay, normalize_sku,
+)
+
+CHUNK_SIZE = 50000
+
+
+class Source:
+    """An inbox table, its rollup table and the fields rollup rows are keyed by."""
+
+    def __init__(self, name, model, rollup, key_fields, extra_fields=(), normalizers=None):
+        self.name = name
+        self.model = model
+        self.rollup = rollup
+        self.key_fields = key_fields
+        self.extra_fields = extra_fields
+        self.normalizers = normalizers or {}
+        # GROUP BY columns besides the day.
+        self.group_by = tuple(f for f in key_fields if f != 'day') + tuple(extra_fields)
+
+    @property
+    def checkpoint(self):
+        return f'rollup:{self.name}'
+
+    def key(self, row):
+        """Unique key of the rollup row a GROUP BY row belongs to."""
+        return tuple(self.normalizers.get(f, _same)(row[f]) for f in self.key_fields)
+
+    def new_row(self, key, count, row):
+        values = dict(zip(self.key_fields, key))
+        values.update((f, row[f]) for f in self.extra_fields)
+        return self.rollup(count=count, **values)
+
+    def existing(self, days):
+        """``{key: pk}`` of the stored rollup rows of ``days``."""
+        return {
+            tuple(values[:-1]): values[-1]
+            for values in self.rollup.objects.filter(day__in=days).values_list(*self.key_fields, 'pk')
+        }
+
+
+def _same(value):
+    return value
+
+
+ENQUIRIES = Source(
+    'enquiries', Enquiry, EnquiryDailyRollup,
+    key_fields=('day', 'sku', 'is_responded'), extra_fields=('product_id',),
+    normalizers={'sku': normalize_sku},
+)
+CONTACTS = Source('contacts', ContactFormSubmission, ContactDailyRollup, key_fields=('day', 'is_responded'))
+SOURCES = {source.name: source for source in (ENQUIRIES, CONTACTS)}
+SOURCE_FOR_MODEL = {source.model: source for source in SOURCES.values()}
+
+
+def _aggregate(source, queryset):
+    """``{rollup key: (count, a sample group row)}`` for the rows of ``queryset``."""
+    totals = {}
+    rows = (
+        queryset.order_by()
+        .annotate(day=TruncDate('submitted_date'))
+        .values('day', *source.group_by)
+        .annotate(n=Count('id'))
+    )
+    for row in rows:
+        key = source.key(row)
+        count, sample = totals.get(key, (0, row))
+        # Keep the row that names a product, if any spelling of the SKU did.
+        if row.get('product_id') and not sample.get('product_id'):
+            sample = row
+        totals[key] = (count + row['n'], sample)
+    return totals
+
+
+def _add(source, totals):
+    """Add ``totals`` to the stored rollup rows, creating the missing ones."""
+    if not totals:
+        return
+    existing = source.existing({key[0] for key in totals})
+    creates = []
+    for key, (count, row) in totals.items():
+        pk = existing.get(key)
+        if pk is None:
+            creates.append(source.new_row(key, count, row))
+        else:
+            source.rollup.objects.filter(pk=pk).update(count=F('count') + count)
+    source.rollup.objects.bulk_create(creates, batch_size=1000)
+
+
+def _day_range(day):
+    """Start and end of ``day`` in the current time zone, matching ``TruncDate``."""
+    start = datetime.combine(day, time.min)
+    if settings.USE_TZ:
+        start = timezone.make_aware(start)
+    return start, start + timedelta(days=1)
+
+
+def _local_day(value):
+    return timezone.localdate(value) if settings.USE_TZ else value.date()
+
+
+def mark_dirty(source, days):
+    """Queue ``days`` for recounting; call after (or with) the change, in its transaction."""
+    days = set(days)
+    with transaction.atomic():
+        # A fresh row even when the day is queued already: a recount running
+        # now deletes the row it read by pk and must not take this mark along.
+        RollupDirtyDay.objects.filter(source=source.name, day__in=days).delete()
+        RollupDirtyDay.objects.bulk_create(
+            [RollupDirtyDay(source=source.name, day=day) for day in days],
+            ignore_conflicts=True,
+        )
+
+
+def update_queryset(queryset, **values):
+    """
+    Bulk ``update()`` inbox rows that may already be rolled up, marking
+    their days dirty in the same transaction. Returns the rows updated.
+    """
+    source = SOURCE_FOR_MODEL[queryset.model]
+    with transaction.atomic():
+        # Read before the update: the queryset may filter on what it changes
+        days = list(queryset.order_by().dates('submitted_date', 'day'))
+        updated = queryset.update(**values)
+        mark_dirty(source, days)
+    return updated
+
+
+_state = threading.local()
+
+
+@contextmanager
+def archiving():
+    """Rows deleted inside this block were archived: they stay counted, so no day is marked dirty."""
+    _state.archiving = True
+    try:
+        yield
+    finally:
+        _state.archiving = False
+
+
+def mark_instance_dirty(instance):
+    if getattr(_state, 'archiving', False):
+        return
+    source = SOURCE_FOR_MODEL[type(instance)]
+    if instance.submitted_date:
+        mark_dirty(source, [_local_day(instance.submitted_date)])
+
+
+def roll_up_new(source, chunk_size=CHUNK_SIZE):
+    """Fold rows above the watermark into the rollups. Returns the number of rows."""
+    checkpoint, _ = JobCheckpoint.objects.get_or_create(name=source.checkpoint)
+    last_id = checkpoint.last_id
+    upper = source.model.objects.order_by('-id').values_list('id', flat=True).first() or 0
+    processed = 0
+    while last_id < upper:
+        # The id that ends the next chunk_size rows; gaps in the ids are skipped.
+        chunk_end = (
+            source.model.objects.filter(id__gt=last_id, id__lte=upper).order_by('id')
+            .values_list('id', flat=True)[chunk_size - 1:chunk_size].first()
+        ) or upper
+        rows = source.model.objects.filter(id__gt=last_id, id__lte=chunk_end)
+        with transaction.atomic():
+            totals = _aggregate(source, rows)
+            _add(source, totals)
+            JobCheckpoint.objects.filter(pk=checkpoint.pk).update(last_id=chunk_end)
+        processed += sum(count for count, _ in totals.values())
+        last_id = chunk_end
+    # updated_at doubles as "rollups current as of" on the dashboard.
+    JobCheckpoint.objects.filter(pk=checkpoint.pk).update(updated_at=timezone.now())
+    return processed
+
+
+def recount_dirty(source):
+    """Recount the dirty days of ``source`` from the raw rows. Returns the number of days."""
+    dirty = list(RollupDirtyDay.objects.filter(source=source.name).values_list('pk', 'day'))
+    if not dirty:
+        return 0
+    watermark = JobCheckpoint.objects.filter(name=source.checkpoint).values_list('last_id', flat=True).first() or 0
+    for pk, day in dirty:
+        start, end = _day_range(day)
+        with transaction.atomic():
+            source.rollup.objects.filter(day=day).delete()
+            # Rows above the watermark are added by the next roll_up_new.
+            rows = source.model.objects.filter(submitted_date__gte=start, submitted_date__lt=end, id__lte=watermark)
+            _add(source, _aggregate(source, rows))
+            # Archived rows (app/archive.py) still count towards their day.
+            archived = ArchivedRecord.objects.filter(source=source.name, submitted_date__gte=start, submitted_date__lt=end)
+            _add(source, _aggregate(source, archived))
+            RollupDirtyDay.objects.filter(pk=pk).delete()
+    return len(dirty)
+
+
+def roll_up(source, chunk_size=CHUNK_SIZE):
+    """Process new rows, then dirty days. Returns ``(rows added, days recounted)``."""
+    return roll_up_new(source, chunk_size), recount_dirty(source)
+
+
+def rebuild(source, chunk_size=CHUNK_SIZE):
+    """Drop the rollups of ``source`` and count every row (archived ones included) again."""
+    with transaction.atomic():
+        source.rollup.objects.all().delete()
+        RollupDirtyDay.objects.filter(source=source.name).delete()
+        JobCheckpoint.objects.update_or_create(name=source.checkpoint, defaults={'last_id': 0})
+        _add(source, _aggregate(source, ArchivedRecord.objects.filter(source=source.name)))
+    return roll_up(source, chunk_size)
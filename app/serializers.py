@@ -0,0 +1,212 @@
+"""
+Fast JSON serialization for the public list APIs.
+
+A ``Serializer`` maps output fields to the columns they are built from.
+Rows are read as plain tuples (``values_list`` for querysets, attribute
+getters for catalog snapshot records) limited to the columns of the fields
+actually requested with ``?fields=``, media URLs are built from a prefix
+computed once instead of going through the storage API per row, and the
+JSON array is encoded row by row. Small results become a regular
+``HttpResponse`` (so ``cache_view`` can store them and the compression
+middleware can encode them); large ones are streamed.
+"""
+import json
+from functools import lru_cache
+from operator import attrgetter
+
+from django.core.files.storage import default_storage
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.encoding import filepath_to_uri
+from django.utils.html import strip_tags
+
+from .catalog import summarize
+
+# Results with more rows than this are streamed instead of buffered.
+STREAM_THRESHOLD = 5000
+# Rows encoded per chunk of the streamed body.
+CHUNK_ROWS = 500
+
+encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+
+@lru_cache(maxsize=None)
+def _media_prefix():
+    return default_storage.base_url
+
+
+def media_url(name):
+    """Public URL of a stored file name (what ``FieldFile.url`` returns for FileSystemStorage)."""
+    return _media_prefix() + filepath_to_uri(name) if name else None
+
+
+class Field:
+    """An output field built from ``columns`` (``__`` paths) by ``build(*values)``."""
+
+    __slots__ = ('columns', 'build')
+
+    def __init__(self, *columns, build=None):
+        self.columns = columns
+        self.build = build
+
+
+class Serializer:
+    def __init__(self, **fields):
+        self.fields = fields
+
+    def select(self, requested=None):
+        """
+        Field names for a ``?fields=a,b`` value (all fields when empty).
+        Raises ``ValueError`` naming unknown fields.
+        """
+        if not requested:
+            return tuple(self.fields)
+        names = tuple(dict.fromkeys(name.strip() for name in requested.split(',') if name.strip()))
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+        return names or tuple(self.fields)
+
+    def columns(self, names):
+        return tuple(dict.fromkeys(column for name in names for column in self.fields[name].columns))
+
+    def _plan(self, names, columns):
+        """``(name, column positions, build)`` for each field."""
+        position = {column: i for i, column in enumerate(columns)}
+        return [
+            (name, tuple(position[c] for c in self.fields[name].columns), self.fields[name].build)
+            for name in names
+        ]
+
+    def dicts(self, rows, names, columns):
+        """Output dicts for ``rows``, tuples of ``columns``."""
+        plan = self._plan(names, columns)
+        for row in rows:
+            item = {}
+            for name, positions, build in plan:
+                if build is None:
+                    item[name] = row[positions[0]]
+                else:
+                    item[name] = build(*[row[i] for i in positions])
+            yield item
+
+    def from_queryset(self, queryset, names):
+        columns = self.columns(names)
+        if not columns:
+            return self.dicts(((),) * queryset.count(), names, columns)
+        return self.dicts(queryset.values_list(*columns).iterator(chunk_size=2000), names, columns)
+
+    def from_objects(self, objects, names):
+        columns = self.columns(names)
+        if not columns:
+            return self.dicts(((),) * len(objects), names, columns)
+        getter = attrgetter(*(column.replace('__', '.') for column in columns))
+        rows = (getter(obj) for obj in objects)
+        if len(columns) == 1:
+            rows = ((value,) for value in rows)
+        return self.dicts(rows, names, columns)
+
+
+def encode_chunks(items):
+    """The JSON array of ``items`` as a series of byte strings."""
+    yield b'['
+    batch, first = [], True
+    for item in items:
+        batch.append(encode(item))
+        if len(batch) >= CHUNK_ROWS:
+            yield (('' if first else ',') + ','.join(batch)).encode('utf-8')
+            batch, first = [], False
+    if batch:
+        yield (('' if first else ',') + ','.join(batch)).encode('utf-8')
+    yield b']'
+
+
+def json_response(items, count):
+    """A JSON array response for ``count`` items, streamed when it is large."""
+    if count > STREAM_THRESHOLD:
+        return StreamingHttpResponse(encode_chunks(items), content_type='application/json')
+    return HttpResponse(b''.join(encode_chunks(items)), content_type='application/json')
+
+
+def _product_category(id, name, slug):
+    return {'id': id, 'name': strip_tags(name), 'slug': slug} if id is not None else None
+
+
+def _product_status(id, name, slug):
+    return {'id': id, 'name': name, 'slug': slug} if id is not None else None
+
+
+def _blog_category(id, name):
+    return {'id': id, 'name': name} if id is not None else None
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+def _excerpt(excerpt):
+    return excerpt[:300] + '...' if len(excerpt) > 300 else excerpt  # Limit excerpt length
+
+
+# Fields of /api/products/ records (read from catalog snapshot records)
+PRODUCTS = Serializer(
+    id=Field('id'),
+    name=Field('name', build=strip_tags),
+    slug=Field('slug'),
+    description=Field('summary'),
+    image=Field('image__url'),
+    category=Field('category__id', 'category__name', 'category__slug', build=_product_category),
+)
+
+# Fields of /api/blog-posts/ records (read with values_list)
+BLOG_POSTS = Serializer(
+    id=Field('id'),
+    title=Field('title'),
+    slug=Field('slug'),
+    excerpt=Field('excerpt', build=_excerpt),
+    author=Field('author'),
+    published_date=Field('published_date', build=_isoformat),
+    is_featured=Field('is_featured'),
+    featured_image=Field('featured_image', build=media_url),
+    category=Field('category__id', 'category__name', build=_blog_category),
+    tags=Field(build=lambda: []),
+)
+
+# Fields of /api/categories/ and /api/blog-categories/ records
+CATEGORIES = Serializer(
+    id=Field('id'),
+    name=Field('name'),
+    slug=Field('slug'),
+)
+
+# Records of the delta-sync feeds (app/changes.py), read with values_list
+PRODUCT_CHANGES = Serializer(
+    id=Field('id'),
+    name=Field('name', build=strip_tags),
+    slug=Field('slug'),
+    sku=Field('sku'),
+    description=Field('description', build=summarize),
+    image=Field('image', build=media_url),
+    category=Field('category__id', 'category__name', 'category__slug', build=_product_category),
+    status=Field('status__slug'),
+    updated_at=Field('updated_at', build=_isoformat),
+)
+
+BLOG_POST_CHANGES = Serializer(
+    **BLOG_POSTS.fields,
+    updated_at=Field('updated_at', build=_isoformat),
+)
+
+# Full records of the NDJSON exports (app/exports.py): HTML bodies included
+PRODUCT_EXPORT = Serializer(**{
+    **PRODUCT_CHANGES.fields,
+    'summary': Field('description', build=summarize),
+    'description': Field('description'),
+    'content': Field('content'),
+    'status': Field('status__id', 'status__name', 'status__slug', build=_product_status),
+    'created_at': Field('created_at', build=_isoformat),
+})
+
+BLOG_POST_EXPORT = Serializer(
+    **BLOG_POST_CHANGES.fields,
+    content=Field('content'),
+)
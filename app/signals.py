@@ -0,0 +1,137 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django_summernote.utils import get_attachment_model
+
+from . import artifacts, attachments, generations, prerender, related, rollups
+from .models import (
+    ActivePriceList, BlogCategory, BlogPost, ContactFormSubmission, DeletionLog, Enquiry, PageSEO, PriceList,
+    Product, ProductCategory, ProductStatus,
+)
+
+# Models whose changes show up on pre-rendered pages.
+PRERENDERED_MODELS = (
+    Product, ProductCategory, ProductStatus, BlogPost, BlogCategory,
+    PriceList, PageSEO,
+)
+
+# Generation counters invalidated by a change to each model.
+MODEL_GENERATIONS = {
+    Product: (generations.CATALOG,),
+    ProductCategory: (generations.CATALOG,),
+    ProductStatus: (generations.CATALOG,),
+    BlogPost: (generations.BLOG,),
+    BlogCategory: (generations.BLOG,),
+    PriceList: (generations.PRICE_LIST,),
+    ActivePriceList: (generations.PRICE_LIST,),
+    PageSEO: (generations.PAGES,),
+}
+
+
+def _schedule_prerender(instance):
+    paths = prerender.paths_for_instance(instance)
+    transaction.on_commit(lambda: prerender.schedule(paths))
+
+
+@receiver(pre_save)
+def remember_prerendered_paths(sender, instance, raw=False, **kwargs):
+    if raw or sender not in PRERENDERED_MODELS or not prerender.is_enabled():
+        return
+    prerender.remember_old_paths(instance)
+
+
+@receiver(post_save)
+def prerender_on_save(sender, instance, raw=False, **kwargs):
+    if raw or sender not in PRERENDERED_MODELS or not prerender.is_enabled():
+        return
+    _schedule_prerender(instance)
+
+
+@receiver(pre_delete)
+def prerender_on_delete(sender, instance, **kwargs):
+    # Paths are collected before the row (and anything it cascades to) is gone.
+    if sender not in PRERENDERED_MODELS or not prerender.is_enabled():
+        return
+    _schedule_prerender(instance)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_generations(sender, **kwargs):
+    names = MODEL_GENERATIONS.get(sender)
+    if names:
+        transaction.on_commit(lambda: _bump(names))
+
+
+def _bump(names):
+    generations.bump_generation(*names)
+    artifacts.schedule_for_generations(names)
+
+
+@receiver(post_save, sender=BlogPost)
+def update_related_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    related.mark_dirty(instance.pk)
+
+
+@receiver(post_delete, sender=BlogPost)
+def update_related_on_delete(sender, instance, **kwargs):
+    # The cascade already dropped the rows pointing at this post; the posts
+    # that listed it get a replacement from the next rebuild.
+    related.mark_dirty(instance.pk)
+
+
+@receiver(post_save, sender=Enquiry)
+@receiver(post_save, sender=ContactFormSubmission)
+def mark_rollup_day_on_save(sender, instance, created=False, raw=False, **kwargs):
+    # New rows are picked up by the rollup watermark; edits of rows that may
+    # already be counted (e.g. the response status) need their day recounted.
+    if raw or created:
+        return
+    rollups.mark_instance_dirty(instance)
+
+
+@receiver(post_delete, sender=Enquiry)
+@receiver(post_delete, sender=ContactFormSubmission)
+def mark_rollup_day_on_delete(sender, instance, **kwargs):
+    rollups.mark_instance_dirty(instance)
+
+
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=BlogPost)
+def log_deletion(sender, instance, **kwargs):
+    # Tombstone for delta-sync clients (app/changes.py), in the deleting transaction.
+    DeletionLog.objects.create(model=sender._meta.label_lower, object_id=instance.pk)
+
+
+# Rows whose delta-sync records embed another model's fields: (model, FK).
+EMBEDDED_IN = {
+    ProductCategory: (Product, 'category'),
+    ProductStatus: (Product, 'status'),
+    BlogCategory: (BlogPost, 'category'),
+}
+
+
+@receiver(post_save)
+def touch_embedding_rows(sender, instance, created=False, raw=False, **kwargs):
+    # Renaming a category changes the records of its products/posts, so
+    # delta sync has to report them as updated.
+    if raw or created or sender not in EMBEDDED_IN:
+        return
+    model, field = EMBEDDED_IN[sender]
+    model.objects.filter(**{field: instance}).update(updated_at=timezone.now())
+
+
+@receiver(pre_delete, sender=ProductStatus)
+def touch_products_losing_status(sender, instance, **kwargs):
+    # SET_NULL is a plain UPDATE that leaves updated_at alone.
+    Product.objects.filter(status=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=get_attachment_model())
+def optimize_attachment(sender, instance, created, raw=False, **kwargs):
+    # Editor uploads: cap, re-encode and make srcset derivatives (app/attachments.py)
+    if created and not raw:
+        transaction.on_commit(lambda: attachments.schedule(instance))
@@ -0,0 +1,207 @@
+"""
+Sharded sitemap generation.
+
+``/sitemap.xml`` is a sitemap index pointing at one or more shards per
+section (``/sitemap-products-1.xml`` ...), each holding at most
+``SITEMAP_LIMIT`` URLs. Shards are generated by streaming ``values_list``
+rows through ``iterator()`` and cached under the generation counters of the
+content they list, so a shard is rebuilt only after that content changes.
+"""
+import datetime
+from xml.sax.saxutils import escape
+
+from django.core.cache import cache
+from django.urls import reverse
+
+from . import generations, pricelists
+from .models import BlogCategory, BlogPost, PageSEO, Product, ProductCategory
+from .prerender import PAGE_ROUTES
+
+SITEMAP_LIMIT = 10000
+ITERATOR_CHUNK_SIZE = 2000
+CACHE_TIMEOUT = 60 * 60 * 24
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+URLSET_OPEN = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+URLSET_CLOSE = '</urlset>\n'
+INDEX_OPEN = '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+INDEX_CLOSE = '</sitemapindex>\n'
+
+
+def format_lastmod(value):
+    if value is None:
+        return None
+    return value.astimezone(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S+00:00')
+
+
+class Section:
+    """One sitemap section: a queryset of ``(path, lastmod)`` rows ordered by pk."""
+
+    name = None
+    generations = ()
+
+    def queryset(self):
+        raise NotImplementedError
+
+    def row_to_url(self, row):
+        """Turn a ``values_list`` row into ``(path, lastmod)``."""
+        raise NotImplementedError
+
+    def urls(self, page):
+        start = (page - 1) * SITEMAP_LIMIT
+        rows = self.queryset()[start:start + SITEMAP_LIMIT]
+        for row in rows.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            yield self.row_to_url(row)
+
+    def page_lastmods(self):
+        """Yield the newest ``lastmod`` of each shard, in page order."""
+        latest, seen = None, 0
+        for row in self.queryset().iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+            lastmod = self.row_to_url(row)[1]
+            if lastmod and (latest is None or lastmod > latest):
+                latest = lastmod
+            seen += 1
+            if seen == SITEMAP_LIMIT:
+                yield latest
+                latest, seen = None, 0
+        if seen or latest is None:
+            yield latest
+
+
+class PagesSection(Section):
+    name = 'pages'
+    generations = (generations.PAGES, generations.PRICE_LIST)
+
+    def urls(self, page):
+        if page != 1:
+            return
+        updated = dict(PageSEO.objects.filter(slug__in=PAGE_ROUTES).values_list('slug', 'updated_at'))
+        # The price list page changes with the active PDF as well as its SEO row.
+        active = pricelists.get_active_price_list()
+        active = active.updated_date if active else None
+        updated['price-list'] = max(filter(None, (updated.get('price-list'), active)), default=None)
+        for slug, route in PAGE_ROUTES.items():
+            yield reverse(route), updated.get(slug)
+
+    def page_lastmods(self):
+        yield max(filter(None, (lastmod for _, lastmod in self.urls(1))), default=None)
+
+
+class CategoriesSection(Section):
+    name = 'categories'
+    generations = (generations.CATALOG,)
+
+    def queryset(self):
+        return ProductCategory.objects.order_by('pk').values_list('slug', 'updated_at')
+
+    def row_to_url(self, row):
+        return reverse('category_products', args=[row[0]]), row[1]
+
+
+class ProductsSection(Section):
+    name = 'products'
+    generations = (generations.CATALOG,)
+
+    def queryset(self):
+        return Product.objects.order_by('pk').values_list('category__slug', 'slug', 'updated_at')
+
+    def row_to_url(self, row):
+        return reverse('product_in_category', args=[row[0], row[1]]), row[2]
+
+
+class BlogCategoriesSection(Section):
+    name = 'blog-categories'
+    generations = (generations.BLOG,)
+
+    def queryset(self):
+        return BlogCategory.objects.order_by('pk').values_list('slug', 'updated_at')
+
+    def row_to_url(self, row):
+        return reverse('blog_category', args=[row[0]]), row[1]
+
+
+class BlogPostsSection(Section):
+    name = 'blog'
+    generations = (generations.BLOG,)
+
+    def queryset(self):
+        return BlogPost.objects.filter(status='published').order_by('pk').values_list('slug', 'updated_at')
+
+    def row_to_url(self, row):
+        return reverse('individual_blog', args=[row[0]]), row[1]
+
+
+SECTIONS = {
+    section.name: section
+    for section in (PagesSection(), CategoriesSection(), ProductsSection(),
+                    BlogCategoriesSection(), BlogPostsSection())
+}
+
+
+def _url_entry(base_url, path, lastmod):
+    entry = f'<url><loc>{escape(base_url + path)}</loc>'
+    lastmod = format_lastmod(lastmod)
+    if lastmod:
+        entry += f'<lastmod>{lastmod}</lastmod>'
+    return entry + '</url>\n'
+
+
+def _cache_key(kind, base_url, gens):
+    return 'sitemap:%s:%s:%s' % (kind, base_url, '-'.join(str(g) for g in gens))
+
+
+def section_version(section):
+    return generations.get_generations(*section.generations)
+
+
+def index_version():
+    names = sorted({name for section in SECTIONS.values() for name in section.generations})
+    return generations.get_generations(*names)
+
+
+def build_index(base_url):
+    """Return ``(xml_bytes, lastmod)`` for the sitemap index, cached per generation."""
+    key = _cache_key('index', base_url, index_version())
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    parts, newest = [XML_HEADER, INDEX_OPEN], None
+    for section in SECTIONS.values():
+        for page, lastmod in enumerate(section.page_lastmods(), start=1):
+            loc = base_url + reverse('sitemap_section', args=[section.name, page])
+            parts.append(f'<sitemap><loc>{escape(loc)}</loc>')
+            if lastmod:
+                parts.append(f'<lastmod>{format_lastmod(lastmod)}</lastmod>')
+                newest = max(newest, lastmod) if newest else lastmod
+            parts.append('</sitemap>\n')
+    parts.append(INDEX_CLOSE)
+
+    result = (''.join(parts).encode(), newest)
+    cache.set(key, result, CACHE_TIMEOUT)
+    return result
+
+
+def build_section(section, page, base_url):
+    """
+    Return ``(xml_bytes, lastmod)`` for one shard, or ``None`` when the page
+    is out of range. Cached per generation of the section's content.
+    """
+    key = _cache_key(f'{section.name}:{page}', base_url, section_version(section))
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    parts, newest, found = [XML_HEADER, URLSET_OPEN], None, False
+    for path, lastmod in section.urls(page):
+        found = True
+        parts.append(_url_entry(base_url, path, lastmod))
+        if lastmod and (newest is None or lastmod > newest):
+            newest = lastmod
+    if not found and page != 1:
+        return None
+    parts.append(URLSET_CLOSE)
+
+    result = (''.join(parts).encode(), newest)
+    cache.set(key, result, CACHE_TIMEOUT)
+    return result
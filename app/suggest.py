@@ -0,0 +1,189 @@
+"""
+In-memory typeahead index over product names, SKUs and category names.
+
+Keys are normalised (accents folded, lower case, punctuation to spaces) and
+kept in one sorted list, so a prefix lookup is a ``bisect`` plus a short
+forward scan. Every word start of a name is a key of its own, so "vit"
+finds "Multi Vitamin". When prefixes find too little, misspelt words are
+swapped for the closest catalog word by trigram similarity ("calcum" ->
+"calcium") and the lookup is repeated.
+
+The index is derived from the catalog snapshot and rebuilt when the catalog
+generation moves, just like the snapshot itself.
+"""
+import bisect
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import NamedTuple
+
+from .catalog import get_snapshot
+
+MAX_RESULTS = 10
+MIN_TRIGRAM_SIMILARITY = 0.25
+MIN_FUZZY_LENGTH = 3
+# Prefix matches scanned before ranking; plenty for MAX_RESULTS.
+SCAN_LIMIT = 200
+
+KIND_PRODUCT = 'product'
+KIND_CATEGORY = 'category'
+# Categories are listed before products with an equally good key.
+KIND_ORDER = {KIND_CATEGORY: 0, KIND_PRODUCT: 1}
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+
+def normalize(text):
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode()
+    return _NON_ALNUM_RE.sub(' ', text.lower()).strip()
+
+
+def compact(text):
+    """``normalize`` without spaces, so "OM-0129 B" and "om0129b" compare equal."""
+    return normalize(text).replace(' ', '')
+
+
+def trigrams(text):
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class Suggestion(NamedTuple):
+    kind: str
+    label: str
+    url: str
+    sku: str
+
+    def as_json(self):
+        data = {'type': self.kind, 'label': self.label, 'url': self.url}
+        if self.sku:
+            data['sku'] = self.sku
+        return data
+
+
+class SuggestIndex:
+    """Sorted prefix keys over one catalog snapshot, plus a trigram index of its words."""
+
+    __slots__ = ('version', 'suggestions', 'keys', 'targets', 'words', 'word_grams', 'gram_counts')
+
+    def __init__(self, version, suggestions, keyed):
+        self.version = version
+        self.suggestions = tuple(suggestions)
+        keyed = sorted(set(keyed))
+        self.keys = [key for key, _ in keyed]
+        self.targets = [target for _, target in keyed]
+
+        # Typo tolerance works word by word against the (small) vocabulary
+        # of the catalog rather than against every label.
+        self.words = sorted({
+            word for suggestion in self.suggestions
+            for word in normalize(suggestion.label).split() if len(word) >= MIN_FUZZY_LENGTH
+        })
+        grams = {}
+        for i, word in enumerate(self.words):
+            for gram in trigrams(word):
+                grams.setdefault(gram, []).append(i)
+        self.word_grams = {gram: tuple(ids) for gram, ids in grams.items()}
+        self.gram_counts = tuple(len(trigrams(word)) for word in self.words)
+
+    def _prefix(self, query, found):
+        start = bisect.bisect_left(self.keys, query)
+        for pos in range(start, min(start + SCAN_LIMIT, len(self.keys))):
+            key = self.keys[pos]
+            if not key.startswith(query):
+                break
+            target = self.targets[pos]
+            # The best (shortest remaining) key of a suggestion wins.
+            rank = (len(key) - len(query), KIND_ORDER[self.suggestions[target].kind])
+            if target not in found or rank < found[target]:
+                found[target] = rank
+
+    def _is_word_prefix(self, word):
+        pos = bisect.bisect_left(self.words, word)
+        return pos < len(self.words) and self.words[pos].startswith(word)
+
+    def _closest_word(self, word):
+        word_grams = trigrams(word)
+        shared = Counter()
+        for gram in word_grams:
+            shared.update(self.word_grams.get(gram, ()))
+        best, best_similarity = None, 0.0
+        for i, common in shared.items():
+            similarity = common / (len(word_grams) + self.gram_counts[i] - common)
+            if similarity > best_similarity:
+                best, best_similarity = self.words[i], similarity
+        return best if best_similarity >= MIN_TRIGRAM_SIMILARITY else None
+
+    def correct(self, query):
+        """``query`` with unknown words replaced by their closest catalog word, or ``None``."""
+        words = query.split()
+        changed = False
+        for i, word in enumerate(words):
+            if len(word) >= MIN_FUZZY_LENGTH and not word.isdigit() and not self._is_word_prefix(word):
+                closest = self._closest_word(word)
+                if closest:
+                    words[i] = closest
+                    changed = True
+        return ' '.join(words) if changed else None
+
+    def _ranked(self, *queries):
+        found = {}
+        for query in queries:
+            self._prefix(query, found)
+        return sorted(found, key=lambda t: (found[t], self.suggestions[t].label))
+
+    def search(self, query, limit=MAX_RESULTS):
+        """Suggestions for ``query``: prefix matches first, then matches of a corrected spelling."""
+        query = normalize(query)
+        if not query:
+            return []
+        ranked = self._ranked(query, query.replace(' ', ''))[:limit]
+        if len(ranked) < limit:
+            corrected = self.correct(query)
+            if corrected:
+                seen = set(ranked)
+                ranked += [t for t in self._ranked(corrected) if t not in seen][:limit - len(ranked)]
+        return [self.suggestions[target] for target in ranked]
+
+
+def build_index(snapshot):
+    suggestions, keyed = [], []
+
+    def add(suggestion, *texts):
+        target = len(suggestions)
+        suggestions.append(suggestion)
+        for text in texts:
+            words = normalize(text).split()
+            for i in range(len(words)):
+                keyed.append((' '.join(words[i:]), target))
+
+    for category in snapshot.categories:
+        add(Suggestion(KIND_CATEGORY, category.name, f'/products/{category.slug}/', ''), category.name)
+    for product in snapshot.products:
+        target = len(suggestions)
+        add(
+            Suggestion(KIND_PRODUCT, product.name, f'/products/{product.category.slug}/{product.slug}/', product.sku or ''),
+            product.name,
+        )
+        if compact(product.sku):
+            keyed.append((compact(product.sku), target))
+    return SuggestIndex(snapshot.version, suggestions, keyed)
+
+
+_index = None
+_lock = threading.Lock()
+
+
+def get_index():
+    """Return the index of the current catalog snapshot, rebuilding it when the catalog changed."""
+    global _index
+    snapshot = get_snapshot()
+    index = _index
+    if index is None or index.version != snapshot.version:
+        with _lock:
+            index = _index
+            if index is None or index.version != snapshot.version:
+                index = build_index(snapshot)
+                _index = index
+    return index
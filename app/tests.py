@@ -1,3 +1,651 @@
-from django.test import TestCase
+import base64
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+import brotli
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from PIL import Image
+
+from . import (
+    artifacts, cache_backends, caching, changes, compression, downloads, generations, prerender, pricelists,
+    richtext, rollups,
+)
+from .models import ActivePriceList, BlogCategory, BlogPost, Enquiry, PriceList, ProductCategory, RollupDirtyDay
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+TEXT = 'Compressible text. ' * 50
+
+
+def _text_view(request):
+    response = HttpResponse(TEXT, content_type='text/plain')
+    response['ETag'] = '"v1"'
+    return response
+
+
+def _stored_variants_view(request):
+    return compression.precompress(HttpResponse(TEXT, content_type='text/plain'))
+
+
+def _rewritten_view(request):
+    # As cache_view hands it out, then changed by a middleware (e.g. a
+    # script injected by django-browser-reload)
+    response = _stored_variants_view(request)
+    response.content = TEXT + 'injected'
+    return response
+
+
+# For the tests' own views (ROOT_URLCONF='app.tests')
+urlpatterns = [
+    path('text/', _text_view),
+    path('stored/', _stored_variants_view),
+    path('rewritten/', _rewritten_view),
+]
+
+
+def _token(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip('=')
+
+
+class ChangesFeedTests(TestCase):
+    url = reverse('api_blog_posts_changes')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = BlogCategory.objects.create(name='News', slug='news')
+
+    def _post(self, title, updated_at):
+        post = BlogPost.objects.create(
+            title=title, excerpt='-', content='<p>Body</p>', category=self.category, author='Staff',
+            published_date=timezone.now(), status='published',
+        )
+        # auto_now stamps save(); set the time the feed should see directly
+        BlogPost.objects.filter(pk=post.pk).update(updated_at=updated_at)
+        return post
+
+    def test_malformed_token(self):
+        for since in ('not-a-token!', _token(['x']), _token([None, 'a', 0, timezone.now().isoformat()])):
+            response = self.client.get(self.url, {'since': since})
+            self.assertEqual(response.status_code, 400, since)
+
+    def test_naive_token(self):
+        for data in ([None, 0, 0, '2026-10-01T00:00:00'],
+                     ['2026-10-01T00:00:00', 1, 0, timezone.now().isoformat()]):
+            response = self.client.get(self.url, {'since': _token(data)})
+            self.assertEqual(response.status_code, 400, data)
+
+    def test_expired_token(self):
+        issued_at = timezone.now() - timedelta(days=changes.TOKEN_MAX_AGE_DAYS + 1)
+        response = self.client.get(self.url, {'since': changes.Cursor(issued_at=issued_at).encode()})
+        self.assertEqual(response.status_code, 410)
+
+    def test_page_ending_on_updated_at_tie(self):
+        stamp = timezone.now() - timedelta(minutes=5)
+        posts = [self._post(f'Post {i}', stamp) for i in range(3)]
+
+        first = self.client.get(self.url, {'limit': 2}).json()
+        self.assertTrue(first['has_more'])
+        self.assertEqual([item['id'] for item in first['changes']], [posts[0].pk, posts[1].pk])
+
+        # The next page resumes after (updated_at, id), not after updated_at
+        second = self.client.get(self.url, {'limit': 2, 'since': first['next']}).json()
+        self.assertFalse(second['has_more'])
+        self.assertEqual([item['id'] for item in second['changes']], [posts[2].pk])
+
+        third = self.client.get(self.url, {'since': second['next']}).json()
+        self.assertEqual(third['changes'], [])
+
+
+class RollupDirtyDayTests(TestCase):
+    def test_update_queryset_marks_days_of_rows_it_no_longer_matches(self):
+        enquiry = Enquiry.objects.create(
+            name='A', email='a@example.com', subject='Price', message='-', ip_address='127.0.0.1',
+        )
+        # Like the changelist filtered on "pending": the rows leave the queryset
+        updated = rollups.update_queryset(Enquiry.objects.filter(is_responded=False), is_responded=True)
+        self.assertEqual(updated, 1)
+        self.assertEqual(
+            list(RollupDirtyDay.objects.values_list('source', 'day')),
+            [('enquiries', timezone.localdate(enquiry.submitted_date))],
+        )
+
+
+class RichTextTests(TestCase):
+    def test_script_only_content_renders_empty(self):
+        self.assertEqual(richtext.render('<script>alert(1)</script>'), '')
+        self.assertEqual(richtext.render('<p>Hi</p><style>p{}</style>'), '<p>Hi</p>')
+
+    def test_event_handlers_and_javascript_urls_are_stripped(self):
+        html = richtext.render('<p onclick="steal()">Hi <a href="javascript:alert(1)" onmouseover="x()">link</a></p>')
+        self.assertEqual(html, '<p>Hi <a>link</a></p>')
+        self.assertNotIn('onerror', richtext.render('<img src="x.jpg" onerror="alert(1)">'))
+
+    def test_allowed_embed_is_kept_and_others_dropped(self):
+        embed = '<iframe src="https://www.youtube.com/embed/abc" width="560" allowfullscreen=""></iframe>'
+        self.assertIn('src="https://www.youtube.com/embed/abc"', richtext.render(embed))
+        self.assertEqual(richtext.render('<p>a</p><iframe src="//evil.example/x"></iframe><p>b</p>'), '<p>a</p><p>b</p>')
+
+    def test_images_get_lazy_loading_size_and_srcset(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        Image.new('RGB', (1200, 800), 'red').save(f'{media_root}/photo.jpg', 'JPEG')
+        with override_settings(MEDIA_ROOT=media_root):
+            html = richtext.render('<p><img src="/media/photo.jpg" alt="Photo"></p>')
+        for attribute in ('loading="lazy"', 'decoding="async"', 'width="1200"', 'height="800"',
+                          '/media/derivatives/photo-480w.jpg 480w', '/media/photo.jpg 1200w'):
+            self.assertIn(attribute, html)
+
+    def test_blog_post_never_falls_back_to_the_source(self):
+        category = BlogCategory.objects.create(name='News', slug='news')
+        post = BlogPost.objects.create(
+            title='Unsafe', excerpt='-', content='<script>alert(1)</script>', category=category,
+            author='Staff', published_date=timezone.now(), status='published',
+        )
+        self.assertEqual(post.content_html, '')
+        response = self.client.get(reverse('individual_blog', args=[post.slug]))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, 'alert(1)')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PrerenderTests(TestCase):
+    def test_render_path_ignores_stale_cached_view(self):
+        host = {'HTTP_HOST': settings.PRERENDER_HOST, 'secure': True}
+        self.assertEqual(self.client.get('/products/', **host).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            ProductCategory.objects.create(name='Freshly Added', slug='freshly-added', description='-')
+
+        # Another worker holds the recompute lock of the cached page
+        acquire = caching._acquire
+        with mock.patch.object(caching, '_acquire',
+                               side_effect=lambda key, timeout: None if key.startswith('view:') else acquire(key, timeout)):
+            self.assertNotContains(self.client.get('/products/', **host), 'Freshly Added')
+            self.assertIn(b'Freshly Added', prerender.render_path('/products/'))
+
+
+class TwoTierCacheTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.location = f'{directory}/cache.sqlite3'
+
+    def _cache(self, **options):
+        options.setdefault('SYNC_INTERVAL_MS', 0)
+        handle = cache_backends.TwoTierCache(self.location, {'OPTIONS': options})
+        self.addCleanup(handle._l2.close)
+        return handle
+
+    def test_delete_reaches_other_handles_l1_after_sync(self):
+        a, b = self._cache(), self._cache()
+        a.set('key', 'one')
+        self.assertEqual(b.get('key'), 'one')
+        self.assertEqual(b.get('key'), 'one')
+        self.assertEqual(b.stats()['l1_hits'], 1)
+
+        a.delete('key')
+        self.assertIsNone(b.get('key'))
+        a.set('key', 'two')
+        self.assertEqual(b.get('key'), 'two')
+
+    def test_l1_is_kept_until_the_sync_interval_passes(self):
+        a, b = self._cache(), self._cache(SYNC_INTERVAL_MS=60000)
+        a.set('key', 'one')
+        self.assertEqual(b.get('key'), 'one')
+        a.delete('key')
+        self.assertEqual(b.get('key'), 'one')
+
+    @mock.patch.object(cache_backends, 'MAX_SYNC_KEYS', 5)
+    def test_cull_keeps_the_last_max_sync_keys_writes(self):
+        a = self._cache(MAX_ENTRIES=4, CULL_FREQUENCY=2)
+        behind = self._cache()
+        a.set('k0', 0)
+        self.assertEqual(behind.get('k0'), 0)
+        for i in range(1, 20):
+            a.set(f'k{i}', i)
+
+        a._l2.cull()
+        # Stamps 1-20: rows up to the horizon (15) may go, the last five stay
+        keys = {row[0] for row in a._l2.connection().execute('SELECT key FROM cache_entries')}
+        self.assertTrue({f':1:k{i}' for i in range(15, 20)} <= keys)
+        self.assertEqual(len(keys), 10)
+        self.assertNotIn(':1:k0', keys)
+        self.assertEqual(a._l2.stamp()[1], 15)
+        # A handle that hadn't seen what was culled drops its whole L1
+        self.assertIsNone(behind.get('k0'))
+
+    def test_expiry(self):
+        a, b = self._cache(), self._cache()
+        with mock.patch.object(cache_backends.time, 'time', return_value=1000.0):
+            a.set('key', 'value', timeout=10)
+            self.assertEqual(b.get('key'), 'value')
+        with mock.patch.object(cache_backends.time, 'time', return_value=1011.0):
+            self.assertIsNone(a.get('key'))
+            self.assertIsNone(b.get('key'))
+            self.assertTrue(b.add('key', 'again', timeout=10))
+            self.assertEqual(a.get('key'), 'again')
+
+    def test_add_is_atomic_across_handles(self):
+        handles = [self._cache() for _ in range(8)]
+        barrier = threading.Barrier(len(handles))
+        results = []
+
+        def add(handle, i):
+            barrier.wait()
+            results.append(handle.add('lock', i, timeout=30))
+            handle._l2.close()
+
+        threads = [threading.Thread(target=add, args=(handle, i)) for i, handle in enumerate(handles)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results.count(True), 1)
+        self.assertFalse(handles[0].add('lock', 'again'))
+        handles[0].delete('lock')
+        self.assertTrue(handles[1].add('lock', 'again'))
+
+    def test_l1_bounds(self):
+        store = cache_backends.LRUStore(max_entries=2, max_bytes=800)
+        store.set('a', b'x' * 10, None)
+        store.set('b', b'x' * 10, None)
+        store.get('a', 0)
+        store.set('c', b'x' * 10, None)
+        self.assertIsNone(store.get('b', 0))
+        self.assertEqual(store.size, 20)
+        # Items over an eighth of the byte budget aren't kept at all
+        store.set('big', b'x' * 101, None)
+        self.assertIsNone(store.get('big', 0))
+        self.assertEqual(len(store), 2)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class GetOrRecomputeTests(SimpleTestCase):
+    key = 'test:value'
+
+    def setUp(self):
+        cache.clear()
+
+    def _counted(self, name, call):
+        before = caching.stats()[name]
+        result = call()
+        self.assertEqual(caching.stats()[name], before + 1, name)
+        return result
+
+    def _hold_lock(self):
+        cache.add(self.key + ':lock', 'another worker', caching.LOCK_TIMEOUT)
+
+    def test_hit(self):
+        compute = mock.Mock(return_value='value')
+        self.assertEqual(caching.get_or_recompute(self.key, compute, beta=0), 'value')
+        self.assertEqual(self._counted('hits', lambda: caching.get_or_recompute(self.key, compute, beta=0)), 'value')
+        compute.assert_called_once()
+
+    def test_version_bump_recomputes(self):
+        compute = mock.Mock(side_effect=['old', 'new'])
+        get = lambda: caching.get_or_recompute(self.key, compute, versions=(generations.BLOG,), beta=0)
+        self.assertEqual(get(), 'old')
+        generations.bump_generation(generations.BLOG)
+        self.assertEqual(self._counted('recomputes', get), 'new')
+
+    def test_stale_value_served_while_lock_is_held(self):
+        get = lambda compute: caching.get_or_recompute(self.key, compute, versions=(generations.BLOG,), beta=0)
+        get(lambda: 'old')
+        generations.bump_generation(generations.BLOG)
+        self._hold_lock()
+        compute = mock.Mock(return_value='new')
+        self.assertEqual(self._counted('stale_served', lambda: get(compute)), 'old')
+        compute.assert_not_called()
+
+    def test_waits_for_the_leader_without_a_previous_value(self):
+        self._hold_lock()
+        version = generations.get_generations(generations.BLOG)
+
+        def leader_finishes(seconds):
+            cache.set(self.key, caching.Entry('from leader', version, float('inf'), 0.0))
+
+        compute = mock.Mock(return_value='own')
+        with mock.patch.object(caching.time, 'sleep', side_effect=leader_finishes):
+            value = self._counted('coalesced', lambda: caching.get_or_recompute(
+                self.key, compute, versions=(generations.BLOG,)))
+        self.assertEqual(value, 'from leader')
+        compute.assert_not_called()
+
+    def test_falls_back_to_computing_when_the_leader_gives_up(self):
+        self._hold_lock()
+        compute = mock.Mock(return_value='own')
+        with mock.patch.object(caching.time, 'sleep', side_effect=lambda s: cache.delete(self.key + ':lock')):
+            value = self._counted('fallbacks', lambda: caching.get_or_recompute(self.key, compute))
+        self.assertEqual(value, 'own')
+        compute.assert_called_once()
+
+    def test_cacheable_veto(self):
+        compute = mock.Mock(side_effect=['error', 'error', 'fine'])
+        get = lambda: caching.get_or_recompute(self.key, compute, beta=0, cacheable=lambda value: value == 'fine')
+        self.assertEqual([get(), get(), get(), get()], ['error', 'error', 'fine', 'fine'])
+        self.assertEqual(compute.call_count, 3)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheViewTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def _view(self, make_response):
+        view = mock.Mock(side_effect=lambda request: make_response())
+        view.__name__ = view.__qualname__ = f'view_{id(view)}'
+        return view, caching.cache_view()(view)
+
+    def _get(self, cached, path='/page/'):
+        return cached(self.factory.get(path))
+
+    def test_ok_responses_are_cached_per_path(self):
+        view, cached = self._view(lambda: HttpResponse('page'))
+        self._get(cached)
+        self.assertEqual(self._get(cached).content, b'page')
+        self._get(cached, '/page/?page=2')
+        self.assertEqual(view.call_count, 2)
+
+    def test_error_responses_are_not_cached(self):
+        view, cached = self._view(lambda: HttpResponse('oops', status=500))
+        self._get(cached)
+        self._get(cached)
+        self.assertEqual(view.call_count, 2)
+
+    def test_responses_setting_cookies_are_not_cached(self):
+        def with_cookie():
+            response = HttpResponse('page')
+            response.set_cookie('session', 'secret')
+            return response
+
+        view, cached = self._view(with_cookie)
+        self._get(cached)
+        self._get(cached)
+        self.assertEqual(view.call_count, 2)
+
+    def test_bypass_cache_always_calls_the_view(self):
+        view, cached = self._view(lambda: HttpResponse('page'))
+        self._get(cached)
+        request = self.factory.get('/page/')
+        request.bypass_cache = True
+        cached(request)
+        self.assertEqual(view.call_count, 2)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class CompressionMiddlewareTests(SimpleTestCase):
+    def _get(self, url, accept):
+        return self.client.get(url, HTTP_ACCEPT_ENCODING=accept)
+
+    def test_negotiation(self):
+        cases = [
+            ('gzip, deflate, br', 'br'),
+            ('gzip', 'gzip'),
+            ('br;q=0, gzip', 'gzip'),
+            ('br; q=0.0, gzip;q=0.5', 'gzip'),
+            ('gzip;q=0', None),
+            ('identity', None),
+            ('', None),
+        ]
+        for accept, expected in cases:
+            with self.subTest(accept=accept):
+                response = self._get('/text/', accept)
+                self.assertEqual(response.get('Content-Encoding'), expected)
+                self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_encoded_response_gets_a_weak_etag(self):
+        response = self._get('/text/', 'gzip')
+        self.assertEqual(response['ETag'], 'W/"v1"')
+        self.assertEqual(gzip.decompress(response.content).decode(), TEXT)
+        self.assertEqual(self._get('/text/', '')['ETag'], '"v1"')
+
+    def test_stored_variant_is_sent_when_the_body_is_unchanged(self):
+        response = self._get('/stored/', 'br')
+        stored = compression.precompress(HttpResponse(TEXT, content_type='text/plain'))
+        self.assertEqual(response.content, getattr(stored, compression.VARIANTS_ATTR)['br'])
+
+    def test_rewritten_body_is_compressed_again(self):
+        response = self._get('/rewritten/', 'br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content).decode(), TEXT + 'injected')
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class PrerenderMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        settings_override = override_settings(PRERENDER_ROOT=root, PRERENDER_ENABLED=True)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        prerender.write_page('/text/', b'<html>prerendered text</html>' * 20)
+
+    def test_picks_the_encoded_sibling(self):
+        cases = [('br, gzip', 'br', brotli.decompress), ('gzip', 'gzip', gzip.decompress), ('', None, bytes)]
+        etags = set()
+        for accept, expected, decode in cases:
+            with self.subTest(accept=accept):
+                response = self.client.get('/text/', HTTP_ACCEPT_ENCODING=accept)
+                self.assertEqual(response['X-Prerendered'], '1')
+                self.assertEqual(response.get('Content-Encoding'), expected)
+                self.assertEqual(decode(b''.join(response.streaming_content)), b'<html>prerendered text</html>' * 20)
+                etags.add(response['ETag'])
+        self.assertEqual(len(etags), 3)
+
+    def test_conditional_request_and_fall_through(self):
+        etag = self.client.get('/text/', HTTP_ACCEPT_ENCODING='gzip')['ETag']
+        response = self.client.get('/text/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        # Query strings go to the live view
+        response = self.client.get('/text/?preview=1')
+        self.assertNotIn('X-Prerendered', response)
+        self.assertEqual(response.content.decode(), TEXT)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ArtifactTests(TestCase):
+    url = reverse('api_blog_categories')
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        settings_override = override_settings(ARTIFACTS_ROOT=root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.root = Path(root)
+        BlogCategory.objects.create(name='News', slug='news')
+
+    def _get(self, accept='', **extra):
+        return self.client.get(self.url, HTTP_ACCEPT_ENCODING=accept, **extra)
+
+    def test_missing_version_is_published_inline(self):
+        response = self._get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(b''.join(response.streaming_content))[0]['slug'], 'news')
+        version = artifacts.ARTIFACTS['blog-categories'].version()
+        for suffix in ('', '.gz', '.br'):
+            self.assertTrue((self.root / 'blog-categories' / f'{version}.json{suffix}').exists())
+
+    def test_strong_etag_and_not_modified(self):
+        etag = self._get()['ETag']
+        self.assertFalse(etag.startswith('W/'))
+        response = self._get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_encoding_choice(self):
+        cases = [('gzip, br', 'br', brotli.decompress), ('gzip', 'gzip', gzip.decompress), ('br;q=0', None, bytes)]
+        for accept, expected, decode in cases:
+            with self.subTest(accept=accept):
+                response = self._get(accept)
+                self.assertEqual(response.get('Content-Encoding'), expected)
+                self.assertIn('Accept-Encoding', response['Vary'])
+                self.assertEqual(json.loads(decode(b''.join(response.streaming_content)))[0]['slug'], 'news')
+
+    def test_query_string_falls_through_to_the_view(self):
+        response = self.client.get(self.url, {'fields': 'slug'})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.streaming)
+        self.assertFalse(response.get('ETag', '').startswith('"blog-categories-'))
+        self.assertFalse((self.root / 'blog-categories').exists())
+
+    def test_publish_keeps_the_last_versions(self):
+        artifact = artifacts.ARTIFACTS['blog-categories']
+        published = []
+        for mtime in range(1, 6):
+            generations.bump_generation(generations.BLOG)
+            path = artifacts.publish(artifact)
+            os.utime(path, (mtime, mtime))
+            published.append(path)
+        artifacts._prune(path.parent, artifacts.KEEP_VERSIONS)
+        remaining = sorted(p.name for p in path.parent.iterdir())
+        expected = sorted(p.name + suffix for p in published[-artifacts.KEEP_VERSIONS:] for suffix in ('', '.gz', '.br'))
+        self.assertEqual(remaining, expected)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ActivePriceListTests(TestCase):
+    def _create(self, version, is_active=True):
+        with self.captureOnCommitCallbacks(execute=True):
+            return PriceList.objects.create(version=version, pdf_file=f'price_lists/{version}.pdf', is_active=is_active)
+
+    def test_activating_a_list_switches_the_pointer(self):
+        first = self._create('v1')
+        self.assertEqual(pricelists.get_active_price_list(), first)
+
+        generation = generations.get_generation(generations.PRICE_LIST)
+        second = self._create('v2')
+        self.assertGreater(generations.get_generation(generations.PRICE_LIST), generation)
+        first.refresh_from_db()
+        self.assertFalse(first.is_active)
+        self.assertEqual(ActivePriceList.objects.get().price_list, second)
+        # The cached list moved on with the generation
+        self.assertEqual(pricelists.get_active_price_list(), second)
+
+        second.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            second.save()
+        self.assertIsNone(pricelists.get_active_price_list())
+
+    def test_failed_switch_leaves_the_previous_list_active(self):
+        first = self._create('v1')
+        with mock.patch.object(ActivePriceList, 'save', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self._create('v2')
+        first.refresh_from_db()
+        self.assertTrue(first.is_active)
+        self.assertEqual(list(PriceList.objects.all()), [first])
+        self.assertEqual(ActivePriceList.objects.get().price_list, first)
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_parse_range(self):
+        size = 1000
+        cases = [
+            ('bytes=0-99', (0, 99)),
+            ('bytes=100-', (100, 999)),
+            ('bytes=900-2000', (900, 999)),
+            ('bytes=-200', (800, 999)),
+            ('bytes=-5000', (0, 999)),
+            ('bytes = 0 - 9', (0, 9)),
+            ('bytes=999-999', (999, 999)),
+            # Ignored: the whole file is sent
+            ('', None),
+            ('bytes=-', None),
+            ('bytes=0-9,20-29', None),
+            ('items=0-9', None),
+            ('bytes=a-b', None),
+            # Not satisfiable: 416
+            ('bytes=1000-', ValueError),
+            ('bytes=1500-1600', ValueError),
+            ('bytes=50-10', ValueError),
+            ('bytes=-0', ValueError),
+        ]
+        for header, expected in cases:
+            with self.subTest(header=header):
+                if expected is ValueError:
+                    with self.assertRaises(ValueError):
+                        downloads.parse_range(header, size)
+                else:
+                    self.assertEqual(downloads.parse_range(header, size), expected)
+
+    def test_empty_file(self):
+        with self.assertRaises(ValueError):
+            downloads.parse_range('bytes=0-', 0)
+        with self.assertRaises(ValueError):
+            downloads.parse_range('bytes=-10', 0)
+
+
+class ServeMediaTests(SimpleTestCase):
+    content = bytes(range(256)) * 4
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        settings_override = override_settings(MEDIA_ROOT=root, MEDIA_ACCEL='')
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        os.makedirs(f'{root}/price_lists')
+        self.path = f'{root}/price_lists/list.pdf'
+        with open(self.path, 'wb') as handle:
+            handle.write(self.content)
+        os.utime(self.path, (1_700_000_000, 1_700_000_000))
+        self.url = '/media/price_lists/list.pdf'
+
+    def _get(self, **headers):
+        return self.client.get(self.url, **headers)
+
+    def _body(self, response):
+        return b''.join(response.streaming_content)
+
+    def test_partial_content(self):
+        response = self._get(HTTP_RANGE='bytes=10-19')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 10-19/{len(self.content)}')
+        self.assertEqual(response['Content-Length'], '10')
+        self.assertEqual(self._body(response), self.content[10:20])
+
+        response = self._get(HTTP_RANGE='bytes=-4')
+        self.assertEqual(self._body(response), self.content[-4:])
+
+    def test_unsatisfiable_range(self):
+        response = self._get(HTTP_RANGE=f'bytes={len(self.content)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(self.content)}')
+
+    def test_if_range(self):
+        full = self._get()
+        self.assertEqual(full['Accept-Ranges'], 'bytes')
+        cases = [
+            (full['ETag'], 206),
+            ('"stale"', 200),
+            (http_date(1_700_000_000), 206),
+            (http_date(1_600_000_000), 200),
+        ]
+        for if_range, status in cases:
+            with self.subTest(if_range=if_range):
+                response = self._get(HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=if_range)
+                self.assertEqual(response.status_code, status)
+                self.assertEqual(len(self._body(response)), 10 if status == 206 else len(self.content))
+
+    def test_offload_to_the_proxy(self):
+        with override_settings(MEDIA_ACCEL='nginx'):
+            response = self._get(HTTP_RANGE='bytes=0-9')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['X-Accel-Redirect'], '/protected-media/price_lists/list.pdf')
+            self.assertEqual(response.content, b'')
+        with override_settings(MEDIA_ACCEL='sendfile'):
+            self.assertEqual(self._get()['X-Sendfile'], self.path)
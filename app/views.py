@@ -1,14 +1,15 @@
 from django.shortcuts import render, get_object_or_404
-from django.http import JsonResponse
-from django.views.decorators.http import require_GET
+from django.core.paginator import Paginator
+from django.http import JsonResponse, HttpResponse, Http404, StreamingHttpResponse
+from django.views.decorators.http import require_GET, require_safe
 from django.views.decorators.csrf import csrf_protect, csrf_exempt
-from django.core import serializers
 from django.utils import timezone
 from django.db.models import Count, Q
 from datetime import datetime, timedelta
+import os
 from .models import (
     ProductCategory, Product, ProductStatus, BlogPost, BlogCategory, 
-    PriceList, ContactFormSubmission, PageSEO, Enquiry
+    PriceList, ContactFormSubmission, PageSEO, Enquiry, normalize_sku
 )
 
 from django.template import Template, Context
@@ -16,6 +17,24 @@ from django.template.loader import get_template
 from django.utils.safestring import mark_safe
 from django.views.decorators.cache import cache_page
 from django.utils.html import strip_tags
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.core.cache import cache
+from django.contrib.admin.views.decorators import staff_member_required
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.utils._os import safe_join
+from . import artifacts, blogindex, changes, compression, downloads, exports, pricelists, serializers, sitemaps, caching, generations, related, recommendations, suggest
+from .caching import cache_view
+from .catalog import get_snapshot, status_facets
+
+# Upper bound on SKUs accepted by one /api/products/by-sku/ request
+MAX_SKUS_PER_LOOKUP = 100
+# Products rendered into /products/; the rest load in pages of PRODUCTS_PAGE_SIZE
+PRODUCTS_FIRST_PAGE = 24
+PRODUCTS_PAGE_SIZE = 48
+# Products per page of a category page
+CATEGORY_PAGE_SIZE = 24
 
 def render_dynamic_content(content, context_dict=None):
     if not content:
@@ -29,20 +48,15 @@ def render_dynamic_content(content, context_dict=None):
     context = Context(context_dict)
     return mark_safe(template.render(context))
 
-# @cache_page(60 * 15)  # Cache for 15 minutes
+@cache_view(versions=(generations.CATALOG, generations.PAGES))
 def home(request):
     # Prefetch related data to reduce queries
     product_categories = ProductCategory.objects.select_related().prefetch_related('products')
     page_content = PageSEO.objects.filter(slug='home').first()
     
-    try:
-        # Use select_related to join with category in a single query
-        best_selling = ProductStatus.objects.get(slug='best-selling')
-        best_selling_products = Product.objects.select_related('category', 'status').filter(
-            status=best_selling
-        ).order_by('-created_at')[:12]
-    except ProductStatus.DoesNotExist:
-        best_selling_products = Product.objects.none()
+    # Product lists come from the in-memory catalog snapshot
+    catalog = get_snapshot()
+    best_selling_products = catalog.products_with_status('best-selling')[:12]
 
     if page_content:
         seo_meta_title = page_content.seo_meta_title or ""
@@ -59,10 +73,7 @@ def home(request):
         seo_meta_keywords = ""
         content1 = content2 = content3 = content4 = content5 = ""
 
-    # Use select_related for category and limit fields if possible
-    new_products = Product.objects.select_related('category').only(
-        'id', 'name', 'slug', 'description', 'image', 'created_at', 'category__name', 'category__slug'
-    ).order_by('-created_at')[:12]
+    new_products = catalog.newest_products[:12]
 
     return render(request, 'pages/home.html', {
         'product_categories': product_categories,
@@ -212,9 +223,13 @@ def enquiry(request):
             
             ip_address = request.META.get('REMOTE_ADDR', '')
             
+            # Link the enquiry to the product its SKU names (no query: catalog snapshot)
+            product = get_snapshot().product_by_sku(sku) if sku else None
+            
             # Save the enquiry
             enquiry_obj = Enquiry.objects.create(
                 sku=sku,
+                product_id=product.id if product else None,
                 name=name,
                 email=email,
                 phone=phone,
@@ -262,8 +277,9 @@ def enquiry(request):
         seo_meta_keywords = "enquiry starbliss pharma, pharmaceutical enquiry, medicine inquiry form"
         content1 = content2 = content3 = content4 = content5 = ""
     
-    # Get SKU from URL parameter for prefilling
+    # Get SKU from URL parameter for prefilling; only SKUs of real products are accepted
     sku = request.GET.get('sku', '')
+    prefilled_product = get_snapshot().product_by_sku(sku) if sku else None
     
     # Get latest products for sidebar with optimized query
     latest_products = Product.objects.select_related('category').only(
@@ -272,7 +288,8 @@ def enquiry(request):
     
     context = {
         'product_categories': product_categories,
-        'prefilled_sku': sku,
+        'prefilled_sku': prefilled_product.sku if prefilled_product else '',
+        'prefilled_product': prefilled_product,
         'latest_products': latest_products,
         'seo_meta_title': seo_meta_title,
         'seo_meta_description': seo_meta_description,
@@ -287,16 +304,22 @@ def enquiry(request):
     
     return render(request, 'pages/enquiry.html', context)
 
-# @cache_page(60 * 15)  # Cache for 15 minutes
+@cache_view(versions=(generations.CATALOG, generations.PAGES))
 def products(request):
-    # Use select_related/prefetch_related to optimize queries
-    product_categories = ProductCategory.objects.select_related().prefetch_related('products')
-    
-    # Optimize products query with select_related and only necessary fields
-    products = Product.objects.select_related('category', 'status').only(
-        'id', 'name', 'slug', 'description', 'image', 'created_at', 
-        'category__name', 'category__slug', 'status__name'
-    ).order_by('-created_at')
+    # The first page and the category chips are rendered from the catalog
+    # snapshot, and the same records are embedded for the Alpine component
+    # so it boots without fetching; later pages come from /api/products/.
+    catalog = get_snapshot()
+    hydration = {
+        'categories': list(serializers.CATEGORIES.from_objects(
+            catalog.categories, tuple(serializers.CATEGORIES.fields)
+        )),
+        'products': list(serializers.PRODUCTS.from_objects(
+            catalog.products[:PRODUCTS_FIRST_PAGE], tuple(serializers.PRODUCTS.fields)
+        )),
+        'total': len(catalog.products),
+        'page_size': PRODUCTS_PAGE_SIZE,
+    }
     
     page_content = PageSEO.objects.filter(slug='products').first()
     
@@ -310,8 +333,9 @@ def products(request):
         seo_meta_keywords = "Products, Pharmaceuticals, Healthcare"
     
     return render(request, 'pages/products.html', {
-        'product_categories': product_categories,
-        'products': products,
+        'product_categories': hydration['categories'],
+        'products': hydration['products'],
+        'hydration': hydration,
         'seo_meta_title': seo_meta_title,
         'seo_meta_description': seo_meta_description,
         'seo_meta_keywords': seo_meta_keywords,
@@ -323,14 +347,33 @@ def category_products(request, category_slug):
     # Optimize product_categories query with prefetch_related
     product_categories = ProductCategory.objects.select_related().prefetch_related('products')
     
-    # Use get_object_or_404 for better error handling and optimize with select_related
-    category = get_object_or_404(ProductCategory.objects.select_related(), slug=category_slug)
-    
-    # Optimize products query with select_related and only necessary fields
-    products = Product.objects.select_related('category', 'status').only(
-        'id', 'name', 'slug', 'description', 'image', 'created_at',
-        'category__name', 'category__slug', 'status__name'
-    ).filter(category=category).order_by('-created_at')
+    # Resolve the category and its products from the catalog snapshot
+    catalog = get_snapshot()
+    category = catalog.categories_by_slug.get(category_slug)
+    if category is None:
+        raise Http404("No ProductCategory matches the given query.")
+    
+    # ?status= narrows to one facet, ?q= searches names and summaries; the
+    # snapshot indexes make a page a tuple slice whatever the category size
+    status = request.GET.get('status', '')
+    if status and status not in catalog.statuses_by_slug:
+        raise Http404("No ProductStatus matches the given query.")
+    search = request.GET.get('q', '').strip()
+    products = catalog.products_in_category(category.id, status)
+    if search:
+        needle = search.lower()
+        products = tuple(p for p in products if needle in p.name.lower() or needle in p.summary.lower())
+    page = Paginator(products, CATEGORY_PAGE_SIZE).get_page(request.GET.get('page'))
+    
+    # Status facet counts (and the category total) are cached per catalog version
+    facets = status_facets(category.id)
+    
+    def page_url(number):
+        query = request.GET.copy()
+        query.pop('page', None)
+        if number > 1:
+            query['page'] = number
+        return f'{request.path}?{query.urlencode()}' if query else request.path
     
     seo_meta_title = category.seo_meta_title or category.name
     seo_meta_description = category.seo_meta_description or category.description
@@ -338,7 +381,14 @@ def category_products(request, category_slug):
     
     return render(request, 'pages/category_products.html', {
         'product_categories': product_categories,
-        'products': products,
+        'products': page.object_list,
+        'page_obj': page,
+        'prev_url': page_url(page.previous_page_number()) if page.has_previous() else None,
+        'next_url': page_url(page.next_page_number()) if page.has_next() else None,
+        'facets': [facet for facet in facets if facet['slug']],
+        'total_products': sum(facet['count'] for facet in facets),
+        'selected_status': status,
+        'search': search,
         'category': category,
         'seo_meta_title': seo_meta_title,
         'seo_meta_description': seo_meta_description,
@@ -350,38 +400,55 @@ def product_in_category(request, category_slug, product_slug):
     # Optimize product_categories query with select_related and prefetch_related
     product_categories = ProductCategory.objects.select_related().prefetch_related('products')
     
-    # Use get_object_or_404 for better error handling and optimize with select_related
-    product = get_object_or_404(
-        Product.objects.select_related('category', 'status'),
-        slug=product_slug, 
-        category__slug=category_slug
-    )
+    # Resolve the product from the catalog snapshot
+    product = get_snapshot().products_by_path.get((category_slug, product_slug))
+    if product is None:
+        raise Http404("No Product matches the given query.")
     
     seo_meta_title = product.seo_meta_title or product.name
     seo_meta_description = product.seo_meta_description or product.description
     seo_meta_keywords = product.seo_meta_keywords or ''
     
+    # "Frequently enquired together": precomputed by build_recommendations
+    recommended_products = recommendations.recommended_products(product.id, limit=4)
+    
     return render(request, 'pages/individual_products.html', {
         'product_categories': product_categories,
         'product': product,
+        'recommended_products': recommended_products,
         'seo_meta_title': seo_meta_title,
         'seo_meta_description': seo_meta_description,
         'seo_meta_keywords': seo_meta_keywords,
     })
 
+def _blog_page_context(request, posts):
+    """Context of one keyset page of ``posts``, narrowed by ``?q=``."""
+    search = request.GET.get('q', '').strip()
+    if search:
+        posts = posts.filter(
+            Q(title__icontains=search) | Q(excerpt__icontains=search) | Q(author__icontains=search)
+        )
+    try:
+        page = blogindex.get_page(posts, before=request.GET.get('before'), after=request.GET.get('after'))
+    except blogindex.InvalidCursor:
+        raise Http404("Invalid page.")
+    return {
+        'blog_posts': page.posts,
+        'page': page,
+        'search': search,
+        'blog_categories': blogindex.categories_with_counts(),
+    }
+
 # @cache_page(60 * 15)  # Cache for 15 minutes
 def blog(request):
     # Optimize product_categories query with select_related and prefetch_related
     product_categories = ProductCategory.objects.select_related().prefetch_related('products')
     
-    # Optimize blog_posts query with select_related and only necessary fields
-    blog_posts = BlogPost.objects.select_related('category').only(
-        'id', 'title', 'slug', 'excerpt', 'author', 'published_date', 
-        'is_featured', 'featured_image', 'category__name', 'category__slug'
-    ).filter(status='published').order_by('-published_date')
-    
-    # Only fetch necessary fields for blog_categories
-    blog_categories = BlogCategory.objects.only('id', 'name', 'slug').all()
+    # One keyset page of posts; featured posts and category counts are cached
+    context = _blog_page_context(request, blogindex.published_posts())
+    is_first_page = not (context['search'] or request.GET.get('before') or request.GET.get('after'))
+    context['featured_posts'] = blogindex.featured_posts() if is_first_page else []
+    context['total_posts'] = sum(category.post_count for category in context['blog_categories'])
     
     page_content = PageSEO.objects.filter(slug='blog').first()
     
@@ -391,8 +458,7 @@ def blog(request):
 
     return render(request, 'pages/blog.html', {
         'product_categories': product_categories,
-        'blog_posts': blog_posts,
-        'blog_categories': blog_categories,
+        **context,
         'seo_meta_title': seo_meta_title,
         'seo_meta_description': seo_meta_description,
         'seo_meta_keywords': seo_meta_keywords,
@@ -410,14 +476,17 @@ def individual_blog(request, slug):
         status='published'
     )
     
-    # Get related posts from the same category with optimized query
-    related_posts = BlogPost.objects.select_related('category').only(
-        'id', 'title', 'slug', 'excerpt', 'published_date', 'featured_image',
-        'category__name', 'category__slug'
-    ).filter(
-        category=post.category, 
-        status='published'
-    ).exclude(id=post.id).order_by('-published_date')[:3]
+    # Related posts come from the precomputed TF-IDF index (app/related.py);
+    # posts it has not reached yet fall back to the newest in the same category.
+    related_posts = related.related_posts_for(post, limit=3)
+    if not related_posts:
+        related_posts = BlogPost.objects.select_related('category').only(
+            'id', 'title', 'slug', 'excerpt', 'published_date', 'featured_image',
+            'category__name', 'category__slug'
+        ).filter(
+            category=post.category, 
+            status='published'
+        ).exclude(id=post.id).order_by('-published_date')[:3]
 
     seo_meta_title = post.seo_meta_title or post.title
     seo_meta_description = post.seo_meta_description or post.excerpt
@@ -437,20 +506,15 @@ def blog_category(request, category_slug):
     # Optimize product_categories query with select_related and prefetch_related
     product_categories = ProductCategory.objects.select_related().prefetch_related('products')
     
-    # Use get_object_or_404 with optimized query
-    blog_category = get_object_or_404(BlogCategory.objects.only('id', 'name', 'slug'), slug=category_slug)
-    
-    # Optimize blog_posts query with select_related and only necessary fields
-    blog_posts = BlogPost.objects.select_related('category').only(
-        'id', 'title', 'slug', 'excerpt', 'author', 'published_date', 
-        'is_featured', 'featured_image', 'category__name', 'category__slug'
-    ).filter(
-        category=blog_category, 
-        status='published'
-    ).order_by('-published_date')
+    # The category comes from the cached category list (with post counts)
+    blog_category = next(
+        (category for category in blogindex.categories_with_counts() if category.slug == category_slug), None
+    )
+    if blog_category is None:
+        raise Http404("No BlogCategory matches the given query.")
     
-    # Only fetch necessary fields for blog_categories
-    blog_categories = BlogCategory.objects.only('id', 'name', 'slug').all()
+    context = _blog_page_context(request, blogindex.published_posts().filter(category_id=blog_category.id))
+    context['total_posts'] = sum(category.post_count for category in context['blog_categories'])
     
     seo_meta_title = f"{blog_category.name} - Blog"
     seo_meta_description = f"Read articles about {blog_category.name} from starbliss Pharma blog."
@@ -458,8 +522,7 @@ def blog_category(request, category_slug):
     
     return render(request, 'pages/blog.html', {
         'product_categories': product_categories,
-        'blog_posts': blog_posts,
-        'blog_categories': blog_categories,
+        **context,
         'selected_category': blog_category,
         'seo_meta_title': seo_meta_title,
         'seo_meta_description': seo_meta_description,
@@ -471,10 +534,8 @@ def price_list(request):
     # Optimize product_categories query with select_related and prefetch_related
     product_categories = ProductCategory.objects.select_related().prefetch_related('products')
     
-    # Get the active price list with optimized query
-    price_list = PriceList.objects.only(
-        'id', 'title', 'description', 'pdf_file', 'is_active'
-    ).filter(is_active=True).first()
+    # Cached until the active list is switched or edited
+    price_list = pricelists.get_active_price_list()
     
     page_content = PageSEO.objects.filter(slug='price-list').first()
     
@@ -490,82 +551,191 @@ def price_list(request):
         'seo_meta_keywords': seo_meta_keywords,
     })
 
-# @cache_page(60 * 5)  # Cache for 5 minutes for API
 @require_GET
 @csrf_exempt
+@artifacts.serve_artifact('products')
+@cache_view(timeout=60 * 5, versions=(generations.CATALOG,))
 def api_products(request):
+    """
+    Catalog products; ``?fields=id,name`` limits the fields of each record
+    and ``?offset=&limit=`` returns one page of them.
+    """
     try:
-        # Optimize query with select_related and only necessary fields
-        products = Product.objects.select_related('category').only(
-            'id', 'name', 'slug', 'description', 'image',
-            'category__id', 'category__name', 'category__slug'
-        ).all()
-        
-        data = []
-        for p in products:
-            data.append({
-                'id': p.id,
-                'name': strip_tags(p.name),
-                'slug': p.slug,
-                'description': strip_tags(p.description)[:200] + '...' if len(strip_tags(p.description)) > 200 else strip_tags(p.description),
-                'image': p.image.url if p.image else '',
-                'category': {
-                    'id': p.category.id,
-                    'name': strip_tags(p.category.name),
-                    'slug': p.category.slug,
-                } if p.category else None,
-            })
-        return JsonResponse(data, safe=False)
+        names = serializers.PRODUCTS.select(request.GET.get('fields'))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    try:
+        offset = max(int(request.GET.get('offset', 0)), 0)
+        limit = max(int(request.GET['limit']), 0) if 'limit' in request.GET else None
+    except ValueError:
+        return JsonResponse({'error': 'offset and limit must be integers'}, status=400)
+    try:
+        # Records come from the catalog snapshot with the summary precomputed
+        products = get_snapshot().products
+        products = products[offset:None if limit is None else offset + limit]
+        return serializers.json_response(serializers.PRODUCTS.from_objects(products, names), len(products))
     except Exception as e:
         return JsonResponse({'error': 'Unable to fetch products'}, status=500)
 
-# @cache_page(60 * 10)  # Cache for 10 minutes for API
+def _changes_response(request, feed):
+    try:
+        limit = min(max(int(request.GET.get('limit', changes.DEFAULT_LIMIT)), 1), changes.MAX_LIMIT)
+    except ValueError:
+        limit = changes.DEFAULT_LIMIT
+    try:
+        data = changes.FEEDS[feed].changes(request.GET.get('since'), limit=limit)
+    except changes.ExpiredToken as e:
+        return JsonResponse({'error': str(e)}, status=410)
+    except changes.InvalidToken as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    return JsonResponse(data)
+
+@require_GET
+@csrf_exempt
+def api_products_changes(request):
+    """Products created or updated after ``?since=<token>``, plus deletions and the next token."""
+    return _changes_response(request, 'products')
+
+@require_GET
+def api_export(request, name):
+    """
+    NDJSON dump of ``products`` or ``blog-posts`` in id order, streamed with
+    flat memory; ``?after_id=`` resumes after the last line received.
+    """
+    export = exports.EXPORTS.get(name)
+    if export is None:
+        raise Http404("Unknown export")
+    try:
+        after_id = max(int(request.GET.get('after_id', 0)), 0)
+    except ValueError:
+        return JsonResponse({'error': 'after_id must be an integer'}, status=400)
+    chunks = exports.lines(export, after_id)
+    gzipped = 'gzip' in compression.accepted_encodings(request)
+    response = StreamingHttpResponse(exports.gzipped(chunks) if gzipped else chunks, content_type=exports.CONTENT_TYPE)
+    if gzipped:
+        response['Content-Encoding'] = 'gzip'
+    response['Content-Disposition'] = f'attachment; filename="{name}.ndjson"'
+    response['Cache-Control'] = 'no-store'
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
 @require_GET
 @csrf_exempt
+def api_product_recommendations(request, product_id):
+    if product_id not in get_snapshot().products_by_id:
+        return JsonResponse({'error': 'Product not found'}, status=404)
+    try:
+        limit = min(max(int(request.GET.get('limit', recommendations.TOP_N)), 1), recommendations.TOP_N)
+    except ValueError:
+        limit = recommendations.TOP_N
+    data = [{
+        'id': p.id,
+        'name': strip_tags(p.name),
+        'slug': p.slug,
+        'sku': p.sku,
+        'image': p.image.url,
+        'url': f'/products/{p.category.slug}/{p.slug}/',
+        'category': {'id': p.category.id, 'name': strip_tags(p.category.name), 'slug': p.category.slug},
+    } for p in recommendations.recommended_products(product_id, limit=limit)]
+    return JsonResponse(data, safe=False)
+
+@require_GET
+@csrf_exempt
+def api_products_by_sku(request):
+    """
+    Batch SKU lookup: ``?sku=A&sku=B`` (or ``?sku=A,B``). Resolved with one
+    query on the indexed normalized SKU; unknown SKUs map to ``null``.
+    """
+    requested = []
+    for value in request.GET.getlist('sku'):
+        requested.extend(part.strip() for part in value.split(',') if part.strip())
+    if not requested:
+        return JsonResponse({'error': 'Pass at least one sku parameter'}, status=400)
+    if len(requested) > MAX_SKUS_PER_LOOKUP:
+        return JsonResponse({'error': f'At most {MAX_SKUS_PER_LOOKUP} SKUs per request'}, status=400)
+
+    products = {}
+    rows = Product.objects.select_related('category').filter(
+        sku_normalized__in={normalize_sku(sku) for sku in requested}
+    ).order_by('-created_at', '-id')
+    for p in rows:
+        # Duplicated SKUs resolve to the newest product, as everywhere else.
+        products.setdefault(p.sku_normalized, p)
+
+    data = {}
+    for sku in requested:
+        p = products.get(normalize_sku(sku))
+        data[sku] = {
+            'id': p.id,
+            'name': strip_tags(p.name),
+            'slug': p.slug,
+            'sku': p.sku,
+            'image': p.image.url if p.image else '',
+            'url': f'/products/{p.category.slug}/{p.slug}/',
+            'category': {'id': p.category.id, 'name': strip_tags(p.category.name), 'slug': p.category.slug},
+        } if p else None
+    return JsonResponse({'results': data})
+
+@require_GET
+def api_suggest(request):
+    """
+    Typeahead suggestions from the in-memory index (app/suggest.py). The
+    response carries the catalog version as ``v``; clients send it back with
+    later requests, and responses for the current version are cacheable for
+    a year since a catalog change produces a new version (and new URLs).
+    """
+    index = suggest.get_index()
+    query = request.GET.get('q', '')[:100]
+    try:
+        limit = min(max(int(request.GET.get('limit', suggest.MAX_RESULTS)), 1), suggest.MAX_RESULTS)
+    except ValueError:
+        limit = suggest.MAX_RESULTS
+    results = [item.as_json() for item in index.search(query, limit)]
+    response = JsonResponse({'v': index.version, 'results': results})
+    if request.GET.get('v') == str(index.version):
+        patch_cache_control(response, public=True, max_age=60 * 60 * 24 * 365, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=60)
+    return response
+
+@require_GET
+@csrf_exempt
+@artifacts.serve_artifact('categories')
 def api_categories(request):
     try:
-        # Only fetch necessary fields
-        categories = ProductCategory.objects.only('id', 'name', 'slug').all()
+        categories = get_snapshot().categories
         data = [{'id': c.id, 'name': c.name, 'slug': c.slug} for c in categories]
         return JsonResponse(data, safe=False)
     except Exception as e:
         return JsonResponse({'error': 'Unable to fetch categories'}, status=500)
 
-# @cache_page(60 * 5)  # Cache for 5 minutes for API
 @require_GET
 @csrf_exempt
+@artifacts.serve_artifact('blog-posts')
+@cache_view(timeout=60 * 5, versions=(generations.BLOG,))
 def api_blog_posts(request):
+    """Published posts, newest first; ``?fields=`` as for ``api_products``."""
     try:
-        # Optimize query with select_related and only necessary fields
-        blog_posts = BlogPost.objects.select_related('category').only(
-            'id', 'title', 'slug', 'excerpt', 'author', 'published_date', 
-            'is_featured', 'featured_image', 'category__id', 'category__name'
-        ).filter(status='published').order_by('-published_date')
-        
-        data = []
-        for post in blog_posts:
-            data.append({
-                'id': post.id,
-                'title': post.title,
-                'slug': post.slug,
-                'excerpt': post.excerpt[:300] + '...' if len(post.excerpt) > 300 else post.excerpt,  # Limit excerpt length
-                'author': post.author,
-                'published_date': post.published_date.isoformat(),
-                'is_featured': post.is_featured,
-                'featured_image': post.featured_image.url if post.featured_image else None,
-                'category': {
-                    'id': post.category.id,
-                    'name': post.category.name,
-                } if post.category else None,
-                'tags': post.get_tags_list() if hasattr(post, 'get_tags_list') else [],
-            })
-        return JsonResponse(data, safe=False)
+        names = serializers.BLOG_POSTS.select(request.GET.get('fields'))
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    try:
+        blog_posts = BlogPost.objects.filter(status='published').order_by('-published_date')
+        return serializers.json_response(
+            serializers.BLOG_POSTS.from_queryset(blog_posts, names), blog_posts.count()
+        )
     except Exception as e:
         return JsonResponse({'error': 'Unable to fetch blog posts'}, status=500)
 
-# @cache_page(60 * 10)  # Cache for 10 minutes for API
 @require_GET
 @csrf_exempt
+def api_blog_posts_changes(request):
+    """Blog posts changed after ``?since=<token>``; unpublished and deleted posts come as tombstones."""
+    return _changes_response(request, 'blog-posts')
+
+@require_GET
+@csrf_exempt
+@artifacts.serve_artifact('blog-categories')
 def api_blog_categories(request):
     try:
         # Only fetch necessary fields
@@ -576,3 +746,57 @@ def api_blog_categories(request):
         return JsonResponse({'error': 'Unable to fetch blog categories'}, status=500)
 
 
+
+
+def _sitemap_response(request, xml, lastmod, etag):
+    last_modified = int(lastmod.timestamp()) if lastmod else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = HttpResponse(xml, content_type='application/xml; charset=utf-8')
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'public, max-age=3600'
+    return response
+
+@require_GET
+def sitemap_index(request):
+    base_url = f"{request.scheme}://{request.get_host()}"
+    xml, lastmod = sitemaps.build_index(base_url)
+    etag = '"index-%s"' % '-'.join(str(g) for g in sitemaps.index_version())
+    return _sitemap_response(request, xml, lastmod, etag)
+
+@require_GET
+def sitemap_section(request, section, page):
+    section_obj = sitemaps.SECTIONS.get(section)
+    if section_obj is None or page < 1:
+        raise Http404("Unknown sitemap")
+    base_url = f"{request.scheme}://{request.get_host()}"
+    result = sitemaps.build_section(section_obj, page, base_url)
+    if result is None:
+        raise Http404("Unknown sitemap page")
+    xml, lastmod = result
+    etag = '"%s-%d-%s"' % (section, page, '-'.join(str(g) for g in sitemaps.section_version(section_obj)))
+    return _sitemap_response(request, xml, lastmod, etag)
+
+
+@require_GET
+@staff_member_required
+def api_cache_stats(request):
+    """Cache hit ratios per tier, as seen by the worker answering the request."""
+    stats = cache.stats() if hasattr(cache, 'stats') else {}
+    stats['stampede'] = caching.stats()
+    stats['pid'] = os.getpid()
+    return JsonResponse(stats)
+
+
+@require_safe
+def serve_media(request, path):
+    """Uploaded files (MEDIA_URL), with Range support and optional X-Accel-Redirect/X-Sendfile offload."""
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404("File not found")
+    if not os.path.isfile(full_path):
+        raise Http404("File not found")
+    return downloads.file_response(request, full_path)
@@ -0,0 +1,107 @@
+"""
+Rows/sec of the /api/blog-posts/ serialization, old path vs app.serializers.
+
+    python benchmarks/api_serialization.py [--rows 10000 100000]
+
+Runs against a throwaway test database (nothing touches db.sqlite3):
+"before" loads model instances, goes through FieldFile.url per row and
+hands a list to JsonResponse; "after" reads values_list tuples, builds media
+URLs from the precomputed prefix and encodes incrementally.
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'starbliss.settings')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.http import JsonResponse  # noqa: E402
+from django.test.utils import setup_test_environment, teardown_test_environment  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from app import serializers  # noqa: E402
+from app.models import BlogCategory, BlogPost  # noqa: E402
+
+
+def before(queryset):
+    data = []
+    for post in queryset.select_related('category').only(
+        'id', 'title', 'slug', 'excerpt', 'author', 'published_date',
+        'is_featured', 'featured_image', 'category__id', 'category__name'
+    ):
+        data.append({
+            'id': post.id,
+            'title': post.title,
+            'slug': post.slug,
+            'excerpt': post.excerpt[:300] + '...' if len(post.excerpt) > 300 else post.excerpt,
+            'author': post.author,
+            'published_date': post.published_date.isoformat(),
+            'is_featured': post.is_featured,
+            'featured_image': post.featured_image.url if post.featured_image else None,
+            'category': {'id': post.category.id, 'name': post.category.name} if post.category else None,
+            'tags': [],
+        })
+    return JsonResponse(data, safe=False).content
+
+
+def after(queryset, fields=None):
+    serializer = serializers.BLOG_POSTS
+    names = serializer.select(fields)
+    return b''.join(serializers.encode_chunks(serializer.from_queryset(queryset, names)))
+
+
+def populate(rows):
+    """Top the table up to ``rows`` posts."""
+    category, _ = BlogCategory.objects.get_or_create(name='Benchmark', defaults={'slug': 'benchmark'})
+    now = timezone.now()
+    BlogPost.objects.bulk_create([
+        BlogPost(
+            title=f'Post {i}', slug=f'post-{i}', excerpt='An excerpt of moderate length. ' * 4,
+            content='<p>Body</p>', category=category, author='Author', published_date=now,
+            status='published', featured_image=f'blog/image {i}.jpg' if i % 2 else None,
+        )
+        for i in range(BlogPost.objects.count(), rows)
+    ], batch_size=2000)
+
+
+def measure(label, rows, func, repeat=3):
+    best = min(_timed(func) for _ in range(repeat))
+    print(f'{rows:>8} rows  {label:<28} {best * 1000:9.1f} ms  {rows / best:>12,.0f} rows/s')
+
+
+def _timed(func):
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        for rows in args.rows:
+            populate(rows)
+            queryset = BlogPost.objects.filter(status='published').order_by('-published_date')
+            assert before(queryset).replace(b' ', b'') == after(queryset).replace(b' ', b'')
+            measure('before (instances)', rows, lambda: before(queryset))
+            measure('after (values_list)', rows, lambda: after(queryset))
+            measure('after ?fields=id,title,slug', rows, lambda: after(queryset, 'id,title,slug'))
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Time to first product on /products/: client-fetched vs server-rendered.
+
+    python benchmarks/products_first_paint.py [--products 200 2000] [--rtt 50]
+
+Runs against a throwaway test database (nothing touches db.sqlite3 or the
+published artifacts). "before" is the old boot sequence: the page, then
+/api/categories/ and /api/products/ fetched in parallel once Alpine starts,
+so the first product shows after two round trips plus the slower of the two
+API responses. "after" is the server-rendered page: one round trip, with
+the first page of products and its hydration data in the HTML. Server time
+is measured with the test client; ``--rtt`` adds the network round trip
+(script download and parse time are left out, which flatters "before").
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'starbliss.settings')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.cache import cache  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client, override_settings  # noqa: E402
+from django.test.utils import setup_test_environment, teardown_test_environment  # noqa: E402
+
+from app import generations  # noqa: E402
+from app.models import Product, ProductCategory  # noqa: E402
+
+
+def populate(count):
+    """Top the catalog up to ``count`` products."""
+    categories = [
+        ProductCategory.objects.get_or_create(name=f'Category {i}', defaults={'slug': f'category-{i}'})[0]
+        for i in range(8)
+    ]
+    Product.objects.bulk_create([
+        Product(
+            name=f'Product {i}', slug=f'product-{i}', sku=f'SKU-{i}',
+            description='<p>' + 'A description of moderate length. ' * 12 + '</p>',
+            content='<p>Body</p>', category=categories[i % len(categories)], image=f'products/p{i}.jpg',
+        )
+        for i in range(Product.objects.count(), count)
+    ], batch_size=2000)
+    # bulk_create sends no signals: move the catalog on by hand
+    generations.bump_generation(generations.CATALOG)
+
+
+def fetch(client, url):
+    """Server time and body size of one GET of ``url``."""
+    started = time.perf_counter()
+    response = client.get(url, HTTP_ACCEPT_ENCODING='gzip, br')
+    body = b''.join(response.streaming_content) if response.streaming else response.content
+    elapsed = time.perf_counter() - started
+    assert response.status_code == 200, (url, response.status_code)
+    return elapsed, len(body)
+
+
+def before(client, rtt):
+    page, page_bytes = fetch(client, '/products/')
+    categories, categories_bytes = fetch(client, '/api/categories/')
+    products, products_bytes = fetch(client, '/api/products/')
+    return page + rtt + max(categories, products) + rtt, page_bytes + categories_bytes + products_bytes
+
+
+def after(client, rtt):
+    page, page_bytes = fetch(client, '/products/')
+    return page + rtt, page_bytes
+
+
+def measure(label, count, func, cold, repeat=5):
+    runs = []
+    for _ in range(repeat):
+        if cold:
+            cache.clear()
+        runs.append(func())
+    best, size = min(runs)
+    print(f'{count:>7} products  {label:<22} {best * 1000:8.1f} ms  {size / 1024:9.1f} KiB before first product')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--products', type=int, nargs='+', default=[200, 2000])
+    parser.add_argument('--rtt', type=float, default=50, help='Network round trip in ms (default: 50).')
+    args = parser.parse_args()
+    rtt = args.rtt / 1000
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        with tempfile.TemporaryDirectory() as root, override_settings(ARTIFACTS_ROOT=root, DEBUG=False):
+            client = Client(HTTP_HOST='localhost')
+            for count in args.products:
+                populate(count)
+                for cold in (True, False):
+                    state = 'cold' if cold else 'warm'
+                    measure(f'before ({state})', count, lambda: before(client, rtt), cold)
+                    measure(f'after ({state})', count, lambda: after(client, rtt), cold)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
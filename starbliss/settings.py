@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from django.templatetags.static import static
 
 load_dotenv()  # Load environment variables from .env file
 
@@ -75,13 +76,13 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'whitenoise.runserver_nostatic',  # runserver leaves static files to WhiteNoise too
     'django.contrib.staticfiles',
     'app',
     'tailwind',
     'theme',  # Tailwind CSS app
     'django_summernote',
     'fontawesomefree',
-    # 'whitenoise.runserver_nostatic',  # Keep WhiteNoise for static file serving
 ]
 
 
@@ -94,7 +95,9 @@ else:
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    # 'whitenoise.middleware.WhiteNoiseMiddleware',  # WhiteNoise must be after SecurityMiddleware
+    'whitenoise.middleware.WhiteNoiseMiddleware',  # WhiteNoise must be after SecurityMiddleware
+    'app.middleware.CompressionMiddleware',  # br/gzip; must wrap everything that changes the body
+    'app.middleware.PrerenderMiddleware',  # Serves pre-rendered pages before any view runs
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -142,6 +145,25 @@ DATABASES = {
 }
 
 
+# Cache
+# Per-process LRU in front of a SQLite store shared by all Gunicorn workers
+# (see app/cache_backends.py).
+
+CACHES = {
+    'default': {
+        'BACKEND': 'app.cache_backends.TwoTierCache',
+        'LOCATION': BASE_DIR / 'cache' / 'default.sqlite3',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 50000,
+            'L1_MAX_ENTRIES': 2000,
+            'L1_MAX_BYTES': 32 * 1024 * 1024,
+            'SYNC_INTERVAL_MS': 100,
+        },
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -184,6 +206,29 @@ STATICFILES_DIRS = [BASE_DIR / 'static']  # Remove or adjust if 'static' folder
 # Media files (Uploaded images, etc.)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# Hand media transfers to the front proxy: "nginx" (X-Accel-Redirect to
+# MEDIA_ACCEL_PREFIX, an internal location aliased to MEDIA_ROOT),
+# "sendfile" (X-Sendfile, Apache/lighttpd) or "" to stream from Django.
+MEDIA_ACCEL = os.getenv("MEDIA_ACCEL", "").lower()
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+
+# Pre-rendered public pages (python manage.py prerender)
+PRERENDER_ROOT = BASE_DIR / 'prerendered'
+PRERENDER_ENABLED = os.getenv("PRERENDER_ENABLED", str(not DEBUG)).lower() in ("true", "1", "t")
+PRERENDER_HOST = os.getenv("PRERENDER_HOST", "starblisspharma.co.in")
+PRERENDER_DEBOUNCE_SECONDS = 2
+
+# Pre-serialized API payloads (python manage.py publish_artifacts)
+ARTIFACTS_ROOT = BASE_DIR / 'artifacts'
+
+# Archived inbox rows (python manage.py archive_inbox)
+ARCHIVE_ROOT = BASE_DIR / 'archive'
+INBOX_ARCHIVE_AFTER_DAYS = int(os.getenv("INBOX_ARCHIVE_AFTER_DAYS", "180"))
+
+# Unreferenced media files (python manage.py media_gc): only files older
+# than the grace period are touched; --quarantine moves them here
+MEDIA_QUARANTINE_ROOT = BASE_DIR / 'media-quarantine'
+MEDIA_GC_GRACE_DAYS = int(os.getenv("MEDIA_GC_GRACE_DAYS", "7"))
 
 
 # # Additional security settings
@@ -203,12 +248,25 @@ if not DEBUG:
 
 
 
+# collectstatic writes content-hashed copies of every asset plus .gz/.br
+# siblings; WhiteNoise serves those with "Cache-Control: immutable" and
+# handles Range requests (hero.mp4). Behind nginx, alias /static/ to
+# STATIC_ROOT instead and the middleware never sees those requests.
 if DEBUG==True:
-    DEFAULT_FILE_STORAGE = "django.core.files.storage.FileSystemStorage"
-    STATICFILES_STORAGE = "django.contrib.staticfiles.storage.StaticFilesStorage"
+    STATICFILES_BACKEND = "django.contrib.staticfiles.storage.StaticFilesStorage"
 else:
-    DEFAULT_FILE_STORAGE = "django.core.files.storage.FileSystemStorage"
-    STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+    STATICFILES_BACKEND = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": STATICFILES_BACKEND},
+}
+
+# Templates or settings that name an asset missing from the manifest get the
+# unhashed URL instead of a 500.
+WHITENOISE_MANIFEST_STRICT = False
+# Unhashed URLs (the fallback above) may change on deploy, so keep them short-lived.
+WHITENOISE_MAX_AGE = 0 if DEBUG else 60 * 10
 
 
 # Default primary key field type
@@ -272,12 +330,12 @@ UNFOLD = {
     "SITE_HEADER": "starbliss Admin",
     "SITE_URL": "/",
     "SITE_ICON": {
-        "light": lambda request: "/static/assets/images/logo.avif",  # path to your logo
-        "dark": lambda request: "/static/assets/images/logo.avif",   # path to your logo
+        "light": lambda request: static("assets/images/logo.avif"),  # path to your logo
+        "dark": lambda request: static("assets/images/logo.avif"),   # path to your logo
     },
     "SITE_LOGO": {
-        "light": lambda request: "/static/assets/images/logo.avif",  # path to your logo
-        "dark": lambda request: "/static/assets/images/logo.avif",   # path to your logo
+        "light": lambda request: static("assets/images/logo.avif"),  # path to your logo
+        "dark": lambda request: static("assets/images/logo.avif"),   # path to your logo
     },
     "SITE_SYMBOL": "A",  # symbol for the sidebar
     "SITE_FAVICONS": [
@@ -285,13 +343,13 @@ UNFOLD = {
             "rel": "icon",
             "sizes": "32x16",
             "type": "image/png",
-            "href": lambda request: "/static/assets/images/favicon.ico",
+            "href": lambda request: static("assets/images/favicon.ico"),
         },
     ],
     "SHOW_HISTORY": True,
     "SHOW_VIEW_ON_SITE": True,
     "ENVIRONMENT": "starbliss.settings.environment_callback",
-    # "DASHBOARD_CALLBACK": "starbliss.settings.dashboard_callback",  # Temporarily disabled
+    "DASHBOARD_CALLBACK": "app.dashboard.dashboard_callback",  # reads the daily rollups only
     "COLORS": {
         "primary": {
             "50": "239 68 68",  # red-500 - starbliss red theme
@@ -332,17 +390,17 @@ UNFOLD = {
         "show_search": True,
         "show_all_applications": True,
         "navigation": [
-            # {
-            #     "title": "Dashboard",
-            #     "separator": True,
-            #     "items": [
-            #         {
-            #             "title": "Analytics",
-            #             "icon": "dashboard",
-            #             "link": lambda request: "/admin/",
-            #         },
-            #     ],
-            # },
+            {
+                "title": "Dashboard",
+                "separator": True,
+                "items": [
+                    {
+                        "title": "Analytics",
+                        "icon": "dashboard",
+                        "link": lambda request: "/admin/",
+                    },
+                ],
+            },
             {
                 "title": "Communications",
                 "separator": True,
@@ -357,6 +415,11 @@ UNFOLD = {
                         "icon": "contact_mail",
                         "link": lambda request: "/admin/app/contactformsubmission/",
                     },
+                    {
+                        "title": "Archive",
+                        "icon": "inventory_2",
+                        "link": lambda request: "/admin/app/archivedrecord/",
+                    },
                 ],
             },
             {
@@ -476,6 +539,7 @@ UNFOLD = {
             "models": [
                 "app.enquiry",
                 "app.contactformsubmission",
+                "app.archivedrecord",
             ],
             "items": [
                 {
@@ -486,6 +550,10 @@ UNFOLD = {
                     "title": "Contact Forms",
                     "link": lambda request: "/admin/app/contactformsubmission/",
                 },
+                {
+                    "title": "Archive",
+                    "link": lambda request: "/admin/app/archivedrecord/",
+                },
             ],
         },
     ],
@@ -15,9 +15,8 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
-from django.conf.urls.static import static
 
 
 from app import views
@@ -43,19 +42,30 @@ urlpatterns = [
 
     # Public APIs
     path('api/products/', views.api_products, name='api_products'),
+    path('api/products/changes/', views.api_products_changes, name='api_products_changes'),
+    path('api/products/by-sku/', views.api_products_by_sku, name='api_products_by_sku'),
+    path('api/products/<int:product_id>/recommendations/', views.api_product_recommendations, name='api_product_recommendations'),
+    path('api/suggest/', views.api_suggest, name='api_suggest'),
     path('api/categories/', views.api_categories, name='api_categories'),
     path('api/blog-posts/', views.api_blog_posts, name='api_blog_posts'),
+    path('api/blog-posts/changes/', views.api_blog_posts_changes, name='api_blog_posts_changes'),
     path('api/blog-categories/', views.api_blog_categories, name='api_blog_categories'),
+    path('api/export/<slug:name>.ndjson', views.api_export, name='api_export'),
+    path('api/cache-stats/', views.api_cache_stats, name='api_cache_stats'),
+
+    # Sitemaps
+    path('sitemap.xml', views.sitemap_index, name='sitemap_index'),
+    path('sitemap-<slug:section>-<int:page>.xml', views.sitemap_section, name='sitemap_section'),
 ]
 
 
-urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Uploaded files; nginx normally serves /media/ itself (see README)
+urlpatterns += [
+    re_path(r'^%s(?P<path>.+)$' % settings.MEDIA_URL.lstrip('/'), views.serve_media, name='media'),
+]
 
 if settings.DEBUG:
     # Include django_browser_reload URLs only in DEBUG mode
     urlpatterns += [
         path("__reload__/", include("django_browser_reload.urls")),
     ]
-    # Serve static and media files in development
-    
@@ -7,14 +7,10 @@ document.addEventListener('DOMContentLoaded', function() {
     const errorMessage = document.getElementById('error-message');
     const errorText = document.getElementById('error-text');
 
-    // Check if SKU is provided in URL parameters
-    const urlParams = new URLSearchParams(window.location.search);
-    const sku = urlParams.get('sku');
-    const skuContainer = document.getElementById('sku-container');
+    // The server only prefills the SKU when it belongs to a real product
+    const sku = document.getElementById('id_sku').value;
     
     if (sku) {
-        document.getElementById('id_sku').value = sku;
-        skuContainer.style.display = 'block';
         // Pre-fill subject if SKU is provided
         const subjectField = document.getElementById('id_subject');
         if (!subjectField.value) {
@@ -22,6 +18,27 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    // SKU suggestions: product names and codes from /api/suggest/
+    const skuInput = document.getElementById('id_sku');
+    const skuList = document.getElementById('sku-suggestions');
+    let skuTimer = null;
+    skuInput.addEventListener('input', function() {
+        clearTimeout(skuTimer);
+        skuTimer = setTimeout(async function() {
+            const query = skuInput.value;
+            const results = await StarblissSuggest.suggest(query, 8);
+            if (query !== skuInput.value) {
+                return;
+            }
+            skuList.replaceChildren(...results.filter(item => item.sku).map(item => {
+                const option = document.createElement('option');
+                option.value = item.sku;
+                option.label = item.label;
+                return option;
+            }));
+        }, 200);
+    });
+
     form.addEventListener('submit', async function(e) {
         e.preventDefault();
         
@@ -0,0 +1,44 @@
+// Typeahead client for /api/suggest/.
+// The first response tells us the catalog version; sending it back as `v`
+// makes later responses cacheable by the browser for as long as the catalog
+// does not change. Results are also memoised per query for this page view.
+window.StarblissSuggest = (function () {
+    let version = null;
+    const results = new Map();
+
+    async function suggest(query, limit) {
+        const q = (query || '').trim();
+        if (!q) {
+            return [];
+        }
+        const key = q.toLowerCase() + '|' + (limit || '');
+        if (results.has(key)) {
+            return results.get(key);
+        }
+        const params = new URLSearchParams({ q: q });
+        if (limit) {
+            params.set('limit', limit);
+        }
+        if (version !== null) {
+            params.set('v', version);
+        }
+        try {
+            const response = await fetch('/api/suggest/?' + params.toString());
+            if (!response.ok) {
+                return [];
+            }
+            const data = await response.json();
+            if (version !== null && String(data.v) !== String(version)) {
+                // The catalog changed under us; drop answers from the old one.
+                results.clear();
+            }
+            version = data.v;
+            results.set(key, data.results);
+            return data.results;
+        } catch (e) {
+            return [];
+        }
+    }
+
+    return { suggest: suggest };
+})();